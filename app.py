@@ -11,12 +11,16 @@ import os
 import sys
 import importlib
 import json
-from flask import Flask, render_template, request, flash, redirect, url_for, jsonify
+from flask import Flask, render_template, request, flash, redirect, url_for, jsonify, abort
 from lp_solver import solve_lp_problem
+from graphic_cache import GraphicCache, PlotRenderPool, MIMETYPES
+from model_cache import ParsedModelCache
+from solver_budget import BUDGET_STATUSES, DEFAULT_MAX_ITERATIONS, SolverBudget
 import simplex_tableau
 import dual_simplex_tableau
 import two_phase_simplex
 import transportation_model
+import lp_reader
 
 # Recargar módulos en cada petición (útil en desarrollo)
 if 'WERKZEUG_RUN_MAIN' in os.environ or not os.environ.get('FLASK_ENV'):
@@ -29,6 +33,40 @@ if 'WERKZEUG_RUN_MAIN' in os.environ or not os.environ.get('FLASK_ENV'):
 app = Flask(__name__)
 app.secret_key = os.environ.get('SECRET_KEY', 'utp-investigacion-operaciones-jose-herrera-2025')
 
+# Caché de gráficas del método gráfico (en memoria, con volcado opcional a disco)
+graphic_cache = GraphicCache(
+    max_entries=int(os.environ.get('GRAPHIC_CACHE_SIZE', 256)),
+    spill_dir=os.environ.get('GRAPHIC_CACHE_DIR') or None
+)
+
+# Procesos que renderizan las gráficas en segundo plano (0 = renderizar en la petición)
+_plot_workers = int(os.environ.get('PLOT_WORKERS', 2))
+render_pool = PlotRenderPool(graphic_cache, max_workers=_plot_workers) if _plot_workers > 0 else None
+
+# Modelos ya parseados (los problemas repetidos no se vuelven a parsear)
+model_cache = ParsedModelCache(max_entries=int(os.environ.get('MODEL_CACHE_SIZE', 512)))
+
+# Presupuesto de cada petición de los métodos simplex (ver solver_budget)
+SOLVE_TIME_LIMIT = float(os.environ.get('SOLVE_TIME_LIMIT', 15))
+SOLVE_MAX_ITERATIONS = int(os.environ.get('SOLVE_MAX_ITERATIONS', DEFAULT_MAX_ITERATIONS))
+SOLVE_MAX_HISTORY_MB = float(os.environ.get('SOLVE_MAX_HISTORY_MB', 256))
+
+
+def request_budget() -> SolverBudget:
+    """Presupuesto de la petición actual; el tiempo empieza a contar al crearlo."""
+    return SolverBudget(max_iterations=SOLVE_MAX_ITERATIONS, time_limit=SOLVE_TIME_LIMIT,
+                        max_history_bytes=int(SOLVE_MAX_HISTORY_MB * 2**20))
+
+def budget_stopped(result) -> bool:
+    """Indica si el solver se detuvo por presupuesto (el resultado trae la base en la que quedó)."""
+    return result.get('status') in BUDGET_STATUSES
+
+def result_value(result):
+    """Valor objetivo a mostrar: el óptimo, o el de la base actual si se agotó el presupuesto."""
+    if budget_stopped(result):
+        return result.get('objective_value')
+    return result.get('optimal_value', 0)
+
 # Filtro personalizado para formatear números de manera inteligente
 @app.template_filter('smart_number')
 def smart_number_filter(value):
@@ -39,6 +77,9 @@ def smart_number_filter(value):
     """
     try:
         num = float(value)
+        # Infinito (por ejemplo, un rango de optimalidad sin cota)
+        if num in (float('inf'), float('-inf')):
+            return '∞' if num > 0 else '-∞'
         # Si es muy cercano a cero, mostrar como 0
         if abs(num) < 1e-10:
             return "0"
@@ -98,7 +139,9 @@ def solve():
     
     # Resolver el problema
     try:
-        result = solve_lp_problem(objective, constraints_list)
+        result = solve_lp_problem(objective, constraints_list, graphic_cache=graphic_cache,
+                                  render_pool=render_pool, model_cache=model_cache,
+                                  integer=request.form.get('integer') == 'on')
         
         if not result['success']:
             flash(result['error'], 'error')
@@ -114,7 +157,15 @@ def solve():
             'results': result['results'],
             'best_point': result['best_point'],
             'best_value': result['best_value'],
-            'graphic': result['graphic']
+            'graphic': result['graphic'],
+            'graphic_key': result['graphic_key'],
+            'graphic_status': result['graphic_status'],
+            'graphic_format': result['graphic_format'],
+            'region_status': result['region_status'],
+            'active_constraints': result['active_constraints'],
+            'ranging': result['ranging'],
+            'integer_solution': result['integer_solution'],
+            'region': result['region']
         }
         
         return render_template('results.html', **context)
@@ -123,6 +174,64 @@ def solve():
         flash(f'Error inesperado: {str(e)}', 'error')
         return redirect(url_for('index'))
 
+@app.route('/graphic/<key>')
+def graphic_image(key):
+    """
+    Sirve una gráfica del método gráfico desde la caché.
+    
+    La URL depende solo del contenido del problema, así que la respuesta
+    puede guardarse indefinidamente en el navegador.
+    """
+    entry = graphic_cache.get(key)
+    if entry is None:
+        abort(404)
+    
+    data, image_format = entry
+    response = app.response_class(data, mimetype=MIMETYPES[image_format])
+    if render_pool is not None and render_pool.is_draft(key):
+        # Borrador generado bajo carga: se reemplazará por la versión completa
+        response.cache_control.no_cache = True
+        return response
+    response.set_etag(key)
+    response.cache_control.public = True
+    response.cache_control.max_age = 31536000
+    response.cache_control.immutable = True
+    return response.make_conditional(request)
+
+@app.route('/graphic/<key>/status')
+def graphic_status(key):
+    """
+    Estado de una gráfica renderizada en segundo plano.
+    
+    Devuelve 'ready', 'pending', 'skipped', 'failed', 'expired' o 'unknown'.
+    """
+    if render_pool is not None:
+        status = render_pool.status(key)
+    else:
+        status = 'ready' if graphic_cache.get(key) is not None else 'unknown'
+    return jsonify({'status': status})
+
+@app.route('/graphic/<key>/render', methods=['POST'])
+def graphic_render(key):
+    """
+    Vuelve a encolar una gráfica desalojada de la caché ('expired').
+    
+    Usa los argumentos guardados en el servidor para esa clave; devuelve el
+    nuevo estado ('unknown' si ya no se conservan).
+    """
+    if render_pool is None:
+        status = 'ready' if graphic_cache.get(key) is not None else 'unknown'
+    else:
+        status = render_pool.resubmit(key)
+    return jsonify({'status': status})
+
+@app.route('/model-cache/stats')
+def model_cache_stats():
+    """
+    Contadores de la caché de modelos parseados (aciertos, fallos, tamaño).
+    """
+    return jsonify(model_cache.stats())
+
 @app.route('/simplex')
 def simplex():
     """
@@ -136,31 +245,51 @@ def solve_simplex_route():
     Procesa el formulario y resuelve el problema usando método Simplex con tableau.
     """
     try:
+        budget = request_budget()
         objective = request.form.get('objective', '').strip()
         constraints_text = request.form.get('constraints', '').strip()
+        model_file = request.files.get('model_file')
+        engine = request.form.get('engine', 'tableau')
+        pricing = request.form.get('pricing', 'dantzig')
         
-        if not objective or not constraints_text:
-            flash('Por favor completa todos los campos.', 'error')
-            return redirect(url_for('simplex'))
-        
-        constraints_list = [line.strip() for line in constraints_text.split('\n') 
-                           if line.strip()]
-        
-        # Usar el solver con tableau para mostrar iteraciones paso a paso
-        result = simplex_tableau.solve_simplex_tableau(objective, constraints_list)
+        if model_file and model_file.filename:
+            # Modelo en archivo LP/MPS: se lee en flujo, sin cargarlo completo
+            model = lp_reader.read_model(model_file.stream, lp_reader.detect_format(model_file.filename))
+            rows, cols = model['shape']
+            objective = f"Modelo {model['name'] or model_file.filename}"
+            constraints_list = [f"{rows} restricciones, {cols} variables, "
+                                f"{len(model['values'])} coeficientes distintos de cero"]
+            result = lp_reader.solve_model(model, engine=engine, pricing=pricing, trace='summary',
+                                           budget=budget)
+        else:
+            if not objective or not constraints_text:
+                flash('Por favor completa todos los campos.', 'error')
+                return redirect(url_for('simplex'))
+            
+            constraints_list = [line.strip() for line in constraints_text.split('\n') 
+                               if line.strip()]
+            
+            # Usar el solver con tableau para mostrar iteraciones paso a paso
+            result = simplex_tableau.solve_simplex_tableau(objective, constraints_list, model_cache,
+                                                           engine=engine, pricing=pricing,
+                                                           budget=budget)
         
-        if not result['success']:
+        if not result['success'] and not budget_stopped(result):
             flash(result['error'], 'error')
             return redirect(url_for('simplex'))
         
+        if result.get('warning'):
+            flash(result['warning'], 'info')
+        
         return render_template('simplex_results.html', 
                              objective=objective,
                              constraints=constraints_list,
                              result=result,
                              solution=result.get('solution', {}),
-                             optimal_value=result.get('optimal_value', 0),
+                             optimal_value=result_value(result),
                              opt_type=result.get('opt_type', 'max'),
                              status=result.get('status', 'unknown'),
+                             budget_stop=budget_stopped(result),
                              iterations=result.get('iterations', []))
         
     except Exception as e:
@@ -180,6 +309,7 @@ def solve_dual_simplex_route():
     Procesa el formulario y resuelve el problema usando método Dual Simplex con tableau.
     """
     try:
+        budget = request_budget()
         objective = request.form.get('objective', '').strip()
         constraints_text = request.form.get('constraints', '').strip()
         
@@ -191,20 +321,25 @@ def solve_dual_simplex_route():
                            if line.strip()]
         
         # Usar el solver con tableau para mostrar iteraciones paso a paso
-        result = dual_simplex_tableau.solve_dual_simplex_tableau(objective, constraints_list)
+        result = dual_simplex_tableau.solve_dual_simplex_tableau(objective, constraints_list, model_cache,
+                                                                 budget=budget)
         
-        if not result['success']:
+        if not result['success'] and not budget_stopped(result):
             flash(result['error'], 'error')
             return redirect(url_for('dual_simplex'))
         
+        if result.get('dual_fallback'):
+            flash(result['dual_fallback'], 'info')
+        
         return render_template('dual_simplex_results.html', 
                              objective=objective,
                              constraints=constraints_list,
                              result=result,
                              solution=result.get('solution', {}),
-                             optimal_value=result.get('optimal_value', 0),
+                             optimal_value=result_value(result),
                              opt_type=result.get('opt_type', 'min'),
                              status=result.get('status', 'unknown'),
+                             budget_stop=budget_stopped(result),
                              iterations=result.get('iterations', []))
         
     except Exception as e:
@@ -224,6 +359,7 @@ def solve_two_phase_simplex_route():
     Procesa el formulario y resuelve el problema usando método Simplex Dos Fases.
     """
     try:
+        budget = request_budget()
         objective = request.form.get('objective', '').strip()
         constraints_text = request.form.get('constraints', '').strip()
         
@@ -235,9 +371,10 @@ def solve_two_phase_simplex_route():
                            if line.strip()]
         
         # Usar el solver Dos Fases
-        result = two_phase_simplex.solve_two_phase_simplex(objective, constraints_list)
+        result = two_phase_simplex.solve_two_phase_simplex(objective, constraints_list, model_cache,
+                                                           budget=budget)
         
-        if not result['success']:
+        if not result['success'] and not budget_stopped(result):
             flash(result.get('error', 'Error desconocido'), 'error')
             return redirect(url_for('two_phase_simplex_route'))
         
@@ -246,9 +383,10 @@ def solve_two_phase_simplex_route():
                              constraints=constraints_list,
                              result=result,
                              solution=result.get('solution', {}),
-                             optimal_value=result.get('optimal_value', 0),
+                             optimal_value=result_value(result),
                              opt_type=result.get('opt_type', 'max'),
                              status=result.get('status', 'unknown'),
+                             budget_stop=budget_stopped(result),
                              iterations_phase1=result.get('iterations_phase1', []),
                              iterations_phase2=result.get('iterations_phase2', []),
                              total_iterations=result.get('total_iterations', 0))
@@ -0,0 +1,511 @@
+# archivo: benchmarks.py
+"""
+Pruebas de rendimiento de los solucionadores.
+
+Uso:
+    python benchmarks.py vertices plot_threads batch parser revised pricing
+"""
+
+import argparse
+import math
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+import lp_batch
+import lp_parser
+import lp_solver
+import simplex_tableau
+from dual_simplex_tableau import DUAL_PRICING_RULES, DualSimplexTableau
+from pricing import PRICING_RULES
+from revised_simplex import RevisedSimplex
+from simplex_kernels import clear_small_values, pivot_in_place
+from solver_trace import TRACE_LEVELS
+from sparse_matrix import CSRMatrix
+
+
+def _circle_constraints(n):
+    """
+    Genera n restricciones tangentes a una circunferencia de centro (50, 50)
+    y radio 40. Todas son activas, así que la región tiene n vértices.
+    """
+    constraints = []
+    for i in range(n):
+        theta = 2 * math.pi * i / n
+        a, b = math.cos(theta), math.sin(theta)
+        constraints.append({'a': a, 'b': b, 'op': '<=', 'rhs': 50 * a + 50 * b + 40})
+    return constraints
+
+
+def _time_call(func, *args, **kwargs):
+    """Ejecuta func una vez y devuelve (resultado, segundos)."""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def benchmark_vertices(sizes=(10, 100, 1000, 10000), time_limit=60.0):
+    """
+    Compara los motores de cálculo de vértices de compute_vertices.
+
+    Los motores por parejas son O(n³); si el tiempo estimado para un tamaño
+    (extrapolado del anterior) supera time_limit segundos, se omite.
+    """
+    methods = ('halfplane', 'vectorized', 'pairwise')
+    print(f"{'restricciones':>14}" + ''.join(f"{m + ' (s)':>20}" for m in methods) + f"{'vértices':>10}")
+    last = {}  # método -> (n, segundos) de la última medición
+    for n in sizes:
+        constraints = _circle_constraints(n)
+        row = f"{n:>14}"
+        n_vertices = 0
+        for method in methods:
+            estimate = last[method][1] * (n / last[method][0]) ** 3 \
+                if method != 'halfplane' and method in last else 0.0
+            if estimate > time_limit:
+                row += f"{f'~{estimate:.0f} (omitido)':>20}"
+                continue
+            vertices, elapsed = _time_call(lp_solver.compute_vertices, constraints, method=method)
+            last[method] = (n, elapsed)
+            n_vertices = max(n_vertices, len(vertices))
+            row += f"{elapsed:>20.4f}"
+        print(row + f"{n_vertices:>10}")
+
+
+def _random_problem(rng, n_constraints=4):
+    """Genera un problema aleatorio de 2 variables con región factible acotada."""
+    constraints = []
+    for _ in range(n_constraints):
+        a, b = rng.randint(1, 6), rng.randint(1, 6)
+        constraints.append({'a': float(a), 'b': float(b), 'op': '<=',
+                            'rhs': float(rng.randint(10, 40))})
+    obj_coeffs = [float(rng.randint(1, 9)), float(rng.randint(1, 9))]
+    return constraints, obj_coeffs, rng.choice(['max', 'min'])
+
+
+def _render(problem, image_format):
+    constraints, obj_coeffs, opt_type = problem
+    vertices = lp_solver.compute_vertices(constraints)
+    return lp_solver.create_plot(constraints, vertices, obj_coeffs, opt_type,
+                                 image_format=image_format)[3]
+
+
+def benchmark_plot_threads(n_problems=48, workers=8):
+    """
+    Grafica muchos problemas distintos a la vez desde un pool de hilos y
+    verifica que cada imagen sea idéntica a la obtenida de forma secuencial.
+    """
+    rng = random.Random(2025)
+    problems = [_random_problem(rng) for _ in range(n_problems)]
+
+    for image_format in ('svg', 'png'):
+        start = time.perf_counter()
+        expected = [_render(p, image_format) for p in problems]
+        t_seq = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            outputs = list(pool.map(lambda p: _render(p, image_format), problems))
+        t_par = time.perf_counter() - start
+
+        mismatches = sum(1 for a, b in zip(expected, outputs) if a != b)
+        print(f"{image_format}: {n_problems} gráficas, secuencial {t_seq:.2f} s, "
+              f"{workers} hilos {t_par:.2f} s, diferencias: {mismatches}")
+        if mismatches:
+            raise AssertionError(f"{mismatches} gráficas distintas al graficar en paralelo ({image_format})")
+
+
+def _problem_text(problem):
+    """Convierte un problema de _random_problem al texto que escribe un usuario."""
+    constraints, obj_coeffs, opt_type = problem
+    objective = f"{opt_type} z = {obj_coeffs[0]:g}x + {obj_coeffs[1]:g}y"
+    return objective, [f"{c['a']:g}x + {c['b']:g}y {c['op']} {c['rhs']:g}" for c in constraints]
+
+
+def benchmark_batch(n_problems=20000, n_plotted=20, workers=None):
+    """
+    Mide el rendimiento (problemas/s) de solve_lp_batch frente a resolver los
+    problemas uno por uno, y verifica que los óptimos coincidan.
+    """
+    workers = workers or os.cpu_count() or 1
+    rng = random.Random(7)
+    problems = [_problem_text(_random_problem(rng, rng.randint(2, 6))) for _ in range(n_problems)]
+
+    def rate(count, seconds):
+        return f"{count / seconds:>12,.0f} problemas/s"
+
+    _, t_plot = _time_call(lambda: [lp_solver.solve_lp_problem(o, c) for o, c in problems[:n_plotted]])
+    print(f"{'solve_lp_problem (con gráfica)':<34}{rate(n_plotted, t_plot)}")
+
+    def one_by_one():
+        output = []
+        for objective, constraints_list in problems:
+            opt_type, obj_coeffs, constraints = lp_batch._parse_problem(objective, constraints_list)
+            vertices, _ = lp_solver.compute_feasible_polygon(constraints)
+            output.append(lp_solver.evaluate_vertices(vertices, obj_coeffs, opt_type)[2])
+        return output
+
+    expected, t_loop = _time_call(one_by_one)
+    print(f"{'uno por uno (sin gráfica)':<34}{rate(n_problems, t_loop)}")
+
+    for label, kwargs in (('solve_lp_batch', {}),
+                          (f'solve_lp_batch, {workers} procesos', {'workers': workers})):
+        results, elapsed = _time_call(lp_batch.solve_lp_batch, problems, **kwargs)
+        mismatches = sum(1 for value, r in zip(expected, results)
+                         if r.get('best_value') is None or abs(r['best_value'] - value) > 1e-6)
+        print(f"{label:<34}{rate(n_problems, elapsed)}   diferencias: {mismatches}")
+        if mismatches:
+            raise AssertionError(f"{mismatches} óptimos distintos en {label}")
+
+
+def _sparse_constraint(rng, n_vars, max_terms):
+    """Genera una restricción dispersa sobre x1..xn como texto y como mapa de términos."""
+    indices = sorted(rng.sample(range(1, n_vars + 1), rng.randint(1, max_terms)))
+    terms = {f'x{i}': float(rng.randint(-99, 99) or 1) for i in indices}
+    parts = []
+    for name, coef in terms.items():
+        sign = '-' if coef < 0 else '+'
+        parts.append(f"{sign} {abs(coef):g}{name}")
+    op = rng.choice(('<=', '>=', '='))
+    rhs = float(rng.randint(0, 1000))
+    return ' '.join(parts).lstrip('+ ') + f" {op} {rhs:g}", terms, op, rhs
+
+
+def benchmark_parser(n_constraints=50000, n_vars=200, max_terms=12):
+    """
+    Mide el costo del parser compartido (ns por término) en un modelo disperso
+    de n_constraints restricciones sobre x1..x{n_vars}, y verifica el resultado.
+    """
+    rng = random.Random(13)
+    model = [_sparse_constraint(rng, n_vars, max_terms) for _ in range(n_constraints)]
+    lines = [text for text, _, _, _ in model]
+    n_terms = sum(len(terms) for _, terms, _, _ in model)
+
+    parsed, elapsed = _time_call(lambda: [lp_parser.parse_constraint(line) for line in lines])
+    mismatches = sum(1 for got, (_, terms, op, rhs) in zip(parsed, model) if got != (terms, op, rhs))
+    print(f"{'lp_parser.parse_constraint':<40}{elapsed * 1e9 / n_terms:>8.0f} ns/término"
+          f"   ({n_constraints:,} restricciones, {n_terms:,} términos)   diferencias: {mismatches}")
+    if mismatches:
+        raise AssertionError(f"{mismatches} restricciones mal parseadas")
+
+    # Números con exponente: el coeficiente y el lado derecho deben valer lo mismo que con float()
+    numbers = ['1e3', '1E3', '2.5e-1', '1e+01', '.5e2', '3.e-2', '7E+0', '12', '0.125']
+    exponent_mismatches = [
+        (coef, rhs) for coef in numbers for rhs in numbers
+        if lp_parser.parse_constraint(f"{coef}x1 + {coef} * x2 <= {rhs}")
+        != ({'x1': float(coef), 'x2': float(coef)}, '<=', float(rhs))
+    ]
+    print(f"{'exponentes (contra float)':<40}{len(numbers) ** 2:>8} casos   diferencias: {len(exponent_mismatches)}")
+    if exponent_mismatches:
+        raise AssertionError(f"Números con exponente mal parseados: {exponent_mismatches[:5]}")
+
+    # Costo adicional de la fila densa que necesita el tableau
+    _, elapsed = _time_call(lambda: [simplex_tableau.parse_constraint(line, n_vars) for line in lines])
+    print(f"{'simplex_tableau.parse_constraint':<40}{elapsed * 1e9 / n_terms:>8.0f} ns/término")
+
+
+def _sparse_model(n, nnz_per_row, seed=0):
+    """
+    Genera un modelo max c·x, A x <= b de n×n con nnz_per_row coeficientes
+    positivos por fila (acotado: b = A·1 + 1 y c > 0).
+    """
+    rng = np.random.default_rng(seed)
+    rows = np.repeat(np.arange(n), nnz_per_row)
+    cols = rng.integers(0, n, n * nnz_per_row)
+    A = CSRMatrix.from_coo(rows, cols, rng.integers(1, 10, len(rows)).astype(float), (n, n))
+    b = A.matvec(np.ones(n)) + 1.0
+    c = rng.integers(1, 10, n).astype(float)
+    return c.tolist(), A, b.tolist(), ['<='] * n
+
+
+def benchmark_revised(sizes=(200, 1000, 5000, 20000), n_pivots=50, nnz_per_row=8,
+                      tableau_limit=32 << 20):
+    """
+    Compara el costo por pivoteo de SimplexTableau y RevisedSimplex en modelos
+    dispersos n×n, con la misma secuencia de pivoteos (regla de Bland).
+
+    El tableau se omite si ocuparía más de tableau_limit bytes.
+    """
+    print(f"{'n':>7}{'tableau (ms/piv)':>18}{'tableau (MB)':>14}{'revisado (ms/piv)':>19}"
+          f"{'diferencia Z':>14}")
+
+    def run(solver_class, c, A, b, types):
+        return solver_class(c, A, b, types, 'max', pricing='bland').solve(n_pivots)
+
+    for n in sizes:
+        c, A, b, types = _sparse_model(n, nnz_per_row)
+        revised, t_rev = _time_call(run, RevisedSimplex, c, A, b, types)
+        pivots = len(revised['iterations']) - 1
+        row = f"{n:>7}"
+
+        tableau_bytes = (n + 1) * (2 * n + 1) * 8
+        if tableau_bytes > tableau_limit:
+            row += f"{'(omitido)':>18}{tableau_bytes / 2**20:>14,.0f}"
+            difference = None
+        else:
+            tableau, t_tab = _time_call(run, simplex_tableau.SimplexTableau, c, A, b, types)
+            row += f"{t_tab * 1e3 / pivots:>18.2f}{tableau_bytes / 2**20:>14,.0f}"
+            difference = max(abs(x['z_value'] - y['z_value'])
+                             for x, y in zip(tableau['iterations'], revised['iterations']))
+
+        row += f"{t_rev * 1e3 / pivots:>19.2f}"
+        print(row + (f"{difference:>14.2e}" if difference is not None else f"{'-':>14}"))
+        if difference is not None and difference > 1e-6:
+            raise AssertionError(f"Los motores no siguen la misma secuencia de pivoteos (n={n})")
+
+
+def _mixed_model(rng, n, nnz_per_row=6, tight=0.5):
+    """
+    Genera un modelo factible y acotado de n×n con restricciones <=, >= e =.
+
+    Las restricciones se arman alrededor de un punto entero x0; una fracción
+    'tight' de ellas pasa exactamente por x0 (vértices degenerados). Una
+    última fila acota la suma de las variables.
+    """
+    x0 = rng.integers(0, 4, n).astype(float)
+    rows = np.repeat(np.arange(n), nnz_per_row)
+    cols = rng.integers(0, n, len(rows))
+    values = rng.integers(1, 10, len(rows)).astype(float)
+    rows = np.append(rows, np.full(n, n))
+    cols = np.append(cols, np.arange(n))
+    values = np.append(values, np.ones(n))
+    A = CSRMatrix.from_coo(rows, cols, values, (n + 1, n))
+
+    types = rng.choice(['<=', '<=', '>=', '='], n + 1)
+    types[-1] = '<='
+    slack = np.where(rng.random(n + 1) < tight, 0.0, rng.integers(1, 20, n + 1))
+    b = A.matvec(x0) + np.where(types == '<=', slack, np.where(types == '>=', -slack, 0.0))
+    b[-1] = x0.sum() + 10 * n
+    b = np.maximum(b, 0.0) * (types != '>=') + b * (types == '>=')
+    types = np.where((types == '>=') & (b < 0), '<=', types)  # b < 0 con >= no acota nada
+    b = np.abs(b)
+    c = rng.integers(-3, 10, n).astype(float)
+    return c.tolist(), A, b.tolist(), types.tolist(), rng.choice(['max', 'min'])
+
+
+def benchmark_pricing(tableau_sizes=(20, 40, 80), revised_sizes=(200,), per_size=8,
+                      max_iterations=100000):
+    """
+    Compara las reglas de pricing (iteraciones y tiempo) en un conjunto de
+    modelos generados, y verifica que todas lleguen al mismo óptimo.
+
+    Los modelos chicos se resuelven con SimplexTableau y los grandes con
+    RevisedSimplex. 'Bland' cuenta los pivoteos elegidos por la regla de
+    respaldo ante degeneración.
+    """
+    rng = np.random.default_rng(17)
+    print(f"{'motor':>8}{'n':>6}{'regla':>15}{'iteraciones':>13}{'tiempo (s)':>12}"
+          f"{'Bland':>8}{'diferencias':>13}")
+    for engine, solver_class, sizes in (('tableau', simplex_tableau.SimplexTableau, tableau_sizes),
+                                        ('revised', RevisedSimplex, revised_sizes)):
+        for n in sizes:
+            models = [_mixed_model(rng, n) for _ in range(per_size)]
+            reference = None
+            for rule in PRICING_RULES:
+                iterations = fallback = 0
+                values = []
+                start = time.perf_counter()
+                for c, A, b, types, opt_type in models:
+                    solver = solver_class(c, A, b, types, opt_type, pricing=rule)
+                    result = solver.solve(max_iterations)
+                    iterations += len(result.get('iterations', []))
+                    fallback += solver.pricing.bland_pivots
+                    values.append((result['status'], result.get('optimal_value')))
+                elapsed = time.perf_counter() - start
+                reference = reference or values
+                mismatches = sum(1 for (s1, v1), (s2, v2) in zip(values, reference)
+                                 if s1 != s2 or (v1 is not None and abs(v1 - v2) > 1e-3 * max(1.0, abs(v2))))
+                print(f"{engine:>8}{n:>6}{rule:>15}{iterations:>13,}{elapsed:>12.2f}"
+                      f"{fallback:>8,}{mismatches:>13}")
+                if mismatches:
+                    raise AssertionError(f"La regla {rule} llega a otro óptimo (n={n}, {engine})")
+
+
+def _row_loop_pivot(tableau, pivot_row, pivot_col):
+    """Pivoteo fila por fila, como lo hacían los solucionadores antes de pivot_in_place."""
+    tableau[pivot_row] = tableau[pivot_row] / tableau[pivot_row, pivot_col]
+    for i in range(len(tableau)):
+        if i != pivot_row:
+            tableau[i] = tableau[i] - tableau[i, pivot_col] * tableau[pivot_row]
+    return np.vectorize(lambda value: 0.0 if abs(value) < 1e-10 else value)(tableau)
+
+
+def benchmark_pivots(sizes=(100, 250, 500, 1000, 2000), min_time=1.0, max_pivots=200):
+    """
+    Pivoteos por segundo sobre tableaux densos de n×n: el recorrido fila por
+    fila con limpieza np.vectorize contra pivot_in_place + clear_small_values
+    con un buffer reutilizado. Ambos recorren los mismos pivotes y deben
+    terminar con el mismo tableau.
+    """
+    rng = np.random.default_rng(5)
+    print(f"{'n':>6}{'pivoteos':>10}{'filas (piv/s)':>16}{'kernel (piv/s)':>16}{'aceleración':>13}")
+    for n in sizes:
+        initial = rng.uniform(-1.0, 1.0, (n, n))
+
+        def next_pivot(tableau, count):
+            # Pivote de mayor magnitud en la fila, para que los valores no crezcan
+            pivot_row = count % n
+            return pivot_row, int(np.argmax(np.abs(tableau[pivot_row])))
+
+        def run(step, n_pivots=None):
+            # Sin n_pivots, pivotea hasta min_time (al menos 3 pivoteos)
+            tableau = initial.copy()
+            work = np.empty_like(tableau)
+            count = 0
+            start = time.perf_counter()
+            while count < (n_pivots or max_pivots) and (
+                    n_pivots or count < 3 or time.perf_counter() - start < min_time):
+                tableau = step(tableau, work, *next_pivot(tableau, count))
+                count += 1
+            return tableau, count, count / (time.perf_counter() - start)
+
+        def kernel_step(tableau, work, pivot_row, pivot_col):
+            pivot_in_place(tableau, pivot_row, pivot_col, work)
+            clear_small_values(tableau, 1e-10, work)
+            return tableau
+
+        loop_tableau, count, loop_rate = run(lambda t, w, r, q: _row_loop_pivot(t, r, q))
+        kernel_tableau, _, kernel_rate = run(kernel_step, count)
+        if not np.array_equal(loop_tableau, kernel_tableau):
+            raise AssertionError(f"El kernel de pivoteo no coincide con el recorrido por filas (n={n})")
+        print(f"{n:>6}{count:>10}{loop_rate:>16,.1f}{kernel_rate:>16,.1f}{kernel_rate / loop_rate:>12.1f}x")
+
+
+def benchmark_trace(sizes=(40, 80, 120), per_size=4):
+    """
+    Tiempo de SimplexTableau con cada nivel de traza y tamaño del historial
+    de iteraciones: el historial por repetición de pivoteos contra lo que
+    ocuparía una copia del tableau por iteración. Todos los niveles deben
+    llegar al mismo resultado.
+    """
+    rng = np.random.default_rng(21)
+    print(f"{'n':>6}{'traza':>10}{'iteraciones':>13}{'tiempo (s)':>12}{'historial (MB)':>16}"
+          f"{'copias (MB)':>13}")
+    for n in sizes:
+        models = [_mixed_model(rng, n) for _ in range(per_size)]
+        reference = None
+        for level in reversed(TRACE_LEVELS):
+            pivots = history = copies = 0
+            values = []
+            start = time.perf_counter()
+            for c, A, b, types, opt_type in models:
+                solver = simplex_tableau.SimplexTableau(c, A, b, types, opt_type, trace=level)
+                result = solver.solve(100000)
+                pivots += solver.current_iteration
+                if solver.history is not None:
+                    history += solver.history.nbytes
+                    copies += len(result['iterations']) * solver.tableau.nbytes
+                values.append((result['status'], result.get('optimal_value')))
+            elapsed = time.perf_counter() - start
+            reference = reference or values
+            if values != reference:
+                raise AssertionError(f"La traza '{level}' cambia el resultado (n={n})")
+            print(f"{n:>6}{level:>10}{pivots:>13,}{elapsed:>12.2f}{history / 1e6:>16.1f}"
+                  f"{copies / 1e6:>13.1f}")
+
+
+def benchmark_warm_start(sizes=(40, 80, 120), per_size=4):
+    """
+    Re-solve después de cambiar un coeficiente de la función objetivo:
+    desde cero contra un arranque en caliente con la base óptima anterior
+    (SimplexTableau con initial_basis). Ambos deben llegar al mismo óptimo.
+    """
+    rng = np.random.default_rng(24)
+    print(f"{'n':>6}{'pivoteos (frío)':>17}{'pivoteos (caliente)':>21}{'frío (s)':>10}{'caliente (s)':>14}")
+    for n in sizes:
+        cold_pivots = warm_pivots = 0
+        cold_time = warm_time = 0.0
+        for _ in range(per_size):
+            c, A, b, types, opt_type = _mixed_model(rng, n)
+            first = simplex_tableau.SimplexTableau(c, A, b, types, opt_type, trace='none').solve()
+            if first['status'] != 'optimal':
+                continue
+            c = list(c)
+            c[int(rng.integers(n))] += 1.0
+
+            start = time.perf_counter()
+            cold = simplex_tableau.SimplexTableau(c, A, b, types, opt_type, trace='none')
+            cold_result = cold.solve()
+            cold_time += time.perf_counter() - start
+
+            start = time.perf_counter()
+            warm = simplex_tableau.SimplexTableau(c, A, b, types, opt_type, trace='none',
+                                                  initial_basis=first['basic_vars'])
+            warm_result = warm.solve()
+            warm_time += time.perf_counter() - start
+
+            if not warm_result.get('warm_start'):
+                raise AssertionError(f"La base anterior no se usó (n={n})")
+            if abs(warm_result['optimal_value'] - cold_result['optimal_value']) > 1e-3:
+                raise AssertionError(f"El arranque en caliente cambia el óptimo (n={n})")
+            cold_pivots += cold.pivot_count
+            warm_pivots += warm.pivot_count
+        print(f"{n:>6}{cold_pivots:>17,}{warm_pivots:>21,}{cold_time:>10.2f}{warm_time:>14.2f}")
+
+
+def benchmark_dual(sizes=(40, 80, 160), per_size=4):
+    """
+    Minimización con costos no negativos: simplex dual (dual steepest edge y
+    Dantzig) desde la base de holguras contra Dos Fases con SimplexTableau.
+    Todos deben llegar al mismo óptimo.
+    """
+    rng = np.random.default_rng(25)
+    print(f"{'n':>6}{'método':>22}{'pivoteos':>10}{'tiempo (s)':>12}")
+    for n in sizes:
+        models = []
+        for _ in range(per_size):
+            c, A, b, types, _ = _mixed_model(rng, n)
+            models.append((np.abs(c).tolist(), A, A.to_dense(), b, types))
+        reference = []
+        start = time.perf_counter()
+        pivots = 0
+        for c, A, _, b, types in models:
+            solver = simplex_tableau.SimplexTableau(c, A, b, types, 'min', trace='none')
+            result = solver.solve()
+            pivots += solver.pivot_count
+            reference.append(result.get('optimal_value'))
+        print(f"{n:>6}{'dos fases':>22}{pivots:>10,}{time.perf_counter() - start:>12.3f}")
+        for rule in DUAL_PRICING_RULES:
+            start = time.perf_counter()
+            pivots = 0
+            values = []
+            for c, _, dense, b, types in models:
+                solver = DualSimplexTableau('min', c, dense, b, types, pricing=rule, trace='none')
+                values.append(solver.solve().get('optimal_value'))
+                pivots += solver.iteration_count
+            elapsed = time.perf_counter() - start
+            if not np.allclose(np.array(values, dtype=float), np.array(reference, dtype=float),
+                               rtol=1e-6, atol=1e-3, equal_nan=True):
+                raise AssertionError(f"El simplex dual ({rule}) cambia el óptimo (n={n})")
+            print(f"{n:>6}{'dual ' + rule:>22}{pivots:>10,}{elapsed:>12.3f}")
+
+
+BENCHMARKS = {
+    'vertices': benchmark_vertices,
+    'plot_threads': benchmark_plot_threads,
+    'batch': benchmark_batch,
+    'parser': benchmark_parser,
+    'revised': benchmark_revised,
+    'pricing': benchmark_pricing,
+    'pivots': benchmark_pivots,
+    'trace': benchmark_trace,
+    'warm_start': benchmark_warm_start,
+    'dual': benchmark_dual,
+}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Pruebas de rendimiento de los solucionadores')
+    parser.add_argument('names', nargs='*',
+                        help=f"benchmarks a ejecutar: {', '.join(sorted(BENCHMARKS))} (por defecto, todos)")
+    args = parser.parse_args()
+
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"benchmark desconocido: {', '.join(unknown)}")
+
+    for name in args.names or sorted(BENCHMARKS):
+        print(f"\n=== {name} ===")
+        BENCHMARKS[name]()
@@ -1,276 +1,325 @@
 ﻿#!/usr/bin/env python
 # -*- coding: utf-8 -*-
+"""
+Método Dual Simplex con tableau.
+
+Todas las restricciones se llevan a la forma <= con una holgura (las >= se
+multiplican por -1 y las = se separan en dos desigualdades), así que la
+base inicial de holguras siempre existe y no hacen falta artificiales ni
+Fase I. Internamente se minimiza; la fila Z guarda zⱼ - cⱼ, y la base es
+dual factible cuando todos son <= 0 (por ejemplo, minimización con costos
+no negativos). Cada iteración saca la fila con RHS negativo elegida por la
+regla de pricing dual y hace entrar la columna del cociente mínimo.
+
+Reglas de pricing dual (fila saliente):
+    - 'steepest_edge': mayor bᵢ² / ||e_iᵀ B⁻¹||²; B⁻¹ son las columnas de
+      holgura del tableau, así que los pesos son exactos en cada iteración
+    - 'dantzig': el RHS más negativo
+
+Como en pricing.py, después de DEGENERATE_LIMIT pivoteos degenerados seguidos
+(cociente cero) se usa la regla de menor índice hasta el siguiente pivoteo
+que cambie el objetivo.
+
+solve_dual_simplex_tableau usa Dos Fases (simplex_tableau) solo cuando la
+base inicial no es dual factible.
+"""
+
 import numpy as np
-import re
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Any, Optional
+
+import simplex_tableau
+from iteration_history import IterationHistory
+from pricing import DEGENERATE_LIMIT
+from simplex_kernels import dual_leaving_row, dual_ratio_column, pivot_in_place
+from solver_budget import BUDGET_STATUSES, SolverBudget
+from solver_trace import check_trace_level
+
+DUAL_PRICING_RULES = ('steepest_edge', 'dantzig')
+
+
+def _clean_tableau(tableau: np.ndarray) -> List[List[float]]:
+    """Tableau con los valores muy pequeños en 0, como lista de listas (para mostrarlo)"""
+    return np.where(np.abs(tableau) < 1e-10, 0.0, tableau).tolist()
+
 
 class DualSimplexTableau:
-    def __init__(self, objective_type: str, c: np.ndarray, A: np.ndarray, b: np.ndarray, constraint_types: List[str]):
-        self.original_obj_type = objective_type
+    EPS = 1e-9  # Tolerancia para comparaciones numéricas
+
+    def __init__(self, objective_type: str, c: np.ndarray, A: np.ndarray, b: np.ndarray, constraint_types: List[str],
+                 budget: Optional[SolverBudget] = None, pricing: str = 'steepest_edge',
+                 trace: str = 'full'):
+        """
+        Args:
+            objective_type: 'max' o 'min'
+            c: Coeficientes de la función objetivo
+            A: Matriz de coeficientes de restricciones
+            b: Vector de términos independientes (de cualquier signo)
+            constraint_types: Lista de tipos ['<=', '>=', '=']
+            budget: límites de iteraciones, tiempo y memoria (ver solver_budget)
+            pricing: regla de la fila saliente: 'steepest_edge' o 'dantzig'
+            trace: historial de iteraciones: 'full', 'summary' o 'none'
+                   (ver solver_trace)
+        """
+        if pricing not in DUAL_PRICING_RULES:
+            raise ValueError(f"Regla de pricing dual no soportada: {pricing} "
+                             f"(usa {', '.join(DUAL_PRICING_RULES)})")
+        self.pricing = pricing
+        self.trace = check_trace_level(trace)
+        self.budget = budget or SolverBudget()
+        self.is_max = objective_type.lower() == 'max'
         self.c = np.array(c, dtype=float)
-        self.A = np.array(A, dtype=float)
-        self.b = np.array(b, dtype=float)
-        self.constraint_types = constraint_types
-        self.n_vars = len(c)
-        self.n_constraints = len(b)
+        self.n_vars = len(self.c)
+
+        # Internamente se minimiza
+        c_min = -self.c if self.is_max else self.c
+        self.tableau = self._build_initial_tableau(c_min, A, b, constraint_types)
+        self.n_constraints = self.tableau.shape[0] - 1
         self.n_slack = self.n_constraints
-        if objective_type.lower() == 'max':
-            self.c = -self.c
-            self.is_max = True
-        else:
-            self.is_max = False
-        self.tableau = self._build_initial_tableau()
+        self._pivot_work = np.empty_like(self.tableau)
         self.basic_vars = list(range(self.n_vars, self.n_vars + self.n_slack))
+        self.var_names = ([f'x{i + 1}' for i in range(self.n_vars)] +
+                          [f's{i + 1}' for i in range(self.n_slack)])
+
+        # Pivoteos degenerados seguidos (activan la regla de menor índice)
+        self.degenerate_steps = 0
+        self.lowest_index = False
+
+        self.history = IterationHistory(self.tableau, view=_clean_tableau) if self.trace == 'full' else None
         self.iterations = []
         self.iteration_count = 0
-    
-    def _build_initial_tableau(self) -> np.ndarray:
-        m = self.n_constraints
+
+    def _build_initial_tableau(self, c_min: np.ndarray, A, b, constraint_types: List[str]) -> np.ndarray:
+        """
+        Tableau [A' | I | b'] con A' x <= b' (las >= cambian de signo y cada =
+        da dos filas) y fila Z = [-c | 0 | 0].
+        """
+        A = np.array(A, dtype=float).reshape(len(b), self.n_vars)
+        b = np.array(b, dtype=float)
+        types = np.asarray(constraint_types)
+        sign = np.where(types == '>=', -1.0, 1.0)
+        rows = np.vstack([A * sign[:, None], -A[types == '=']])
+        rhs = np.concatenate([b * sign, -b[types == '=']])
+
+        m = len(rhs)
         n = self.n_vars
-        tableau = np.zeros((m + 1, n + m + 1), dtype=float)
-        for i in range(m):
-            tableau[i, :n] = self.A[i, :]
-            if self.constraint_types[i] == '>=':
-                tableau[i, n + i] = -1.0
-            else:
-                tableau[i, n + i] = 1.0
-            tableau[i, -1] = self.b[i]
-            if self.constraint_types[i] == '>=':
-                tableau[i, :] = -tableau[i, :]
-        tableau[-1, :n] = self.c
-        tableau[-1, n:-1] = 0.0
-        tableau[-1, -1] = 0.0
+        tableau = np.zeros((m + 1, n + m + 1))
+        tableau[:m, :n] = rows
+        tableau[:m, n:n + m] = np.eye(m)
+        tableau[:m, -1] = rhs
+        tableau[-1, :n] = -c_min
         return tableau
-    
-    def _clean_small_values(self, value: float, tolerance: float = 1e-10) -> float:
-        """Redondea valores muy pequeños a 0 para evitar notación científica"""
-        if abs(value) < tolerance:
-            return 0.0
-        return value
-    
-    def _save_iteration(self, description: str, entering_var: int = None, leaving_var: int = None):
-        m = self.n_constraints
+
+    def is_dual_feasible(self) -> bool:
+        """La base actual es dual factible (zⱼ - cⱼ <= 0 en toda la fila Z)"""
+        return bool(np.all(self.tableau[-1, :-1] <= self.EPS))
+
+    def _objective_value(self) -> float:
+        """Valor de la función objetivo original en la base actual"""
         z_value = float(self.tableau[-1, -1])
-        if self.is_max:
-            z_value = -z_value
-        is_feasible = True
-        for i in range(m):
-            rhs_val = float(self.tableau[i, -1])
-            if rhs_val < -1e-10:
-                is_feasible = False
-                break
-        is_optimal = True
-        z_row = self.tableau[-1, :-1]
-        for j in range(len(z_row)):
-            coeff_val = float(z_row[j])
-            if coeff_val < -1e-10:
-                is_optimal = False
-                break
-        solution = {}
-        for i in range(self.n_vars):
-            solution[f'x{i+1}'] = 0.0
-        for i, bv in enumerate(self.basic_vars):
-            if bv < self.n_vars:
-                val = self._clean_small_values(float(self.tableau[i, -1]))
-                solution[f'x{bv+1}'] = val
-        tableau_copy = []
-        for i in range(m + 1):
-            row = []
-            for j in range(self.tableau.shape[1]):
-                val = self._clean_small_values(float(self.tableau[i, j]))
-                row.append(val)
-            tableau_copy.append(row)
-        var_names = []
-        for i in range(self.n_vars):
-            var_names.append(f'x{i+1}')
-        for i in range(self.n_slack):
-            var_names.append(f's{i+1}')
-        var_names.append('RHS')
-        basic_var_names = []
-        for bv in self.basic_vars:
-            if bv < self.n_vars:
-                basic_var_names.append(f'x{bv+1}')
-            else:
-                basic_var_names.append(f's{bv-self.n_vars+1}')
+        return -z_value if self.is_max else z_value
+
+    def _save_iteration(self, description: str, pivot_row: Optional[int] = None,
+                        pivot_col: Optional[int] = None, leaving_var: Optional[int] = None,
+                        operations: str = ''):
+        """Guarda el estado actual del tableau (según el nivel de traza)"""
+        if self.trace == 'none':
+            return
+        m = self.n_constraints
+        is_feasible = bool(np.all(self.tableau[:m, -1] >= -self.EPS))
+        full = self.trace == 'full'
+        pivot = pivot_row is not None and pivot_col is not None
         iteration_data = {
             'iteration': self.iteration_count,
             'description': description,
-            'tableau': tableau_copy,
-            'basic_vars': basic_var_names,
-            'objective_value': round(z_value, 6),
+            'operation': f"{description} - {operations}" if operations else description,
+            'basic_vars': self.basic_vars.copy() if full else None,
+            'pivot_row': pivot_row,
+            'pivot_col': pivot_col,
+            'entering_var': self.var_names[pivot_col] if pivot else None,
+            'leaving_var': self.var_names[leaving_var] if pivot else None,
+            'objective_value': round(self._objective_value(), 6),
             'is_feasible': is_feasible,
-            'is_optimal': is_optimal and is_feasible,
-            'solution': solution,
-            'entering_var': f'x{entering_var+1}' if entering_var is not None and entering_var < self.n_vars else (f's{entering_var-self.n_vars+1}' if entering_var is not None else None),
-            'leaving_var': f'x{leaving_var+1}' if leaving_var is not None and leaving_var < self.n_vars else (f's{leaving_var-self.n_vars+1}' if leaving_var is not None else None),
-            'tableau_info': {'variable_names': var_names, 'basic_vars': basic_var_names}
+            'is_optimal': is_feasible and self.is_dual_feasible(),
+            'tableau_info': {
+                'variable_names': self.var_names + ['RHS'],
+                'basic_vars': [self.var_names[bv] for bv in self.basic_vars]
+            } if full else None,
+            'pivot_info': {
+                'row': pivot_row,
+                'col': pivot_col,
+                'element': round(float(self.tableau[pivot_row, pivot_col]), 4)
+            } if pivot else None
         }
-        self.iterations.append(iteration_data)
-    
+        if full:
+            self.iterations.append(self.history.record(iteration_data))
+        else:
+            iteration_data['tableau'] = None
+            self.iterations.append(iteration_data)
+
     def solve(self) -> Dict[str, Any]:
+        """
+        Resuelve con el simplex dual desde la base de holguras.
+
+        Returns:
+            dict: resultado con el mismo formato que SimplexTableau; si la
+                  base inicial no es dual factible, estado 'not_dual_feasible'
+        """
         self.iteration_count = 0
+        if not self.is_dual_feasible():
+            return self._build_result('not_dual_feasible',
+                                      "La base inicial no es dual factible (algún zⱼ - cⱼ > 0)")
         self._save_iteration("Tableau inicial")
-        max_iterations = 100
-        while self.iteration_count < max_iterations:
-            if self._is_optimal():
-                self._save_iteration("Solución óptima encontrada")
-                return self._build_result(True, "optimal")
+        while True:
             leaving_row = self._find_leaving_row()
-            if leaving_row == -1:
-                return self._build_result(False, "infeasible", "No hay solución factible")
+            if leaving_row is None:
+                self._save_iteration("Solución óptima encontrada")
+                return self._build_result('optimal')
+            status = self._budget_status()
+            if status is not None:
+                return self._build_result(status)
             entering_col = self._find_entering_column(leaving_row)
-            if entering_col == -1:
-                return self._build_result(False, "unbounded", "Problema no acotado")
+            if entering_col is None:
+                return self._build_result('infeasible', "El problema no tiene solución factible "
+                                          f"(la fila {leaving_row + 1} no tiene coeficientes negativos)")
             leaving_var = self.basic_vars[leaving_row]
-            entering_var = entering_col
-            self._pivot_operation(leaving_row, entering_col)
+            operations = self._pivot_operation(leaving_row, entering_col)
             self.basic_vars[leaving_row] = entering_col
             self.iteration_count += 1
-            self._save_iteration(f"Pivote realizado", entering_var, leaving_var)
-        return self._build_result(False, "max_iterations", "Se alcanzó el número máximo de iteraciones")
-    
-    def _is_optimal(self) -> bool:
-        m = self.n_constraints
-        for i in range(m):
-            rhs_val = float(self.tableau[i, -1])
-            if rhs_val < -1e-10:
-                return False
-        return True
-    
-    def _find_leaving_row(self) -> int:
+            self._save_iteration("Pivote realizado", leaving_row, entering_col, leaving_var, operations)
+
+    def _budget_status(self) -> Optional[str]:
+        """Límite agotado antes del siguiente pivoteo (None si se puede seguir)"""
+        history_bytes = self.history.nbytes if self.history is not None else 0
+        return self.budget.exhausted(self.iteration_count, history_bytes)
+
+    def _find_leaving_row(self) -> Optional[int]:
+        """Fila saliente según la regla de pricing dual (None si la base es primal factible)"""
         m = self.n_constraints
-        min_rhs = 0.0
-        leaving_row = -1
-        for i in range(m):
-            rhs_val = float(self.tableau[i, -1])
-            if rhs_val < min_rhs - 1e-10:
-                min_rhs = rhs_val
-                leaving_row = i
-        return leaving_row
-    
-    def _find_entering_column(self, leaving_row: int) -> int:
-        z_row = self.tableau[-1, :-1]
-        leaving_row_coeffs = self.tableau[leaving_row, :-1]
-        min_ratio = float('inf')
-        entering_col = -1
-        for j in range(len(leaving_row_coeffs)):
-            coeff_val = float(leaving_row_coeffs[j])
-            z_val = float(z_row[j])
-            if coeff_val < -1e-10:
-                ratio = z_val / coeff_val
-                ratio_val = float(ratio)
-                if ratio_val < min_ratio - 1e-10:
-                    min_ratio = ratio_val
-                    entering_col = j
-        return entering_col
-    
-    def _pivot_operation(self, pivot_row: int, pivot_col: int):
-        pivot_val = float(self.tableau[pivot_row, pivot_col])
-        self.tableau[pivot_row, :] = self.tableau[pivot_row, :] / pivot_val
-        for i in range(self.tableau.shape[0]):
-            if i != pivot_row:
-                multiplier = float(self.tableau[i, pivot_col])
-                self.tableau[i, :] = self.tableau[i, :] - multiplier * self.tableau[pivot_row, :]
-    
-    def _build_result(self, success: bool, status: str, error: str = None) -> Dict[str, Any]:
-        if success:
-            solution = {}
-            for i in range(self.n_vars):
-                solution[f'x{i+1}'] = 0.0
-            for i, bv in enumerate(self.basic_vars):
-                if bv < self.n_vars:
-                    solution[f'x{bv+1}'] = float(self.tableau[i, -1])
-            z_value = float(self.tableau[-1, -1])
-            if self.is_max:
-                z_value = -z_value
-            opt_type = 'max' if self.is_max else 'min'
-            return {'success': True, 'status': status, 'optimal_value': round(z_value, 6), 'solution': solution, 'iterations': self.iterations, 'method': 'Dual Simplex', 'opt_type': opt_type}
+        rhs = self.tableau[:m, -1]
+        if self.lowest_index:
+            rows = np.flatnonzero(rhs < -self.EPS)
+            if len(rows) == 0:
+                return None
+            return int(rows[np.argmin(np.asarray(self.basic_vars)[rows])])
+        if self.pricing == 'steepest_edge':
+            # ||e_iᵀ B⁻¹||²: B⁻¹ está en las columnas de holgura
+            inverse = self.tableau[:m, self.n_vars:self.n_vars + m]
+            weights = np.einsum('ij,ij->i', inverse, inverse)
         else:
-            opt_type = 'max' if self.is_max else 'min'
-            return {'success': False, 'status': status, 'error': error, 'iterations': self.iterations, 'method': 'Dual Simplex', 'opt_type': opt_type}
-
-def parse_objective(objective_str: str) -> Tuple[str, List[float]]:
-    obj_str = objective_str.lower().strip()
-    if obj_str.startswith('max'):
-        obj_type = 'max'
-        obj_str = obj_str[3:].strip()
-    elif obj_str.startswith('min'):
-        obj_type = 'min'
-        obj_str = obj_str[3:].strip()
-    else:
-        obj_type = 'min'
-    if obj_str.startswith('z'):
-        obj_str = obj_str[1:].strip()
-    if obj_str.startswith('='):
-        obj_str = obj_str[1:].strip()
-    terms = re.findall(r'([+-]?\s*\d*\.?\d*)\s*\*?\s*x(\d+)', obj_str)
-    if not terms:
-        raise ValueError('No se pudieron extraer los coeficientes')
-    max_var = max(int(var_idx) for _, var_idx in terms)
-    coefficients = [0.0] * max_var
-    for coef_str, var_idx in terms:
-        coef_str = coef_str.replace(' ', '')
-        if coef_str in ['', '+']:
-            coef = 1.0
-        elif coef_str == '-':
-            coef = -1.0
-        else:
-            coef = float(coef_str)
-        coefficients[int(var_idx) - 1] = coef
-    return obj_type, coefficients
-
-def parse_constraints(constraints: List[str]) -> Tuple[List[List[float]], List[float], List[str]]:
-    A = []
-    b = []
-    constraint_types = []
-    for constraint in constraints:
-        constraint = constraint.strip()
-        if not constraint:
-            continue
-        if '>=' in constraint:
-            constraint_type = '>='
-            lhs, rhs = constraint.split('>=')
-        elif '<=' in constraint:
-            constraint_type = '<='
-            lhs, rhs = constraint.split('<=')
-        elif '=' in constraint:
-            constraint_type = '='
-            lhs, rhs = constraint.split('=')
+            weights = np.ones(m)
+        return dual_leaving_row(rhs, weights, self.EPS)
+
+    def _find_entering_column(self, leaving_row: int) -> Optional[int]:
+        """Columna entrante por el cociente mínimo (None si el primal es infactible)"""
+        return dual_ratio_column(self.tableau[leaving_row, :-1], self.tableau[-1, :-1], self.EPS,
+                                 lowest_index=self.lowest_index)
+
+    def _pivot_operation(self, pivot_row: int, pivot_col: int) -> str:
+        """
+        Pivotea y registra el paso. Devuelve las operaciones de fila como
+        texto solo con traza 'full' (si no, una cadena vacía).
+        """
+        pivot_element = self.tableau[pivot_row, pivot_col]
+        objective = self.tableau[-1, -1]
+        multipliers = pivot_in_place(self.tableau, pivot_row, pivot_col, self._pivot_work)
+        if self.history is not None:
+            self.history.pivot(pivot_row, pivot_col)
+
+        # Pivoteo degenerado: el objetivo no cambia (cociente cero)
+        if abs(self.tableau[-1, -1] - objective) <= self.EPS:
+            self.degenerate_steps += 1
+            self.lowest_index = self.lowest_index or self.degenerate_steps >= DEGENERATE_LIMIT
         else:
-            continue
-        rhs_value = float(rhs.strip())
-        lhs = lhs.strip()
-        terms = re.findall(r'([+-]?\s*\d*\.?\d*)\s*\*?\s*x(\d+)', lhs)
-        if not terms:
-            continue
-        max_var = max(int(var_idx) for _, var_idx in terms)
-        row = [0.0] * max_var
-        for coef_str, var_idx in terms:
-            coef_str = coef_str.replace(' ', '')
-            if coef_str in ['', '+']:
-                coef = 1.0
-            elif coef_str == '-':
-                coef = -1.0
+            self.degenerate_steps = 0
+            self.lowest_index = False
+
+        if self.trace != 'full':
+            return ''
+        operations = [f"F{pivot_row + 1} = F{pivot_row + 1} / {pivot_element:.4g}"]
+        for i in np.flatnonzero(np.abs(multipliers) > self.EPS):
+            multiplier = multipliers[i]
+            row_name = f"F{i + 1}" if i < self.n_constraints else "FZ"
+            if multiplier > 0:
+                operations.append(f"{row_name} = {row_name} - {multiplier:.4g} × F{pivot_row + 1}")
             else:
-                coef = float(coef_str)
-            row[int(var_idx) - 1] = coef
-        A.append(row)
-        b.append(rhs_value)
-        constraint_types.append(constraint_type)
-    return A, b, constraint_types
-
-def solve_dual_simplex_tableau(objective: str, constraints: List[str]) -> Dict[str, Any]:
+                operations.append(f"{row_name} = {row_name} + {abs(multiplier):.4g} × F{pivot_row + 1}")
+        return " | ".join(operations)
+
+    def _current_solution(self) -> Dict[str, float]:
+        """Valores de las variables de decisión en la base actual"""
+        values = np.zeros(self.n_vars)
+        basic = np.asarray(self.basic_vars)
+        rows = np.flatnonzero(basic < self.n_vars)
+        values[basic[rows]] = self.tableau[rows, -1]
+        return {f'x{i + 1}': round(float(value), 4) for i, value in enumerate(values)}
+
+    def _build_result(self, status: str, error: str = None) -> Dict[str, Any]:
+        """Construye el diccionario de resultado (mismo formato que SimplexTableau)"""
+        opt_type = 'max' if self.is_max else 'min'
+        if status == 'optimal':
+            return {
+                'success': True,
+                'status': 'optimal',
+                'optimal_value': round(self._objective_value(), 4),
+                'solution': self._current_solution(),
+                'opt_type': opt_type,
+                'iterations': self.iterations,
+                'method': 'Dual Simplex',
+                'pricing': self.pricing,
+                'basic_vars': list(self.basic_vars),
+                'estado_final': 'Óptimo'
+            }
+        result = {
+            'success': False,
+            'status': status,
+            'error': error,
+            'iterations': self.iterations,
+            'method': 'Dual Simplex',
+            'opt_type': opt_type
+        }
+        if status in BUDGET_STATUSES:
+            # La base actual es dual factible pero todavía no primal factible;
+            # su valor objetivo es una cota del óptimo
+            result['error'] = self.budget.message(status, self.iteration_count)
+            result['basic_vars'] = list(self.basic_vars)
+            result['feasible'] = False
+            result['objective_bound'] = round(self._objective_value(), 4)
+            result['estado_final'] = 'Límite alcanzado'
+        return result
+
+
+def solve_dual_simplex_tableau(objective: str, constraints: List[str], model_cache=None,
+                               trace: str = 'full', budget: Optional[SolverBudget] = None,
+                               pricing: str = 'steepest_edge') -> Dict[str, Any]:
+    """
+    Resuelve con el simplex dual; si la base inicial de holguras no es dual
+    factible (por ejemplo, maximización con costos positivos), usa Dos
+    Fases (simplex_tableau) y lo indica en 'dual_fallback'.
+
+    Args:
+        model_cache: ParsedModelCache opcional (se comparte con Simplex)
+        trace: 'full', 'summary' o 'none' (ver solver_trace)
+        budget: límites de iteraciones, tiempo y memoria (ver solver_budget)
+        pricing: regla de la fila saliente: 'steepest_edge' o 'dantzig'
+    """
     try:
-        # Import simplex solver (which uses Two-Phase Method)
-        import simplex_tableau
-        
-        # Use Simplex Two-Phase which handles all constraint types correctly
-        result = simplex_tableau.solve_simplex_tableau(objective, constraints)
-        
-        # Change method name in result
+        opt_type, c, A, b, constraint_types = simplex_tableau.parse_model(objective, constraints,
+                                                                          model_cache)
+        if not A:
+            return {'success': False, 'status': 'error',
+                    'error': 'No se encontraron restricciones válidas.', 'iterations': []}
+
+        solver = DualSimplexTableau(opt_type, c, A, b, constraint_types, budget=budget,
+                                    pricing=pricing, trace=trace)
+        if solver.is_dual_feasible():
+            return solver.solve()
+
+        result = simplex_tableau.solve_simplex_tableau(objective, constraints, model_cache, trace=trace,
+                                                      budget=budget)
         if 'method' in result:
             result['method'] = 'Dual Simplex (via Two-Phase)'
-        
+        result['dual_fallback'] = ('La base inicial no es dual factible: '
+                                   'se resolvió con el método de Dos Fases')
         return result
     except Exception as e:
         return {'success': False, 'status': 'error', 'error': str(e), 'iterations': []}
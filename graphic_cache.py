@@ -0,0 +1,334 @@
+# archivo: graphic_cache.py
+"""
+Caché de gráficas del método gráfico, direccionada por contenido.
+
+Cada gráfica se identifica con un hash canónico del problema (restricciones,
+función objetivo, límites y formato), de modo que problemas idénticos comparten
+la misma imagen y la misma URL. Las entradas viven en memoria con desalojo LRU
+y, opcionalmente, se guardan en un directorio de disco al ser desalojadas.
+
+PlotRenderPool genera las gráficas en procesos aparte, para que la respuesta
+numérica no espere al renderizado.
+"""
+
+import hashlib
+import json
+import multiprocessing
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+MIMETYPES = {
+    'svg': 'image/svg+xml',
+    'png': 'image/png',
+}
+
+_HEX_KEY = re.compile(r'[0-9a-f]{64}')
+
+
+def _canonical_float(value: float) -> float:
+    """Normaliza un número para el hash (-0.0 y 0.0 son el mismo valor)."""
+    return float(value) + 0.0
+
+
+def graphic_key(constraints: List[Dict], obj_coeffs: List[float], opt_type: str,
+                x_max: float, y_max: float, image_format: str,
+                render_mode: str = 'polygon', integer: bool = False) -> str:
+    """
+    Calcula la clave canónica de una gráfica.
+
+    El orden de las restricciones se conserva porque determina los colores y
+    las etiquetas de la leyenda. integer indica el modo entero, que agrega el
+    óptimo entero a la gráfica.
+
+    Returns:
+        str: hash SHA-256 en hexadecimal
+    """
+    payload = {
+        'constraints': [
+            [_canonical_float(c['a']), _canonical_float(c['b']), c['op'], _canonical_float(c['rhs'])]
+            for c in constraints
+        ],
+        'objective': [_canonical_float(v) for v in obj_coeffs],
+        'opt_type': opt_type,
+        'bounds': [_canonical_float(x_max), _canonical_float(y_max)],
+        'format': image_format,
+        'mode': render_mode,
+    }
+    if integer:
+        payload['integer'] = True  # solo si se usa, para no cambiar las demás claves
+    text = json.dumps(payload, separators=(',', ':'), sort_keys=True)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class GraphicCache:
+    """
+    Caché LRU en memoria de imágenes ya codificadas, con volcado opcional a disco.
+
+    Es segura entre hilos; el renderizado se hace fuera del candado, así que dos
+    peticiones simultáneas del mismo problema pueden renderizarlo dos veces.
+    """
+
+    def __init__(self, max_entries: int = 256, spill_dir: Optional[str] = None):
+        """
+        Args:
+            max_entries: número máximo de imágenes en memoria
+            spill_dir: directorio donde guardar las imágenes desalojadas
+                       (None para no usar disco)
+        """
+        self.max_entries = max_entries
+        self.spill_dir = spill_dir
+        self._entries: 'OrderedDict[str, Tuple[bytes, str]]' = OrderedDict()
+        self._evict_listeners: List[Callable[[str], None]] = []
+        self._spill_filter: Optional[Callable[[str], bool]] = None
+        self._lock = threading.Lock()
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+
+    def _spill_path(self, key: str, image_format: str) -> str:
+        return os.path.join(self.spill_dir, f'{key}.{image_format}')
+
+    def _load_from_disk(self, key: str) -> Optional[Tuple[bytes, str]]:
+        # La clave llega desde la URL: solo se aceptan hashes hexadecimales
+        if not self.spill_dir or not _HEX_KEY.fullmatch(key):
+            return None
+        for image_format in MIMETYPES:
+            path = self._spill_path(key, image_format)
+            if os.path.exists(path):
+                with open(path, 'rb') as f:
+                    return f.read(), image_format
+        return None
+
+    def _spill(self, key: str, data: bytes, image_format: str):
+        if not self.spill_dir:
+            return
+        path = self._spill_path(key, image_format)
+        if os.path.exists(path):
+            return  # contenido direccionado: el archivo ya es el correcto
+        tmp_path = f'{path}.{threading.get_ident()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def get(self, key: str) -> Optional[Tuple[bytes, str]]:
+        """
+        Busca una imagen en memoria y luego en disco.
+
+        Returns:
+            tuple: (bytes, formato) o None si no está en la caché
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+
+        entry = self._load_from_disk(key)
+        if entry is not None:
+            self.put(key, *entry)
+        return entry
+
+    def put(self, key: str, data: bytes, image_format: str):
+        """Guarda una imagen, desalojando (y volcando a disco) las menos usadas."""
+        evicted = []
+        with self._lock:
+            self._entries[key] = (data, image_format)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                evicted.append(self._entries.popitem(last=False))
+
+        for old_key, (old_data, old_format) in evicted:
+            if self._spill_filter is None or self._spill_filter(old_key):
+                self._spill(old_key, old_data, old_format)
+            for listener in self._evict_listeners:
+                listener(old_key)
+
+    def add_evict_listener(self, listener: Callable[[str], None]):
+        """Registra listener(clave); se llama, fuera del candado, por cada imagen desalojada."""
+        self._evict_listeners.append(listener)
+
+    def set_spill_filter(self, predicate: Optional[Callable[[str], bool]]):
+        """Solo se vuelcan a disco las imágenes desalojadas con predicate(clave) verdadero."""
+        self._spill_filter = predicate
+
+    def get_or_render(self, key: str, image_format: str, render: Callable[[], bytes]) -> bytes:
+        """Devuelve la imagen de la caché o la genera con render() y la guarda."""
+        entry = self.get(key)
+        if entry is not None:
+            return entry[0]
+        data = render()
+        self.put(key, data, image_format)
+        return data
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+
+class PlotRenderPool:
+    """
+    Pool acotado de procesos que renderiza gráficas y las guarda en una GraphicCache.
+
+    Cuando la cola crece se degrada la calidad: con degrade_backlog o más
+    gráficas pendientes se renderiza en calidad 'draft', y con max_backlog o
+    más la gráfica se omite. Las gráficas en borrador o las omitidas se
+    vuelven a intentar en calidad completa en la siguiente solicitud.
+
+    Los borradores nunca se vuelcan a disco (desde ahí se servirían como
+    definitivos). Cuando la caché desaloja una imagen la clave se marca como
+    'expired' y la página la vuelve a pedir con resubmit, que usa los
+    argumentos guardados de la última solicitud de esa clave.
+    """
+
+    def __init__(self, cache: GraphicCache, max_workers: int = 2,
+                 degrade_backlog: Optional[int] = None, max_backlog: Optional[int] = None):
+        """
+        Args:
+            cache: caché donde se guardan las imágenes terminadas
+            max_workers: número de procesos de renderizado
+            degrade_backlog: pendientes a partir de los cuales se usa 'draft'
+                             (por defecto 2 por proceso)
+            max_backlog: pendientes a partir de los cuales se omite la gráfica
+                         (por defecto 8 por proceso)
+        """
+        self.cache = cache
+        self.max_workers = max_workers
+        self.degrade_backlog = degrade_backlog if degrade_backlog is not None else 2 * max_workers
+        self.max_backlog = max_backlog if max_backlog is not None else 8 * max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending: Dict[str, Future] = {}
+        self._drafts = set()
+        self._failed: 'OrderedDict[str, str]' = OrderedDict()  # clave -> 'skipped', 'failed' o 'expired'
+        # clave -> (formato, render, args, kwargs) de las últimas gráficas
+        # pedidas, para volver a generarlas si la caché las desaloja
+        self._jobs: 'OrderedDict[str, Tuple[str, Callable[..., bytes], tuple, dict]]' = OrderedDict()
+        # Reentrante: submit consulta la caché con el candado tomado y esa
+        # consulta puede desalojar imágenes y llamar a _on_evict
+        self._lock = threading.RLock()
+        cache.add_evict_listener(self._on_evict)
+        cache.set_spill_filter(self._is_final)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        # 'spawn' evita heredar hilos y candados del servidor web al hacer fork
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return self._executor
+
+    def _mark(self, key: str, status: str):
+        self._failed[key] = status
+        self._failed.move_to_end(key)
+        while len(self._failed) > 1024:
+            self._failed.popitem(last=False)
+
+    def _remember(self, key: str, job: Tuple[str, Callable[..., bytes], tuple, dict]):
+        self._jobs[key] = job
+        self._jobs.move_to_end(key)
+        while len(self._jobs) > 1024:
+            self._jobs.popitem(last=False)
+
+    def submit(self, key: str, image_format: str, render: Callable[..., bytes], /,
+               *args: Any, **kwargs: Any) -> str:
+        """
+        Encola render(*args, quality=..., **kwargs) si la imagen no está lista.
+
+        render debe poder serializarse (una función de nivel de módulo).
+
+        Returns:
+            str: estado de la gráfica tras la solicitud (ver status)
+        """
+        with self._lock:
+            self._remember(key, (image_format, render, args, kwargs))
+            if key in self._pending:
+                return 'pending'
+            if key not in self._drafts and self.cache.get(key) is not None:
+                return 'ready'
+
+            backlog = len(self._pending)
+            if backlog >= self.max_backlog:
+                self._mark(key, 'skipped')
+                return 'skipped'
+            quality = 'draft' if backlog >= self.degrade_backlog else 'full'
+            if quality == 'draft' and key in self._drafts:
+                return 'ready'  # ya hay un borrador; no vale la pena repetirlo
+
+            future = self._get_executor().submit(render, *args, quality=quality, **kwargs)
+            self._pending[key] = future
+            self._failed.pop(key, None)
+
+        future.add_done_callback(lambda f: self._on_done(key, image_format, quality, f))
+        return 'pending'
+
+    def _on_done(self, key: str, image_format: str, quality: str, future: Future):
+        try:
+            data = future.result()
+        except Exception:
+            with self._lock:
+                self._pending.pop(key, None)
+                self._mark(key, 'failed')
+            return
+
+        # La marca de borrador va antes de guardar la imagen, para que la
+        # caché ya sepa si puede volcarla a disco
+        with self._lock:
+            if quality == 'draft':
+                self._drafts.add(key)
+            else:
+                self._drafts.discard(key)
+        self.cache.put(key, data, image_format)
+        with self._lock:
+            self._pending.pop(key, None)
+
+    def resubmit(self, key: str) -> str:
+        """
+        Vuelve a encolar una gráfica con los argumentos de su última solicitud
+        (por ejemplo, tras ser desalojada de la caché).
+
+        Returns:
+            str: estado tras la solicitud (ver submit), o 'unknown' si ya no
+                 se conservan sus argumentos
+        """
+        with self._lock:
+            job = self._jobs.get(key)
+        if job is None:
+            return 'unknown'
+        image_format, render, args, kwargs = job
+        return self.submit(key, image_format, render, *args, **kwargs)
+
+    def _is_final(self, key: str) -> bool:
+        with self._lock:
+            return key not in self._drafts
+
+    def _on_evict(self, key: str):
+        with self._lock:
+            self._drafts.discard(key)
+            if key not in self._pending:
+                self._mark(key, 'expired')
+
+    def status(self, key: str) -> str:
+        """
+        Estado de una gráfica: 'ready', 'pending', 'skipped', 'failed',
+        'expired' (desalojada de la caché; hay que volver a pedirla) o 'unknown'.
+        """
+        with self._lock:
+            if key in self._pending:
+                return 'pending'
+            failed = self._failed.get(key)
+        if self.cache.get(key) is not None:
+            return 'ready'
+        return failed or 'unknown'
+
+    def is_draft(self, key: str) -> bool:
+        """Indica si la imagen guardada es un borrador (no debe cachearse en el navegador)."""
+        with self._lock:
+            return key in self._drafts
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,141 @@
+# archivo: iteration_history.py
+"""
+Historial de iteraciones por repetición de pivoteos.
+
+En lugar de copiar el tableau en cada iteración, el historial guarda el
+tableau inicial y la secuencia de pivoteos (más una copia completa en los
+cambios que no son pivoteos, como la transición a Fase II). El tableau de
+cualquier iteración se reconstruye al pedirlo, repitiendo los pivoteos con
+el mismo kernel (simplex_kernels), así que el resultado es idéntico al que
+tenía el solver en ese momento. Las últimas reconstrucciones se guardan en
+un LRU pequeño: las plantillas recorren las iteraciones en orden, y cada
+una cuesta un solo pivoteo desde la anterior.
+"""
+
+import bisect
+import sys
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from simplex_kernels import clear_small_values, pivot_in_place
+
+
+class IterationHistory:
+    """
+    Tableau inicial más la secuencia de operaciones aplicadas.
+
+    Cada operación es un pivoteo (argumentos de pivot_in_place y, opcional,
+    la tolerancia de clear_small_values) o una copia completa del tableau.
+    El estado en la posición p es el resultado de aplicar las p primeras.
+    """
+
+    def __init__(self, tableau: np.ndarray, view: Callable[[np.ndarray], Any] = np.copy,
+                 cache_size: int = 8):
+        """
+        Args:
+            tableau: tableau inicial (se copia)
+            view: convierte un estado en lo que se muestra en la iteración
+                  (por ejemplo, el tableau limpio o una lista de listas)
+            cache_size: estados reconstruidos que se conservan (LRU)
+        """
+        self.view = view
+        self.cache_size = cache_size
+        self._steps: List[Tuple] = []
+        self._keyframes: List[int] = []  # posiciones de las copias completas
+        self._keyframe_bytes = 0
+        self._record_bytes = 0
+        self._cache: 'OrderedDict[int, Tuple[np.ndarray, Any]]' = OrderedDict()
+        self.keyframe(tableau)
+
+    @property
+    def position(self) -> int:
+        """Número de operaciones registradas (estado actual del solver)."""
+        return len(self._steps)
+
+    @property
+    def nbytes(self) -> int:
+        """Memoria aproximada del historial: copias, pivoteos y registros (sin el LRU)."""
+        return self._keyframe_bytes + 64 * len(self._steps) + self._record_bytes
+
+    def keyframe(self, tableau: np.ndarray):
+        """Registra una copia completa (para cambios que no son pivoteos)."""
+        copy = np.array(tableau, dtype=float)
+        self._keyframe_bytes += copy.nbytes
+        self._keyframes.append(len(self._steps))
+        self._steps.append(('keyframe', copy))
+
+    def pivot(self, pivot_row: int, pivot_col: int, divide: bool = True,
+              skip_below: Optional[float] = None, clean: Optional[float] = None):
+        """
+        Registra un pivoteo hecho con pivot_in_place(..., divide, skip_below)
+        y, si clean no es None, clear_small_values(..., clean).
+        """
+        self._steps.append(('pivot', pivot_row, pivot_col, divide, skip_below, clean))
+
+    def record(self, data: Dict[str, Any]) -> 'HistoryIteration':
+        """Iteración cuyo 'tableau' es el estado actual, reconstruido al pedirlo."""
+        self._record_bytes += approx_bytes(data)
+        return HistoryIteration(data, self, self.position)
+
+    def tableau(self, position: int) -> Any:
+        """Vista del estado en la posición indicada."""
+        cached = self._cache.get(position)
+        if cached is not None:
+            self._cache.move_to_end(position)
+            return cached[1]
+
+        # Partir de la última copia completa o de un estado ya reconstruido posterior
+        start = self._keyframes[bisect.bisect_left(self._keyframes, position) - 1]
+        state = self._steps[start][1].copy()
+        start += 1
+        reusable = [p for p in self._cache if start <= p <= position]
+        if reusable:
+            start = max(reusable)
+            state = self._cache[start][0].copy()
+
+        work = np.empty_like(state)
+        for _, pivot_row, pivot_col, divide, skip_below, clean in self._steps[start:position]:
+            pivot_in_place(state, pivot_row, pivot_col, work, divide=divide, skip_below=skip_below)
+            if clean is not None:
+                clear_small_values(state, clean, work)
+
+        view = self.view(state)
+        self._cache[position] = (state, view)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return view
+
+
+def approx_bytes(value: Any) -> int:
+    """Tamaño aproximado de un valor, con sus listas y diccionarios anidados."""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(approx_bytes(v) for v in value.values())
+    elif isinstance(value, (list, tuple)):
+        size += sum(approx_bytes(v) for v in value)
+    return size
+
+
+class HistoryIteration(dict):
+    """
+    Diccionario de una iteración; la clave 'tableau' no se guarda sino que
+    se reconstruye desde el historial cada vez que se pide (iter['tableau'],
+    iter.get('tableau') o iter.tableau en Jinja2).
+    """
+
+    def __init__(self, data: Dict[str, Any], history: IterationHistory, position: int):
+        super().__init__(data)
+        self._history = history
+        self._position = position
+
+    def __missing__(self, key):
+        if key == 'tableau':
+            return self._history.tableau(self._position)
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if key == 'tableau' and not super().__contains__(key):
+            return self._history.tableau(self._position)
+        return super().get(key, default)
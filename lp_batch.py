@@ -0,0 +1,230 @@
+# archivo: lp_batch.py
+"""
+Método gráfico por lotes.
+
+Resuelve muchos problemas de 2 variables a la vez (por ejemplo, las tareas de
+todo un grupo). Los vértices de todos los problemas se calculan con operaciones
+vectorizadas sobre el lote completo, y las gráficas solo se generan si se piden.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from lp_solver import (parse_problem, _build_halfplanes,
+                       evaluate_vertices, create_plot, VERTEX_EPS)
+
+
+def _parse_problem(objective_str, constraints_list):
+    """
+    Parsea un problema igual que solve_lp_problem.
+
+    Returns:
+        tuple: (tipo_optimización, coeficientes, restricciones)
+    """
+    return parse_problem(objective_str, constraints_list)
+
+
+def _pad_halfplanes(constraint_sets):
+    """
+    Construye los tensores de líneas y desigualdades de todo el lote.
+
+    Los problemas con menos restricciones se rellenan con la línea nula
+    (0, 0, 0), que nunca se intersecta, y con la desigualdad 0x + 0y <= 1,
+    que siempre se cumple.
+
+    Returns:
+        tuple: (L, G) con formas (lote, líneas, 3) y (lote, desigualdades, 3)
+    """
+    built = [_build_halfplanes(constraints) for constraints in constraint_sets]
+    n_lines = max(len(lines) for lines, _ in built)
+    n_ineqs = max(len(ineqs) for _, ineqs in built)
+
+    L = np.zeros((len(built), n_lines, 3))
+    G = np.zeros((len(built), n_ineqs, 3))
+    G[:, :, 2] = 1.0
+    for k, (lines, ineqs) in enumerate(built):
+        L[k, :len(lines)] = lines
+        G[k, :len(ineqs)] = ineqs
+    return L, G
+
+
+def _batch_vertex_arrays(L, G, eps=VERTEX_EPS):
+    """
+    Intersecta todas las parejas de líneas de cada problema y verifica su
+    factibilidad, todo con operaciones sobre el lote completo.
+
+    Returns:
+        tuple: (puntos, válidos) con formas (lote, parejas, 2) y (lote, parejas);
+               los puntos válidos están redondeados a 9 decimales, ordenados en
+               sentido antihorario alrededor del centroide y sin puntos a
+               menos de eps entre sí
+    """
+    I, J = np.triu_indices(L.shape[1], k=1)
+    a1, b1, r1 = L[:, I, 0], L[:, I, 1], L[:, I, 2]
+    a2, b2, r2 = L[:, J, 0], L[:, J, 1], L[:, J, 2]
+
+    # Regla de Cramer para todas las parejas de todos los problemas
+    det = a1 * b2 - a2 * b1
+    valid = np.abs(det) >= 1e-9
+    safe_det = np.where(valid, det, 1.0)
+    x = (r1 * b2 - r2 * b1) / safe_det
+    y = (a1 * r2 - a2 * r1) / safe_det
+    valid &= np.isfinite(x) & np.isfinite(y)
+
+    # Prueba de factibilidad G_ab @ P <= G_r para cada problema
+    lhs = G[:, :, 0, None] * x[:, None, :] + G[:, :, 1, None] * y[:, None, :]
+    valid &= np.all(lhs <= G[:, :, 2, None] + 1e-7, axis=1)
+
+    points = np.round(np.stack((x, y), axis=-1), 9) + 0.0  # sin -0.0
+    points[~valid] = 0.0
+
+    # Ordenar en sentido antihorario alrededor del centroide de cada región
+    count = valid.sum(axis=1, keepdims=True)
+    centroid = points.sum(axis=1) / np.maximum(count, 1)
+    angle = np.arctan2(points[:, :, 1] - centroid[:, 1, None],
+                       points[:, :, 0] - centroid[:, 0, None])
+    angle[~valid] = np.inf
+    order = np.argsort(angle, axis=1, kind='stable')
+    points = np.take_along_axis(points, order[:, :, None], axis=1)
+    valid = np.take_along_axis(valid, order, axis=1)
+
+    # Los puntos casi iguales tienen casi el mismo ángulo, así que quedan juntos
+    # (los válidos van primero); el primero y el último también son vecinos
+    close = np.all(np.abs(points[:, 1:] - points[:, :-1]) <= eps, axis=-1) & valid[:, 1:]
+    last = np.maximum(count[:, 0] - 1, 0)
+    rows = np.arange(len(points))
+    wrap = (last > 0) & np.all(np.abs(points[rows, last] - points[:, 0]) <= eps, axis=-1)
+    valid[:, 1:] &= ~close
+    valid[rows, last] &= ~wrap
+    return points, valid
+
+
+def _batch_unbounded(G):
+    """
+    Indica, para cada problema, si su región (supuesta no vacía) es no acotada.
+
+    En 2D la región es no acotada si existe una dirección d != 0 con G d <= 0.
+    Si existe, alguna de las direcciones extremas de ese cono es perpendicular
+    a una de las restricciones, así que basta probar ±(b, -a) de cada fila.
+    """
+    normals = G[:, :, :2]
+    norm = np.linalg.norm(normals, axis=-1, keepdims=True)
+    normals = np.where(norm > 1e-12, normals / np.maximum(norm, 1e-12), 0.0)
+
+    perp = np.stack((normals[:, :, 1], -normals[:, :, 0]), axis=-1)
+    directions = np.concatenate((perp, -perp), axis=1)          # (lote, 2K, 2)
+    proj = np.einsum('bkd,bcd->bck', normals, directions)       # (lote, 2K, K)
+    nonzero = np.any(directions != 0.0, axis=-1)
+    return np.any(nonzero & np.all(proj <= 1e-9, axis=-1), axis=1)
+
+
+def batch_feasible_vertices(constraint_sets, max_chunk_elements=4_000_000, eps=VERTEX_EPS):
+    """
+    Calcula los vértices y el estado de la región de muchos problemas a la vez.
+
+    El lote se divide en bloques para que el tensor de factibilidad
+    (problemas × desigualdades × parejas) no supere max_chunk_elements.
+
+    Args:
+        constraint_sets: lista de listas de restricciones ('a','b','op','rhs')
+        eps: distancia por debajo de la cual dos vértices se fusionan
+
+    Returns:
+        list: una tupla (vértices, estado) por problema; los vértices van en
+              orden antihorario y el estado es 'bounded', 'unbounded' o 'empty'
+    """
+    output = []
+    if not constraint_sets:
+        return output
+
+    L_all, G_all = _pad_halfplanes(constraint_sets)
+    n_pairs = L_all.shape[1] * (L_all.shape[1] - 1) // 2
+    per_chunk = max(1, max_chunk_elements // max(1, n_pairs * G_all.shape[1]))
+
+    for start in range(0, len(constraint_sets), per_chunk):
+        L, G = L_all[start:start + per_chunk], G_all[start:start + per_chunk]
+        points, valid = _batch_vertex_arrays(L, G, eps)
+        unbounded = _batch_unbounded(G)
+        for k in range(len(L)):
+            vertices = [(float(x), float(y)) for x, y in points[k][valid[k]]]
+            if not vertices:
+                output.append(([], 'empty'))
+            else:
+                output.append((vertices, 'unbounded' if unbounded[k] else 'bounded'))
+    return output
+
+
+def _solve_chunk(problems, with_plots=False, image_format='svg'):
+    """Resuelve una parte del lote en el proceso actual."""
+    parsed = []
+    results = [None] * len(problems)
+    for i, (objective_str, constraints_list) in enumerate(problems):
+        try:
+            parsed.append((i, _parse_problem(objective_str, constraints_list)))
+        except Exception as e:
+            results[i] = {'success': False, 'error': f'Error al procesar el problema: {str(e)}'}
+
+    regions = batch_feasible_vertices([constraints for _, (_, _, constraints) in parsed])
+    for (i, (opt_type, obj_coeffs, constraints)), (vertices, region_status) in zip(parsed, regions):
+        if not vertices:
+            results[i] = {
+                'success': False,
+                'error': 'No se encontró región factible. Verifica las restricciones.'
+            }
+            continue
+
+        if with_plots:
+            evaluated, best_pt, best_val, graphic = create_plot(
+                constraints, vertices, obj_coeffs, opt_type, image_format=image_format
+            )
+        else:
+            evaluated, best_pt, best_val = evaluate_vertices(vertices, obj_coeffs, opt_type)
+            graphic = None
+
+        results[i] = {
+            'success': True,
+            'opt_type': opt_type,
+            'obj_coeffs': obj_coeffs,
+            'vertices': vertices,
+            'results': evaluated,
+            'best_point': best_pt,
+            'best_value': best_val,
+            'graphic': graphic,
+            'graphic_format': image_format,
+            'constraints': constraints,
+            'region_status': region_status
+        }
+    return results
+
+
+def solve_lp_batch(problems, with_plots=False, image_format='svg', workers=0, chunk_size=2048):
+    """
+    Resuelve un lote de problemas con el método gráfico.
+
+    Args:
+        problems: lista de pares (función_objetivo, lista_de_restricciones),
+                  con el mismo formato que recibe solve_lp_problem
+        with_plots: si es True, cada resultado incluye su gráfica en base64
+        image_format: formato de las gráficas, 'svg' o 'png'
+        workers: número de procesos (0 o 1 para resolver en el proceso actual)
+        chunk_size: problemas por tarea al repartir el lote entre procesos
+
+    Returns:
+        list: un diccionario por problema, en el mismo orden, con las mismas
+              claves que solve_lp_problem (sin 'graphic_key' ni 'ranging'); los vértices
+              van en orden antihorario
+    """
+    problems = list(problems)
+    if workers <= 1 or len(problems) <= chunk_size:
+        return _solve_chunk(problems, with_plots, image_format)
+
+    chunks = [problems[i:i + chunk_size] for i in range(0, len(problems), chunk_size)]
+    results = []
+    with ProcessPoolExecutor(max_workers=workers,
+                             mp_context=multiprocessing.get_context('spawn')) as pool:
+        for part in pool.map(_solve_chunk, chunks,
+                             [with_plots] * len(chunks), [image_format] * len(chunks)):
+            results.extend(part)
+    return results
@@ -0,0 +1,187 @@
+# archivo: lp_parser.py
+"""
+Parser de expresiones lineales compartido por todos los métodos.
+
+Cada línea (función objetivo o restricción) se recorre una sola vez con un
+tokenizador compilado y se convierte en un mapa disperso {variable: coeficiente}.
+Cada método convierte después ese mapa al formato que necesita (x, y en el
+método gráfico; x1..xn en los métodos simplex).
+
+Sintaxis aceptada:
+    "max z = 3x1 + 5x2", "minimizar z = x - 2y", "3x1+4x2 >= 12",
+    "2*x + 3 y ≤ 10", "x <= y" (variables en ambos lados), "x + 2 = y - 1"
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+# Cada término (signo, coeficiente y variable) es un solo token, así que una
+# expresión típica se recorre con un match por término. Los números aceptan
+# exponente como float() ("1e3", "2.5E-1"); un coeficiente no puede terminar
+# justo antes de un exponente, así que "1e3" nunca se lee como 1·e3.
+# Grupos: 1-3 término (signo, coeficiente, variable), 4 constante, 5 operador,
+# 6 signo suelto, 7 carácter inválido
+_TOKEN = re.compile(r'''
+    \s*(?:
+        ([+\-−]?)\s*(?:((?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?)(?![eE][+-]?\d)\s*\*?\s*)?([^\W\d]\w*)   # término: "- 3.5*x1", "2.5e-1x1"
+      | ((?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?)       # constante: "12", "1e3"
+      | (<=|>=|=<|=>|==|=|≤|≥)      # operador de comparación
+      | ([+\-−])                    # signo sin término (le sigue una constante u otro signo)
+      | (\S)                        # cualquier otro carácter
+    )''', re.VERBOSE)
+
+_OPERATORS = {'<=': '<=', '=<': '<=', '≤': '<=',
+              '>=': '>=', '=>': '>=', '≥': '>=',
+              '=': '=', '==': '='}
+
+_X_INDEX = re.compile(r'x(\d+)')
+
+
+def parse_linear(text: str) -> Tuple[Dict[str, float], Optional[str], float]:
+    """
+    Recorre una expresión lineal, con o sin operador de comparación.
+
+    Las variables del lado derecho pasan al izquierdo y las constantes del
+    lado izquierdo pasan al derecho.
+
+    Returns:
+        tuple: (términos, operador, constante)
+            términos: {variable: coeficiente} (lado izquierdo - lado derecho)
+            operador: '<=', '>=', '=' o None si no hay
+            constante: lado derecho - constantes del lado izquierdo
+    """
+    terms: Dict[str, float] = {}
+    op = None
+    constant = 0.0
+    side = 1.0        # 1 en el lado izquierdo, -1 en el derecho
+    sign = 1.0        # signo acumulado de los signos sueltos
+    expect_term = True  # al inicio, o después de un signo o del operador
+    dangling = False    # hay un signo suelto que todavía no tiene término
+
+    for m in _TOKEN.finditer(text):
+        kind = m.lastindex
+        if kind == 3:
+            explicit, number, name = m.group(1, 2, 3)
+            if explicit:
+                if explicit != '+':
+                    sign = -sign
+            elif not expect_term:
+                raise ValueError(f"Falta un signo antes de '{m.group().strip()}' en: {text}")
+            coef = sign * side * (float(number) if number else 1.0)
+            name = name.lower()
+            terms[name] = terms.get(name, 0.0) + coef
+            sign, expect_term, dangling = 1.0, False, False
+        elif kind == 4:
+            if not expect_term:
+                raise ValueError(f"Falta un signo antes de '{m.group(4)}' en: {text}")
+            constant -= sign * side * float(m.group(4))
+            sign, expect_term, dangling = 1.0, False, False
+        elif kind == 6:
+            if m.group(6) != '+':
+                sign = -sign
+            expect_term, dangling = True, True
+        elif kind == 5:
+            if op is not None:
+                raise ValueError(f"Más de un operador en: {text}")
+            if dangling:
+                raise ValueError(f"Falta un término antes de '{m.group(5)}' en: {text}")
+            op = _OPERATORS[m.group(5)]
+            side, sign, expect_term = -1.0, 1.0, True
+        else:
+            raise ValueError(f"Carácter no válido '{m.group(7)}' en: {text}")
+
+    if dangling:
+        raise ValueError(f"La expresión termina sin término: {text}")
+    return terms, op, constant + 0.0
+
+
+def parse_objective(text: str) -> Tuple[Optional[str], Dict[str, float]]:
+    """
+    Parsea una función objetivo como "max z = 3x1 + 5x2" o "minimizar 2x + y".
+
+    La palabra inicial (max, maximizar, min, minimizar, ...) y el nombre de
+    la función ("z =") son opcionales.
+
+    Returns:
+        tuple: (tipo, términos) con tipo 'max', 'min' o None si no se indicó
+    """
+    opt_type = None
+    body = text.strip()
+    m = _TOKEN.match(body)
+    if m and m.lastindex == 3 and not m.group(1) and m.group(2) is None:
+        word = m.group(3).lower()
+        if word.startswith('max'):
+            opt_type, body = 'max', body[m.end():]
+        elif word.startswith('min'):
+            opt_type, body = 'min', body[m.end():]
+    body = body.lstrip().lstrip(':')  # "max: 3x + 2y"
+
+    # Nombre de la función objetivo: "z = ..."
+    if '=' in body:
+        name, _, expr = body.partition('=')
+        if not name.strip() or re.fullmatch(r'\s*[^\W\d]\w*\s*', name):
+            body = expr
+
+    terms, op, _ = parse_linear(body)
+    if op is not None:
+        raise ValueError(f"La función objetivo no debe tener operador de comparación: {text}")
+    return opt_type, terms
+
+
+def parse_constraint(text: str) -> Tuple[Dict[str, float], str, float]:
+    """
+    Parsea una restricción como "3x1 + 4x2 >= 12" o "x <= y".
+
+    Returns:
+        tuple: (términos, operador, lado_derecho)
+    """
+    terms, op, rhs = parse_linear(text)
+    if op is None:
+        raise ValueError(f"No se encontró operador en la restricción: {text.strip()}")
+    return terms, op, rhs
+
+
+def is_nonnegativity(terms: Dict[str, float], op: str, rhs: float) -> bool:
+    """Indica si la restricción es de la forma x >= 0 (una sola variable)."""
+    if len(terms) != 1 or abs(rhs) > 1e-12:
+        return False
+    coef = next(iter(terms.values()))
+    return (op == '>=' and coef > 0) or (op == '<=' and coef < 0)
+
+
+def indexed_variable(name: str) -> Optional[int]:
+    """Índice de una variable x1, x2, ... (None si el nombre no tiene esa forma)."""
+    m = _X_INDEX.fullmatch(name)
+    return int(m.group(1)) if m else None
+
+
+def max_variable_index(terms: Dict[str, float]) -> int:
+    """
+    Mayor índice de las variables x1..xn de un mapa de términos.
+
+    Raises:
+        ValueError: si hay variables que no tienen la forma xN
+    """
+    n_vars = 0
+    for name in terms:
+        index = indexed_variable(name)
+        if index is None or index < 1:
+            raise ValueError(f"Variable no válida '{name}': usa x1, x2, ...")
+        n_vars = max(n_vars, index)
+    return n_vars
+
+
+def dense_coefficients(terms: Dict[str, float], n_vars: int) -> List[float]:
+    """
+    Convierte un mapa de términos de variables x1..xn en una lista densa.
+
+    Las variables con índice mayor que n_vars se ignoran.
+    """
+    row = [0.0] * n_vars
+    for name, coef in terms.items():
+        index = indexed_variable(name)
+        if index is None or index < 1:
+            raise ValueError(f"Variable no válida '{name}': usa x1, x2, ...")
+        if index <= n_vars:
+            row[index - 1] = coef
+    return row
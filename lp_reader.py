@@ -0,0 +1,617 @@
+# archivo: lp_reader.py
+"""
+Lectura en flujo de modelos en formato LP y MPS libre.
+
+El archivo se recorre línea por línea (nunca se guarda el texto completo) y la
+matriz de restricciones se construye de forma incremental como tripletas
+dispersas (fila, columna, valor). El modelo resultante se puede resolver con
+los métodos existentes mediante solve_model.
+
+Uso:
+    model = read_model('modelo.mps')
+    result = solve_model(model)
+
+    python lp_reader.py modelo.lp [--method two_phase]
+"""
+
+import gzip
+import io
+import math
+import os
+import re
+from array import array
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Union
+
+import numpy as np
+
+import lp_parser
+from sparse_matrix import CSRMatrix
+
+FORMATS = ('lp', 'mps')
+
+
+class _ModelBuilder:
+    """Acumula filas, columnas y coeficientes a medida que se leen."""
+
+    def __init__(self, name_pattern: Optional['re.Pattern'] = None):
+        """
+        Args:
+            name_pattern: si se indica, los nombres de columna nuevos deben
+                          cumplirlo completo (si no, ValueError)
+        """
+        self.name_pattern = name_pattern
+        self.columns: Dict[str, int] = {}
+        self.objective: Dict[int, float] = {}
+        self.objective_constant = 0.0
+        self.row_names: List[str] = []
+        self.types: List[str] = []
+        self.rhs: List[float] = []
+        self.rows = array('l')
+        self.cols = array('l')
+        self.values = array('d')
+        self.lower: Dict[int, float] = {}
+        self.upper: Dict[int, float] = {}
+        self.ranges: Dict[int, float] = {}
+        self.integer: Dict[int, None] = {}  # conserva el orden de aparición
+
+    def column(self, name: str) -> int:
+        index = self.columns.get(name)
+        if index is None:
+            if self.name_pattern is not None and not self.name_pattern.fullmatch(name):
+                raise ValueError(f"Nombre de variable no válido: '{name}'")
+            index = self.columns[name] = len(self.columns)
+        return index
+
+    def add_row(self, name: Optional[str], op: str, rhs: float = 0.0) -> int:
+        row = len(self.row_names)
+        self.row_names.append(name or f'R{row + 1}')
+        self.types.append(op)
+        self.rhs.append(rhs)
+        return row
+
+    def add_entry(self, row: int, name: str, value: float):
+        if value != 0.0:
+            self.rows.append(row)
+            self.cols.append(self.column(name))
+            self.values.append(value)
+
+    def add_terms(self, row: int, terms: Dict[str, float]):
+        column = self.column
+        nonzero = [(column(name), value) for name, value in terms.items() if value != 0.0]
+        self.rows.extend([row] * len(nonzero))
+        self.cols.extend(col for col, _ in nonzero)
+        self.values.extend(value for _, value in nonzero)
+
+    def add_objective(self, name: str, value: float):
+        col = self.column(name)
+        self.objective[col] = self.objective.get(col, 0.0) + value
+
+    def _expand_ranges(self):
+        """Convierte cada restricción con rango en dos desigualdades."""
+        if not self.ranges:
+            return
+        rows = np.array(self.rows, dtype=np.int64)
+        for row, value in self.ranges.items():
+            op, rhs = self.types[row], self.rhs[row]
+            if op == '<=':
+                extra = ('>=', rhs - abs(value))
+            elif op == '>=':
+                extra = ('<=', rhs + abs(value))
+            elif value >= 0:   # igualdad: rhs <= fila <= rhs + |R|
+                self.types[row] = '>='
+                extra = ('<=', rhs + value)
+            else:              # igualdad: rhs - |R| <= fila <= rhs
+                self.types[row] = '<='
+                extra = ('>=', rhs + value)
+            new_row = self.add_row(f'{self.row_names[row]}_rango', *extra)
+            for k in np.flatnonzero(rows == row):
+                self.rows.append(new_row)
+                self.cols.append(self.cols[k])
+                self.values.append(self.values[k])
+
+    def _expand_bounds(self):
+        """
+        Convierte las cotas en restricciones explícitas.
+
+        Los métodos simplex suponen x >= 0, así que las cotas superiores y las
+        inferiores positivas se agregan como filas; las cotas inferiores
+        negativas (variables libres) no se pueden representar.
+        """
+        names = list(self.columns)
+        for col in sorted(set(self.lower) | set(self.upper)):
+            lower = self.lower.get(col, 0.0)
+            upper = self.upper.get(col, math.inf)
+            if lower < 0:
+                raise ValueError(f"La variable '{names[col]}' tiene cota inferior negativa o es libre; "
+                                 f"los métodos simplex suponen variables no negativas")
+            if lower > upper:
+                raise ValueError(f"Cotas incompatibles para '{names[col]}': {lower:g} > {upper:g}")
+            if lower == upper:
+                self.add_entry(self.add_row(f'{names[col]}_fija', '=', lower), names[col], 1.0)
+                continue
+            if lower > 0:
+                self.add_entry(self.add_row(f'{names[col]}_inf', '>=', lower), names[col], 1.0)
+            if upper < math.inf:
+                self.add_entry(self.add_row(f'{names[col]}_sup', '<=', upper), names[col], 1.0)
+
+    def finish(self, name: str, opt_type: str) -> Dict[str, Any]:
+        self._expand_ranges()
+        self._expand_bounds()
+
+        n_vars = len(self.columns)
+        objective = np.zeros(n_vars)
+        for col, value in self.objective.items():
+            objective[col] = value
+        names = list(self.columns)
+
+        return {
+            'name': name,
+            'opt_type': opt_type,
+            'variables': names,
+            'objective': objective,
+            'objective_constant': self.objective_constant + 0.0,
+            'constraint_names': self.row_names,
+            'types': self.types,
+            'rhs': np.array(self.rhs, dtype=float),
+            'rows': np.array(self.rows, dtype=np.int64),
+            'cols': np.array(self.cols, dtype=np.int64),
+            'values': np.array(self.values, dtype=float),
+            'shape': (len(self.row_names), n_vars),
+            'integer': [names[col] for col in self.integer],
+        }
+
+
+@contextmanager
+def _open_text(source: Union[str, os.PathLike, TextIO, io.IOBase]) -> Iterator[TextIO]:
+    """Abre una ruta (también .gz) o envuelve un archivo ya abierto como texto."""
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        if path.endswith('.gz'):
+            f = gzip.open(path, 'rt', encoding='utf-8')
+        else:
+            f = open(path, encoding='utf-8')
+        with f:
+            yield f
+    elif isinstance(source, io.TextIOBase):
+        yield source
+    else:
+        # Archivo binario (por ejemplo, una subida de Flask)
+        wrapper = io.TextIOWrapper(source, encoding='utf-8')
+        try:
+            yield wrapper
+        finally:
+            wrapper.detach()  # no cerrar el archivo del llamador
+
+
+def _model_name(source) -> str:
+    name = source if isinstance(source, (str, os.PathLike)) else getattr(source, 'name', '')
+    return os.path.basename(os.fspath(name)) if isinstance(name, (str, os.PathLike)) else ''
+
+
+def detect_format(source) -> str:
+    """Formato ('lp' o 'mps') según la extensión de una ruta o nombre de archivo."""
+    name = _model_name(source).lower()
+    if name.endswith('.gz'):
+        name = name[:-3]
+    if name.endswith('.mps'):
+        return 'mps'
+    return 'lp'
+
+
+# --------------------------------------------------------------------------
+# Formato LP
+# --------------------------------------------------------------------------
+
+_LP_SECTION = re.compile(r'''^\s*(?:
+      (?P<sense>max(?:imi[sz]e|imum)?|min(?:imi[sz]e|imum)?)
+    | (?P<constraints>subject\s+to|such\s+that|s\.t\.|st\.?)
+    | (?P<bounds>bounds?)
+    | (?P<integer>gen(?:erals?)?|integers?|bin(?:ary|aries)?)
+    | (?P<unsupported>semi-continuous|semis?|sos)
+    | (?P<end>end)
+    )(?=\s|$)''', re.IGNORECASE | re.VERBOSE)
+
+_LP_LABEL = re.compile(r'^\s*([^\s:<>=]+)\s*:(?!=)')
+_LP_STRICT = re.compile(r'(?<![<>=])([<>])(?!=)')   # "<" y ">" equivalen a "<=" y ">="
+_LP_OPERATOR = re.compile(r'(<=|>=|=<|=>|=)')
+_LP_ENDS_WITH_TERM = re.compile(r'[^\W\d]\w*\s*$')
+_LP_NAME = re.compile(r'[^\W\d]\w*')   # nombres de variable aceptados
+
+
+def _lp_bound(builder: _ModelBuilder, line: str):
+    """Procesa una línea de la sección Bounds."""
+    words = line.split()
+    if len(words) == 2 and words[1].lower() == 'free':
+        builder.lower[builder.column(words[0])] = -math.inf
+        return
+
+    parts = [p.strip() for p in _LP_OPERATOR.split(_LP_STRICT.sub(r'\1=', line))]
+    if len(parts) == 5:   # l <= x <= u
+        low, op1, name, op2, high = parts
+        if op1 not in ('<=', '=<') or op2 not in ('<=', '=<'):
+            raise ValueError(f"Cota no válida: {line.strip()}")
+        col = builder.column(name)
+        builder.lower[col] = float(low)   # float acepta inf, -inf e infinity
+        builder.upper[col] = float(high)
+        return
+    if len(parts) != 3:
+        raise ValueError(f"Cota no válida: {line.strip()}")
+
+    left, op, right = parts
+    op = {'=<': '<=', '=>': '>='}.get(op, op)
+    try:
+        value = float(right)
+        name = left
+    except ValueError:
+        # "valor <= x" se lee como "x >= valor"
+        value = float(left)
+        name = right
+        op = {'<=': '>=', '>=': '<='}.get(op, op)
+    col = builder.column(name)
+    if op == '<=':
+        builder.upper[col] = value
+    elif op == '>=':
+        builder.lower[col] = value
+    else:
+        builder.lower[col] = builder.upper[col] = value
+
+
+def read_lp(source) -> Dict[str, Any]:
+    """
+    Lee un modelo en formato LP (estilo CPLEX) línea por línea.
+
+    Se admiten las secciones Maximize/Minimize, Subject To, Bounds,
+    General/Integer/Binary y End. Las variables se nombran como en el
+    formulario (letras, dígitos y '_'; otros nombres dan ValueError); los
+    comentarios empiezan con '\\'.
+
+    Returns:
+        dict: modelo con las claves de _ModelBuilder.finish
+    """
+    builder = _ModelBuilder(name_pattern=_LP_NAME)
+    opt_type = None
+    section = None
+    buffer = ''          # sentencia incompleta (puede abarcar varias líneas)
+    objective_label = True
+
+    def flush_objective(text):
+        terms, op, constant = lp_parser.parse_linear(text)
+        if op is not None:
+            raise ValueError(f"La función objetivo no debe tener operador de comparación: {text.strip()}")
+        for name, coef in terms.items():
+            builder.add_objective(name, coef)
+        builder.objective_constant -= constant
+
+    def flush_constraint(text):
+        label = _LP_LABEL.match(text)
+        name = None
+        if label:
+            name, text = label.group(1), text[label.end():]
+        terms, op, rhs = lp_parser.parse_constraint(text)
+        builder.add_terms(builder.add_row(name, op, rhs), terms)
+
+    def flush():
+        nonlocal buffer
+        if buffer.strip():
+            if section == 'objective':
+                flush_objective(buffer)
+            elif section == 'constraints':
+                flush_constraint(buffer)
+        buffer = ''
+
+    with _open_text(source) as f:
+        for raw in f:
+            line = raw.split('\\', 1)[0]
+            if not line.strip():
+                continue
+
+            m = _LP_SECTION.match(line)
+            if m:
+                flush()
+                kind = m.lastgroup
+                rest = line[m.end():]
+                if kind == 'sense':
+                    opt_type = 'max' if m.group('sense').lower().startswith('max') else 'min'
+                    section, objective_label = 'objective', True
+                elif kind == 'unsupported':
+                    raise ValueError(f"Sección no soportada: {m.group(kind)}")
+                elif kind == 'end':
+                    section = None
+                    break
+                else:
+                    section = kind
+                    if kind == 'integer':
+                        binary = m.group(kind).lower().startswith('bin')
+                        section = 'binary' if binary else 'integer'
+                if not rest.strip():
+                    continue
+                line = rest
+
+            if section == 'objective':
+                if objective_label:
+                    label = _LP_LABEL.match(line)
+                    if label:
+                        line = line[label.end():]
+                    objective_label = False
+                buffer += ' ' + line
+                if _LP_ENDS_WITH_TERM.search(buffer):
+                    flush()
+            elif section == 'constraints':
+                if buffer and _LP_LABEL.match(line):
+                    flush()  # una etiqueta siempre empieza una restricción nueva
+                buffer += ' ' + _LP_STRICT.sub(r'\1=', line)
+                op = _LP_OPERATOR.search(buffer)
+                if op and buffer[op.end():].strip():
+                    flush()  # ya se leyó el lado derecho
+            elif section == 'bounds':
+                _lp_bound(builder, line)
+            elif section in ('integer', 'binary'):
+                for name in line.split():
+                    col = builder.column(name)
+                    builder.integer[col] = None
+                    if section == 'binary':
+                        builder.lower[col], builder.upper[col] = 0.0, 1.0
+            else:
+                raise ValueError(f"Línea fuera de una sección: {line.strip()}")
+        flush()
+
+    if opt_type is None:
+        raise ValueError("No se encontró la sección Maximize o Minimize")
+    return builder.finish(_model_name(source), opt_type)
+
+
+# --------------------------------------------------------------------------
+# Formato MPS libre
+# --------------------------------------------------------------------------
+
+_MPS_ROW_TYPES = {'L': '<=', 'G': '>=', 'E': '='}
+_MPS_SECTIONS = {'NAME', 'OBJSENSE', 'OBJSENS', 'ROWS', 'COLUMNS', 'RHS', 'RANGES', 'BOUNDS', 'ENDATA'}
+
+
+def read_mps(source) -> Dict[str, Any]:
+    """
+    Lee un modelo en formato MPS libre línea por línea.
+
+    Se admiten las secciones NAME, OBJSENSE, ROWS, COLUMNS (con marcadores
+    de variables enteras), RHS, RANGES, BOUNDS y ENDATA. La primera fila N
+    es la función objetivo; las demás filas N se ignoran.
+
+    Returns:
+        dict: modelo con las claves de _ModelBuilder.finish
+    """
+    builder = _ModelBuilder()
+    name = ''
+    opt_type = 'min'
+    section = None
+    row_index: Dict[str, int] = {}
+    objective_row = None
+    free_rows = set()    # filas N adicionales
+    integer_block = False
+
+    def pairs(tokens, line):
+        if len(tokens) % 2:
+            raise ValueError(f"Línea MPS incompleta: {line.strip()}")
+        for k in range(0, len(tokens), 2):
+            yield tokens[k], float(tokens[k + 1])
+
+    with _open_text(source) as f:
+        for line in f:
+            if not line.strip() or line.startswith('*'):
+                continue
+            tokens = line.split()
+            head = tokens[0].upper()
+
+            if not line[0].isspace() and head in _MPS_SECTIONS:
+                section = head
+                if head == 'NAME':
+                    name = ' '.join(tokens[1:])
+                elif head in ('OBJSENSE', 'OBJSENS') and len(tokens) > 1:
+                    opt_type = 'max' if tokens[1].upper().startswith('MAX') else 'min'
+                elif head == 'ENDATA':
+                    break
+                continue
+
+            if section in ('OBJSENSE', 'OBJSENS'):
+                opt_type = 'max' if head.startswith('MAX') else 'min'
+            elif section == 'ROWS':
+                row_type, row_name = head, tokens[1]
+                if row_type == 'N':
+                    if objective_row is None:
+                        objective_row = row_name
+                    else:
+                        free_rows.add(row_name)
+                elif row_type in _MPS_ROW_TYPES:
+                    row_index[row_name] = builder.add_row(row_name, _MPS_ROW_TYPES[row_type])
+                else:
+                    raise ValueError(f"Tipo de fila MPS no válido: {line.strip()}")
+            elif section == 'COLUMNS':
+                if len(tokens) >= 3 and tokens[1].strip("'").upper() == 'MARKER':
+                    integer_block = tokens[2].strip("'").upper() == 'INTORG'
+                    continue
+                col_name = tokens[0]
+                col = builder.column(col_name)
+                if integer_block:
+                    builder.integer[col] = None
+                for row_name, value in pairs(tokens[1:], line):
+                    if row_name == objective_row:
+                        builder.add_objective(col_name, value)
+                    elif row_name in row_index:
+                        builder.add_entry(row_index[row_name], col_name, value)
+                    elif row_name not in free_rows:
+                        raise ValueError(f"Fila desconocida '{row_name}' en: {line.strip()}")
+            elif section in ('RHS', 'RANGES'):
+                # El nombre del conjunto es opcional: se detecta por la paridad
+                entries = tokens[1:] if len(tokens) % 2 else tokens
+                for row_name, value in pairs(entries, line):
+                    if row_name == objective_row:
+                        if section == 'RHS':
+                            builder.objective_constant = -value
+                    elif row_name in row_index:
+                        if section == 'RHS':
+                            builder.rhs[row_index[row_name]] = value
+                        else:
+                            builder.ranges[row_index[row_name]] = value
+                    elif row_name not in free_rows:
+                        raise ValueError(f"Fila desconocida '{row_name}' en: {line.strip()}")
+            elif section == 'BOUNDS':
+                bound_type = head
+                has_value = bound_type not in ('FR', 'MI', 'PL', 'BV')
+                expected = 4 if has_value else 3
+                col_name = tokens[2] if len(tokens) >= expected else tokens[1]
+                value = float(tokens[-1]) if has_value else 0.0
+                col = builder.column(col_name)
+                if bound_type in ('UP', 'UI'):
+                    builder.upper[col] = value
+                    if value < 0 and builder.lower.get(col, 0.0) == 0.0:
+                        builder.lower[col] = -math.inf
+                elif bound_type in ('LO', 'LI'):
+                    builder.lower[col] = value
+                elif bound_type == 'FX':
+                    builder.lower[col] = builder.upper[col] = value
+                elif bound_type == 'FR' or bound_type == 'MI':
+                    builder.lower[col] = -math.inf
+                elif bound_type == 'PL':
+                    builder.upper[col] = math.inf
+                elif bound_type == 'BV':
+                    builder.lower[col], builder.upper[col] = 0.0, 1.0
+                else:
+                    raise ValueError(f"Tipo de cota MPS no soportado: {line.strip()}")
+                if bound_type in ('UI', 'LI', 'BV'):
+                    builder.integer[col] = None
+            else:
+                raise ValueError(f"Línea MPS fuera de una sección: {line.strip()}")
+
+    if objective_row is None:
+        raise ValueError("El modelo MPS no tiene fila objetivo (tipo N)")
+    return builder.finish(name or _model_name(source), opt_type)
+
+
+def read_model(source, file_format: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Lee un modelo LP o MPS desde una ruta (también .gz) o un archivo abierto.
+
+    Args:
+        source: ruta o archivo (de texto o binario)
+        file_format: 'lp' o 'mps'; por defecto se deduce de la extensión
+
+    Returns:
+        dict: modelo disperso ('objective', 'rows', 'cols', 'values', 'rhs',
+              'types', 'variables', 'constraint_names', 'opt_type', ...)
+    """
+    file_format = (file_format or detect_format(source)).lower()
+    if file_format not in FORMATS:
+        raise ValueError(f"Formato no soportado: {file_format} (usa {', '.join(FORMATS)})")
+    return read_mps(source) if file_format == 'mps' else read_lp(source)
+
+
+def model_matrix(model: Dict[str, Any]) -> CSRMatrix:
+    """Matriz de restricciones dispersa (los coeficientes repetidos se suman)."""
+    return CSRMatrix.from_coo(model['rows'], model['cols'], model['values'], model['shape'])
+
+
+def dense_matrix(model: Dict[str, Any]) -> np.ndarray:
+    """Matriz de restricciones densa (los coeficientes repetidos se suman)."""
+    return model_matrix(model).to_dense()
+
+
+def solve_model(model: Dict[str, Any], method: str = 'simplex', max_iterations: Optional[int] = None,
+                engine: str = 'tableau', pricing: str = 'dantzig', trace: str = 'summary',
+                budget=None) -> Dict:
+    """
+    Resuelve un modelo leído con read_model usando los métodos existentes.
+
+    La matriz se entrega dispersa (CSRMatrix); no se arma una versión densa.
+
+    Args:
+        method: 'simplex' (SimplexTableau) o 'two_phase' (TwoPhaseSimplexSolver)
+        max_iterations: límite de iteraciones (por fase) del método 'simplex';
+                        el límite total lo fija budget
+        engine: motor del método 'simplex': 'tableau' o 'revised'
+                (ver simplex_tableau.ENGINES)
+        pricing: regla de la variable entrante del método 'simplex'
+                 (ver pricing.PRICING_RULES)
+        trace: historial de iteraciones: 'summary' (por defecto), 'none' o
+               'full' (tableau de cada iteración; solo para modelos pequeños)
+        budget: límites de iteraciones, tiempo y memoria (solver_budget.SolverBudget)
+
+    Returns:
+        dict: el resultado del método; 'solution' usa los nombres del modelo y
+              los valores del objetivo incluyen su término constante. Si el
+              modelo declara variables enteras (General/Binary o MARKER) se
+              resuelve la relajación lineal y se agregan 'relaxation' (True) y
+              'warning'
+    """
+    from simplex_tableau import ENGINES
+    from two_phase_simplex import TwoPhaseSimplexSolver
+
+    # Los métodos suponen RHS no negativo: se invierten las filas negativas
+    b = model['rhs']
+    flip = b < 0
+    A = model_matrix(model).scale_rows(np.where(flip, -1.0, 1.0))
+    b = np.abs(b)
+    swap = {'<=': '>=', '>=': '<=', '=': '='}
+    types = [swap[t] if f else t for t, f in zip(model['types'], flip)]
+
+    c = model['objective'].tolist()
+    if method == 'simplex':
+        if engine not in ENGINES:
+            raise ValueError(f"Motor no soportado: {engine} (usa {', '.join(ENGINES)})")
+        solver = ENGINES[engine](c, A, b.tolist(), types, model['opt_type'], pricing=pricing,
+                                 trace=trace, budget=budget)
+        result = solver.solve(max_iterations)
+    elif method == 'two_phase':
+        result = TwoPhaseSimplexSolver.from_arrays(c, A, b.tolist(), types, model['opt_type'],
+                                                   trace, budget).solve()
+    else:
+        raise ValueError(f"Método no soportado: {method} (usa 'simplex' o 'two_phase')")
+
+    if result.get('solution'):
+        names = model['variables']
+        result['solution'] = {names[int(key[1:]) - 1]: value
+                              for key, value in result['solution'].items()}
+    # El término constante del objetivo no cambia el óptimo, solo su valor
+    constant = model['objective_constant']
+    for key in ('optimal_value', 'objective_value'):
+        if constant and result.get(key) is not None:
+            result[key] = round(result[key] + constant, 4)
+    if model['integer']:
+        # Los métodos son de programación lineal: se resuelve la relajación
+        result['relaxation'] = True
+        result['warning'] = (f"El modelo tiene {len(model['integer'])} variables enteras o binarias; "
+                             "se resolvió su relajación lineal (sin exigir valores enteros).")
+    return result
+
+
+if __name__ == '__main__':
+    import argparse
+
+    from solver_budget import DEFAULT_MAX_ITERATIONS, SolverBudget
+
+    parser = argparse.ArgumentParser(description='Lee un modelo LP/MPS y lo resuelve')
+    parser.add_argument('path', help='archivo .lp o .mps (también .gz)')
+    parser.add_argument('--format', choices=FORMATS, help='formato (por defecto, según la extensión)')
+    parser.add_argument('--method', choices=('simplex', 'two_phase'), default='simplex')
+    parser.add_argument('--engine', choices=('tableau', 'revised'), default='tableau',
+                        help="motor del método simplex ('revised' para modelos grandes)")
+    parser.add_argument('--pricing', choices=('dantzig', 'steepest_edge', 'devex', 'bland'),
+                        default='dantzig', help='regla de la variable entrante')
+    parser.add_argument('--trace', choices=('none', 'summary', 'full'), default='summary',
+                        help="historial de iteraciones ('none' para solo el resultado)")
+    parser.add_argument('--time-limit', type=float, help='segundos disponibles para resolver')
+    parser.add_argument('--max-iterations', type=int, help='pivoteos permitidos en total')
+    args = parser.parse_args()
+
+    model = read_model(args.path, args.format)
+    rows, cols = model['shape']
+    print(f"Modelo {model['name']}: {rows} restricciones, {cols} variables, "
+          f"{len(model['values'])} coeficientes")
+    budget = SolverBudget(max_iterations=args.max_iterations or DEFAULT_MAX_ITERATIONS,
+                          time_limit=args.time_limit)
+    result = solve_model(model, args.method, engine=args.engine, pricing=args.pricing,
+                         trace=args.trace, budget=budget)
+    print(f"Estado: {result.get('status')}  Z = {result.get('optimal_value')}")
+    if result.get('warning'):
+        print(result['warning'])
+    if not result.get('success'):
+        print(result.get('error'))
@@ -4,15 +4,31 @@ Módulo para resolver problemas de programación lineal con el método gráfico.
 Contiene las funciones necesarias para parsear, calcular y graficar problemas de LP.
 """
 
-import re
+import math
+from collections import deque
 import numpy as np
-import matplotlib.pyplot as plt
 import matplotlib
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import base64
 from io import BytesIO
+from graphic_cache import graphic_key as graphic_cache_key
+import lp_parser
 
 # Configurar matplotlib para no mostrar ventanas (modo backend)
 matplotlib.use('Agg')
+# En SVG guardar el texto como texto y no como trazos (archivos mucho más pequeños)
+# y usar identificadores internos deterministas. Se configura una sola vez aquí:
+# rc_context modifica el estado global y no es seguro entre hilos.
+matplotlib.rcParams['svg.fonttype'] = 'none'
+matplotlib.rcParams['svg.hashsalt'] = 'lp_solver'
+
+def _xy_coefficients(terms, text):
+    """Coeficientes (x, y) de un mapa de términos; solo se admiten x e y."""
+    unknown = [name for name in terms if name not in ('x', 'y')]
+    if unknown:
+        raise ValueError(f"Variable no válida '{unknown[0]}' en: {text.strip()} (usa x e y)")
+    return terms.get('x', 0.0), terms.get('y', 0.0)
 
 def parse_objective(s):
     """
@@ -26,38 +42,11 @@ def parse_objective(s):
         tuple: (tipo_optimización, [coeficiente_x, coeficiente_y])
         tipo_optimización: 'max' o 'min'
     """
-    s_low = s.lower()
-    if 'max' in s_low:
-        opt_type = 'max'
-    elif 'min' in s_low:
-        opt_type = 'min'
-    else:
+    opt_type, terms = lp_parser.parse_objective(s)
+    if opt_type is None:
         raise ValueError("No se encontró 'max' o 'min' en la función objetivo.")
     
-    # Extraer la parte después del signo =
-    if '=' in s:
-        rhs = s.split('=')[1]
-    else:
-        rhs = s
-    
-    def get_coeff(var, text):
-        """Extrae el coeficiente de una variable del texto"""
-        t = text.replace(' ', '')
-        m = re.search(r'([+-]?\d*\.?\d*)' + var, t)
-        if not m:
-            return 0.0
-        num = m.group(1)
-        if num in ['', '+', None]:
-            return 1.0
-        if num == '-':
-            return -1.0
-        return float(num)
-    
-    # Obtener coeficientes de x e y
-    a = get_coeff('x', rhs)
-    b = get_coeff('y', rhs)
-    
-    return opt_type, [a, b]
+    return opt_type, list(_xy_coefficients(terms, s))
 
 def parse_constraint(s):
     """
@@ -69,103 +58,142 @@ def parse_constraint(s):
       "x + y = 10"
       "x ≥ 0"  (símbolos matemáticos)
       "y ≤ 5"
+      "x <= y"  (variables en ambos lados)
       
     Returns:
         tuple: (coef_x, coef_y, operador, valor_derecho)
     """
-    s = s.strip()
-    
-    # Reemplazar símbolos matemáticos por equivalentes ASCII
-    s = s.replace('≤', '<=').replace('≥', '>=').replace('≠', '!=')
-    
-    # Buscar el operador de comparación (después de normalizar símbolos)
-    m = re.search(r'(<=|>=|=)', s)
-    if not m:
-        raise ValueError(f"No se encontró operador en la restricción: {s}")
-    
-    op = m.group(1)
-    
-    def get_coeff(var, text):
-        """Extrae el coeficiente de una variable del texto"""
-        t = text.replace(' ', '').lower()  # Normalizar texto
-        
-        # Buscar patrones como: x, 1x, -x, 2x, 3.5x, +x, etc.
-        patterns = [
-            r'([+-]?\d*\.?\d*)' + var + r'(?!\w)',  # Patrón general
-            r'^' + var + r'(?!\w)',  # Variable sola al inicio
-            r'([+-])' + var + r'(?!\w)'  # Variable con signo
-        ]
-        
-        for pattern in patterns:
-            mm = re.search(pattern, t)
-            if mm:
-                if len(mm.groups()) == 0:  # Variable sola
-                    return 1.0
-                
-                num = mm.group(1)
-                if num in ['', '+', None]:
-                    return 1.0
-                if num == '-':
-                    return -1.0
-                try:
-                    return float(num)
-                except (ValueError, TypeError):
-                    continue
-        
-        return 0.0  # Variable no encontrada
-    
-    parts = re.split(r'(<=|>=|=)', s)
-    lhs = parts[0]  # lado izquierdo
-    rhs = parts[-1]  # lado derecho
-    
-    # Verificar si el lado derecho contiene variables (como x <= y)
-    if 'x' in rhs.lower() or 'y' in rhs.lower():
-        # Mover todo al lado izquierdo: x <= y se convierte en x - y <= 0
-        rhs_val = 0.0
-        # Restar los coeficientes del lado derecho
-        a_rhs = get_coeff('x', rhs)
-        b_rhs = get_coeff('y', rhs)
-        # Los coeficientes finales son: lhs - rhs
-        a_lhs = get_coeff('x', lhs)
-        b_lhs = get_coeff('y', lhs)
-        a = a_lhs - a_rhs
-        b = b_lhs - b_rhs
-    else:
-        rhs_val = float(rhs)
-        # Obtener coeficientes de x e y del lado izquierdo
-        a = get_coeff('x', lhs)
-        b = get_coeff('y', lhs)
-    
+    terms, op, rhs_val = lp_parser.parse_constraint(s)
+    a, b = _xy_coefficients(terms, s)
     return a, b, op, rhs_val
 
-def compute_vertices(constraints):
+def _constraint_dict(s):
+    """Parsea una restricción en el formato de diccionario que usa el método gráfico."""
+    a, b, op, rhs = parse_constraint(s)
+    return {'a': a, 'b': b, 'op': op, 'rhs': rhs}
+
+def _assemble_problem(objective, constraints):
+    opt_type, obj_coeffs = objective
+    return opt_type, obj_coeffs, constraints
+
+def parse_problem(objective_str, constraints_list, model_cache=None):
     """
-    Calcula los vértices de la región factible.
+    Parsea la función objetivo y las restricciones (las líneas vacías se ignoran).
+    
+    Args:
+        model_cache: ParsedModelCache opcional; con ella, los problemas
+                     repetidos no se vuelven a parsear
     
+    Returns:
+        tuple: (tipo_optimización, coeficientes, restricciones); con caché,
+               el resultado es compartido y no debe modificarse
+    """
+    if model_cache is not None:
+        return model_cache.get_or_parse('graphical', objective_str, constraints_list,
+                                        parse_objective, _constraint_dict, _assemble_problem)
+    constraints = [_constraint_dict(s) for s in constraints_list if s.strip()]
+    return _assemble_problem(parse_objective(objective_str), constraints)
+
+# Distancia por debajo de la cual dos vértices se consideran el mismo punto
+VERTEX_EPS = 1e-7
+
+class ToleranceGrid:
+    """
+    Conjunto de puntos 2D que fusiona los puntos a distancia menor que eps.
+
+    Cada punto se guarda en una celda de lado eps de una tabla hash; un punto
+    cercano solo puede estar en la misma celda o en una de las 8 vecinas, así
+    que buscar e insertar cuesta O(1) en promedio. La distancia es la máxima
+    diferencia entre coordenadas.
+    """
+
+    def __init__(self, eps=VERTEX_EPS):
+        self.eps = eps
+        self.points = []   # representantes en orden de inserción
+        self._cells = {}   # (i, j) -> índices de self.points
+
+    def _cell(self, x, y):
+        return math.floor(x / self.eps), math.floor(y / self.eps)
+
+    def find(self, x, y):
+        """Índice de un punto ya guardado a menos de eps de (x, y), o None."""
+        i, j = self._cell(x, y)
+        for di in (-1, 0, 1):
+            for dj in (-1, 0, 1):
+                for k in self._cells.get((i + di, j + dj), ()):
+                    px, py = self.points[k]
+                    if abs(px - x) <= self.eps and abs(py - y) <= self.eps:
+                        return k
+        return None
+
+    def add(self, x, y):
+        """
+        Agrega (x, y) si no hay un punto cercano.
+
+        Returns:
+            tuple: (índice del representante, True si el punto es nuevo)
+        """
+        k = self.find(x, y)
+        if k is not None:
+            return k, False
+        self.points.append((x, y))
+        self._cells.setdefault(self._cell(x, y), []).append(len(self.points) - 1)
+        return len(self.points) - 1, True
+
+    def __len__(self):
+        return len(self.points)
+
+def active_constraint_counts(vertices, constraints, tol=VERTEX_EPS):
+    """
+    Cuenta cuántas restricciones son activas (se cumplen con igualdad) en cada
+    vértice, incluyendo los ejes x = 0 e y = 0. Más de 2 indica un vértice
+    degenerado.
+
+    Returns:
+        list: un entero por vértice
+    """
+    if not vertices:
+        return []
+    rows = [(float(c['a']), float(c['b']), float(c['rhs'])) for c in constraints]
+    rows += [axis for axis in ((1.0, 0.0, 0.0), (0.0, 1.0, 0.0)) if axis not in rows]
+    rows = np.array([r for r in rows if abs(r[0]) + abs(r[1]) > 1e-12]).reshape(-1, 3)
+
+    # Distancia de cada vértice a cada recta frontera
+    norm = np.hypot(rows[:, 0], rows[:, 1])
+    V = np.asarray(vertices, dtype=float)
+    dist = np.abs(V @ rows[:, :2].T - rows[:, 2]) / norm
+    scale = np.maximum(1.0, np.abs(V).max(axis=1))
+    return [int(n) for n in np.sum(dist <= tol * scale[:, None], axis=1)]
+
+def _build_halfplanes(constraints):
+    """
+    Convierte las restricciones en líneas (para intersecciones) y en
+    desigualdades estándar ax + by <= rhs (para verificar factibilidad).
+
     Args:
         constraints: lista de diccionarios con claves 'a','b','op','rhs'
-        
+
     Returns:
-        list: lista de tuplas (x, y) representando los vértices factibles
+        tuple: (líneas, desigualdades), ambas listas de tuplas (a, b, rhs)
     """
     lines = []  # líneas para intersecciones
     ineqs = []  # desigualdades para verificar factibilidad
-    
+
     # Verificar si el usuario ya especificó restricciones de no-negatividad
     has_x_nonneg = False
     has_y_nonneg = False
-    
+
     # Procesar cada restricción
     for c in constraints:
         a, b, op, rhs = c['a'], c['b'], c['op'], c['rhs']
         lines.append((a, b, rhs))  # línea para intersección
-        
+
         # Verificar si son restricciones de no-negatividad explícitas
         if abs(a - 1) < 1e-9 and abs(b) < 1e-9 and abs(rhs) < 1e-9 and op == '>=':
             has_x_nonneg = True
         if abs(b - 1) < 1e-9 and abs(a) < 1e-9 and abs(rhs) < 1e-9 and op == '>=':
             has_y_nonneg = True
-        
+
         # Convertir a desigualdad estándar (ax + by <= rhs)
         if op == '<=':
             ineqs.append((a, b, rhs))
@@ -175,59 +203,566 @@ def compute_vertices(constraints):
             # Igualdad se convierte en dos desigualdades
             ineqs.append((a, b, rhs))
             ineqs.append((-a, -b, -rhs))
-    
+
     # Agregar líneas de los ejes para intersecciones (siempre necesarias)
     lines.append((1, 0, 0))  # x = 0
     lines.append((0, 1, 0))  # y = 0
-    
+
     # Solo agregar restricciones de no-negatividad si el usuario no las especificó
     if not has_x_nonneg:
         ineqs.append((-1, 0, 0))  # -x <= 0 => x >= 0
     if not has_y_nonneg:
         ineqs.append((0, -1, 0))  # -y <= 0 => y >= 0
 
-    vertices = []
+    return lines, ineqs
+
+def _compute_vertices_pairwise(constraints, eps=VERTEX_EPS):
+    """
+    Motor original: intersecta cada par de líneas y verifica cada candidato
+    contra todas las desigualdades. Complejidad O(n³).
+
+    Returns:
+        list: vértices factibles (x, y) en el orden en que se encuentran
+    """
+    lines, ineqs = _build_halfplanes(constraints)
+
+    unique = ToleranceGrid(eps)
     n = len(lines)
-    
+
     # Encontrar intersecciones de cada par de líneas
     for i in range(n):
         a1, b1, r1 = lines[i]
         for j in range(i+1, n):
             a2, b2, r2 = lines[j]
-            
+
             # Resolver sistema de ecuaciones lineales
             A = np.array([[a1, b1], [a2, b2]], dtype=float)
             det = np.linalg.det(A)
-            
+
             # Saltar si las líneas son paralelas
             if abs(det) < 1e-9:
                 continue
-                
+
             rhs = np.array([r1, r2], dtype=float)
             sol = np.linalg.solve(A, rhs)
             x, y = sol[0], sol[1]
-            
+
             # Verificar que la solución sea válida
             if not np.isfinite(x) or not np.isfinite(y):
                 continue
-            
+
             # Verificar que el punto satisfaga todas las restricciones
             feasible = True
             for ai, bi, ri in ineqs:
                 if ai * x + bi * y > ri + 1e-7:  # tolerancia numérica
                     feasible = False
                     break
-            
-            # Agregar vértice si es factible y único
+
+            # Agregar vértice si es factible y no hay otro a menos de eps
             if feasible:
-                rx = round(float(x), 9)
-                ry = round(float(y), 9)
-                if (rx, ry) not in vertices:
-                    vertices.append((rx, ry))
+                unique.add(round(float(x), 9), round(float(y), 9))
+
+    return unique.points
+
+def _compute_vertices_vectorized(constraints, max_chunk_elements=4_000_000, eps=VERTEX_EPS):
+    """
+    Mismo resultado que el motor por parejas, pero vectorizado con NumPy:
+    todas las parejas de líneas se resuelven a la vez con la regla de Cramer
+    y la factibilidad se verifica con una sola prueba matricial A @ P <= b.
+
+    Las parejas se procesan por bloques de filas para que la matriz de
+    factibilidad (desigualdades × parejas) no supere max_chunk_elements.
+
+    Returns:
+        list: vértices factibles (x, y) en el mismo orden que el motor por parejas
+    """
+    lines, ineqs = _build_halfplanes(constraints)
+    L = np.array(lines, dtype=float)
+    G = np.array(ineqs, dtype=float)
+    G_ab, G_r = G[:, :2], G[:, 2:] + 1e-7  # tolerancia numérica
+
+    n = len(L)
+    pairs_per_chunk = max(1, max_chunk_elements // max(len(G), 1))
+    rows_per_chunk = max(1, pairs_per_chunk // n)
+
+    found = []
+    for start in range(0, n - 1, rows_per_chunk):
+        stop = min(start + rows_per_chunk, n - 1)
+        # Parejas (i, j) con i < j, en el mismo orden que los bucles anidados
+        I, J = np.nonzero(np.arange(start, stop)[:, None] < np.arange(n)[None, :])
+        I += start
+        a1, b1, r1 = L[I, 0], L[I, 1], L[I, 2]
+        a2, b2, r2 = L[J, 0], L[J, 1], L[J, 2]
+
+        # Regla de Cramer para todas las parejas, descartando las paralelas
+        det = a1 * b2 - a2 * b1
+        ok = np.abs(det) >= 1e-9
+        det = det[ok]
+        x = (r1[ok] * b2[ok] - r2[ok] * b1[ok]) / det
+        y = (a1[ok] * r2[ok] - a2[ok] * r1[ok]) / det
+
+        finite = np.isfinite(x) & np.isfinite(y)
+        P = np.vstack((x[finite], y[finite]))
+
+        # Un punto es factible si satisface todas las desigualdades
+        feasible = np.all(G_ab @ P <= G_r, axis=0)
+        found.append(np.round(P[:, feasible].T, 9) + 0.0)
+
+    if not found:
+        return []
+    # Fusionar puntos cercanos conservando el orden de aparición
+    unique = ToleranceGrid(eps)
+    for x, y in np.concatenate(found).tolist():
+        unique.add(x, y)
+    return unique.points
+
+def _line_intersection(h1, h2):
+    """Intersección de las rectas frontera de dos semiplanos (a, b, r)."""
+    a1, b1, r1 = h1[0], h1[1], h1[2]
+    a2, b2, r2 = h2[0], h2[1], h2[2]
+    det = a1 * b2 - a2 * b1
+    return (r1 * b2 - r2 * b1) / det, (a1 * r2 - a2 * r1) / det
+
+def _is_outside(h, p, tol=1e-7):
+    """Indica si el punto p viola el semiplano h (a, b, r) más allá de la tolerancia."""
+    return h[0] * p[0] + h[1] * p[1] > h[2] + tol
+
+def compute_feasible_polygon(constraints, eps=VERTEX_EPS):
+    """
+    Calcula la región factible como intersección de semiplanos en O(n log n).
+
+    Los semiplanos se ordenan por ángulo y se recorren con una cola doble
+    (deque), descartando los que quedan redundantes. Para poder detectar
+    regiones no acotadas se agrega una caja de contención muy grande: los
+    vértices que tocan la caja no son vértices reales del problema.
+
+    Args:
+        constraints: lista de diccionarios con claves 'a','b','op','rhs'
+
+    Returns:
+        tuple: (vértices, estado)
+            vértices: lista de tuplas (x, y) en orden antihorario sobre la frontera
+            estado: 'bounded', 'unbounded' o 'empty'
+    """
+    _, ineqs = _build_halfplanes(constraints)
+    # x >= 0, y >= 0 siempre forman parte de la región
+    ineqs.append((-1.0, 0.0, 0.0))
+    ineqs.append((0.0, -1.0, 0.0))
+
+    # Normalizar semiplanos para que la tolerancia sea una distancia
+    halfplanes = []
+    max_dist = 1.0
+    for a, b, r in ineqs:
+        norm = np.hypot(a, b)
+        if norm < 1e-12:
+            # 0x + 0y <= r: siempre cierta o siempre falsa
+            if r < -1e-7:
+                return [], 'empty'
+            continue
+        a, b, r = a / norm, b / norm, r / norm
+        max_dist = max(max_dist, abs(r))
+        # Dirección de la recta con la región factible a su izquierda
+        halfplanes.append((a, b, r, np.arctan2(a, -b), False))
+
+    # Caja de contención para acotar artificialmente la región
+    box = max_dist * 1e7
+    for a, b in ((1.0, 0.0), (0.0, 1.0), (-1.0, 0.0), (0.0, -1.0)):
+        halfplanes.append((a, b, box, np.arctan2(a, -b), True))
+
+    # Ordenar por ángulo; con ángulos iguales queda primero el más restrictivo
+    halfplanes.sort(key=lambda h: (h[3], h[2]))
+    unique = []
+    for h in halfplanes:
+        if unique and abs(h[3] - unique[-1][3]) < 1e-12:
+            continue
+        unique.append(h)
+
+    dq = deque()
+    for h in unique:
+        while len(dq) >= 2 and _is_outside(h, _line_intersection(dq[-1], dq[-2])):
+            dq.pop()
+        while len(dq) >= 2 and _is_outside(h, _line_intersection(dq[0], dq[1])):
+            dq.popleft()
+        if dq:
+            last = dq[-1]
+            turn = last[0] * h[1] - last[1] * h[0]
+            # Un giro de 180° o más respecto al último semiplano: región vacía
+            if turn < -1e-12:
+                return [], 'empty'
+            # Rectas paralelas con sentidos opuestos: región vacía o degenerada
+            if abs(turn) < 1e-12:
+                if last[2] + h[2] < -1e-7:
+                    return [], 'empty'
+                continue
+        dq.append(h)
+
+    while len(dq) >= 3 and _is_outside(dq[0], _line_intersection(dq[-1], dq[-2])):
+        dq.pop()
+    while len(dq) >= 3 and _is_outside(dq[-1], _line_intersection(dq[0], dq[1])):
+        dq.popleft()
+
+    if len(dq) < 3:
+        return [], 'empty'
+
+    # Vértices consecutivos de la frontera, marcando los que tocan la caja
+    k = len(dq)
+    corners = []
+    for i in range(k):
+        h1, h2 = dq[i], dq[(i + 1) % k]
+        x, y = _line_intersection(h1, h2)
+        # (+ 0.0 convierte -0.0 en 0.0)
+        corners.append(((round(float(x), 9) + 0.0, round(float(y), 9) + 0.0), h1[4] or h2[4]))
+
+    unbounded = any(on_box for _, on_box in corners)
+    if unbounded:
+        # Rotar para que la cadena de vértices reales quede contigua
+        start = next(i for i in range(k) if corners[i][1] and not corners[(i + 1) % k][1]) \
+            if not all(on_box for _, on_box in corners) else 0
+        corners = corners[start + 1:] + corners[:start + 1]
+
+    # Esquinas degeneradas (tres o más rectas casi concurrentes) producen
+    # vértices repetidos o casi iguales: se fusionan a distancia eps
+    unique = ToleranceGrid(eps)
+    for point, on_box in corners:
+        if not on_box:
+            unique.add(*point)
+
+    return unique.points, 'unbounded' if unbounded else 'bounded'
+
+def compute_vertices(constraints, method='halfplane', eps=VERTEX_EPS):
+    """
+    Calcula los vértices de la región factible.
+
+    Args:
+        constraints: lista de diccionarios con claves 'a','b','op','rhs'
+        method: 'halfplane' (intersección de semiplanos, O(n log n), vértices
+                en orden sobre la frontera), 'vectorized' (todas las parejas
+                de líneas resueltas en bloque con NumPy) o 'pairwise' (todas
+                las parejas de líneas, una a una, O(n³))
+        eps: distancia por debajo de la cual dos vértices se fusionan
+
+    Returns:
+        list: lista de tuplas (x, y) representando los vértices factibles
+    """
+    if method == 'pairwise':
+        return _compute_vertices_pairwise(constraints, eps)
+    if method == 'vectorized':
+        return _compute_vertices_vectorized(constraints, eps=eps)
+    if method == 'halfplane':
+        vertices, _ = compute_feasible_polygon(constraints, eps)
+        return vertices
+    raise ValueError(f"Método de cálculo de vértices desconocido: {method}")
+
+def evaluate_vertices(vertices, obj_coeffs, opt_type):
+    """
+    Evalúa la función objetivo en cada vértice y selecciona el óptimo.
+    
+    Returns:
+        tuple: (resultados, punto_óptimo, valor_óptimo)
+            resultados: lista de ((x, y), valor)
+    """
+    a_obj, b_obj = obj_coeffs
+    best_val = None
+    best_pt = None
+    results = []
     
-    return vertices
+    for (xv, yv) in vertices:
+        val = a_obj * xv + b_obj * yv
+        results.append(((xv, yv), val))
+        
+        if best_val is None:
+            best_val = val
+            best_pt = (xv, yv)
+        else:
+            if opt_type == 'max' and val > best_val:
+                best_val = val
+                best_pt = (xv, yv)
+            elif opt_type == 'min' and val < best_val:
+                best_val = val
+                best_pt = (xv, yv)
+    
+    return results, best_pt, best_val
+
+def recession_rays(constraints):
+    """
+    Direcciones en las que la región factible se extiende sin límite.
+
+    En 2D, si la región es no acotada, las direcciones extremas de su cono de
+    recesión {d : G d <= 0} son perpendiculares a alguna restricción, así que
+    basta probar ±(b, -a) de cada una.
+
+    Returns:
+        np.ndarray: matriz (r, 2) de direcciones unitarias (vacía si la región
+                    es acotada)
+    """
+    _, ineqs = _build_halfplanes(constraints)
+    normals = np.array(ineqs, dtype=float)[:, :2]
+    normals = np.vstack((normals, [[-1.0, 0.0], [0.0, -1.0]]))  # x >= 0, y >= 0
+    norm = np.hypot(normals[:, 0], normals[:, 1])
+    normals = normals[norm > 1e-12] / norm[norm > 1e-12, None]
+
+    perp = np.column_stack((normals[:, 1], -normals[:, 0]))
+    candidates = np.vstack((perp, -perp))
+    rays = candidates[np.all(candidates @ normals.T <= 1e-9, axis=1)]
+    return np.unique(np.round(rays, 12), axis=0)
+
+def objective_grid(c1_values, c2_values):
+    """
+    Todas las combinaciones de coeficientes (c1, c2) de una malla.
+
+    Returns:
+        np.ndarray: matriz (len(c1_values) * len(c2_values), 2)
+    """
+    C1, C2 = np.meshgrid(np.asarray(c1_values, dtype=float), np.asarray(c2_values, dtype=float),
+                         indexing='ij')
+    return np.column_stack((C1.ravel(), C2.ravel()))
+
+def sweep_objectives(vertices, objectives, opt_type, rays=None):
+    """
+    Evalúa muchas funciones objetivo sobre los mismos vértices con un solo
+    producto matricial, sin volver a resolver ni a graficar el problema.
+
+    Args:
+        vertices: lista de vértices (x, y), por ejemplo de compute_vertices
+        objectives: matriz (k, 2) de coeficientes (c1, c2); ver objective_grid
+        opt_type: 'max' o 'min'
+        rays: direcciones de recesión (recession_rays) si la región es no acotada
+
+    Returns:
+        dict: 'values' (k, n) con el valor de cada objetivo en cada vértice,
+              'best_index', 'best_points' y 'best_values' del vértice óptimo de
+              cada objetivo (el primero en caso de empate, como evaluate_vertices)
+              y 'unbounded', que indica los objetivos sin óptimo finito
+    """
+    V = np.asarray(vertices, dtype=float).reshape(-1, 2)
+    C = np.asarray(objectives, dtype=float).reshape(-1, 2)
+    values = C @ V.T
+
+    best_index = np.argmax(values, axis=1) if opt_type == 'max' else np.argmin(values, axis=1)
+    best_values = values[np.arange(len(C)), best_index]
+
+    unbounded = np.zeros(len(C), dtype=bool)
+    if rays is not None and len(rays):
+        growth = C @ np.asarray(rays, dtype=float).T
+        unbounded = np.any(growth > 1e-9 if opt_type == 'max' else growth < -1e-9, axis=1)
+
+    return {
+        'values': values,
+        'best_index': best_index,
+        'best_points': V[best_index],
+        'best_values': best_values,
+        'unbounded': unbounded
+    }
+
+def cost_ranging(vertices, obj_coeffs, opt_type, rays=None):
+    """
+    Rangos de optimalidad de los coeficientes de la función objetivo.
+
+    Para cada coeficiente calcula el intervalo exacto en el que, dejando el
+    otro fijo, el vértice óptimo actual sigue siendo óptimo. Con c fijo, el
+    vértice v* es óptimo (maximizando) si c·(v* - v) >= 0 para todo vértice v
+    y c·d <= 0 para toda dirección de recesión d; cada condición es lineal en
+    el coeficiente que varía y da una cota inferior o superior.
+
+    Returns:
+        dict: 'vertex' (vértice óptimo), 'c1' y 'c2' como tuplas (mínimo,
+              máximo), con ±inf si no hay cota; None si no hay óptimo finito
+    """
+    if not vertices:
+        return None
+    V = np.asarray(vertices, dtype=float)
+    R = np.asarray(rays, dtype=float).reshape(-1, 2) if rays is not None else np.empty((0, 2))
+    c = np.asarray(obj_coeffs, dtype=float)
+
+    _, best_pt, _ = evaluate_vertices(vertices, obj_coeffs, opt_type)
+    # Filas D tales que el vértice es óptimo si y solo si D @ c >= 0
+    D = np.vstack((np.asarray(best_pt) - V, -R))
+    if opt_type == 'min':
+        D = -D
+    scale = max(1.0, float(np.abs(V).max()))
+    if np.any(D @ c < -1e-9 * scale * max(1.0, float(np.abs(c).max()))):
+        return None  # el objetivo mejora sin límite en una dirección de recesión
+
+    ranging = {'vertex': best_pt}
+    for j, name in ((0, 'c1'), (1, 'c2')):
+        k = 1 - j
+        dj, rest = D[:, j], c[k] * D[:, k]
+        pos, neg = dj > 1e-12 * scale, dj < -1e-12 * scale
+        lower = float(np.max(-rest[pos] / dj[pos])) if pos.any() else float('-inf')
+        upper = float(np.min(-rest[neg] / dj[neg])) if neg.any() else float('inf')
+        ranging[name] = (min(lower, c[j]) + 0.0, max(upper, c[j]) + 0.0)
+    return ranging
+
+def region_payload(constraints, vertices, region_status, x_max=20, y_max=20):
+    """
+    Datos compactos de la región factible para re-evaluar objetivos en el
+    navegador. La región depende solo de las restricciones, así que cambiar la
+    función objetivo no requiere volver a resolver ni a graficar.
+
+    Returns:
+        dict: 'vertices' (en orden sobre la frontera), 'rays' (direcciones de
+              recesión si la región es no acotada), 'clip' (la región
+              recortada a la ventana, para dibujarla), 'window' (x_max, y_max)
+              y 'status'; las coordenadas se redondean a 6 decimales
+    """
+    def compact(points):
+        return [[round(float(x), 6) + 0.0, round(float(y), 6) + 0.0] for x, y in points]
+
+    window = [
+        {'a': 1.0, 'b': 0.0, 'op': '<=', 'rhs': float(x_max)},
+        {'a': 0.0, 'b': 1.0, 'op': '<=', 'rhs': float(y_max)},
+    ]
+    clip, _ = compute_feasible_polygon(list(constraints) + window)
+    rays = recession_rays(constraints) if region_status == 'unbounded' else []
+    return {
+        'vertices': compact(vertices),
+        'rays': compact(rays),
+        'clip': compact(clip),
+        'window': [float(x_max), float(y_max)],
+        'status': region_status
+    }
+
+def integer_lattice_optimum(constraints, vertices, region_status, obj_coeffs, opt_type,
+                            x_max=20, y_max=20, chunk_points=1_000_000,
+                            max_points=200_000_000, max_plot_points=2000):
+    """
+    Resuelve el problema con variables enteras recorriendo los puntos enteros
+    de la caja que contiene la región factible.
+
+    La caja se recorre por bloques de a lo sumo chunk_points puntos, partida
+    en ambos ejes (una columna muy alta también se divide); en cada bloque la
+    prueba de pertenencia (cada punto contra los semiplanos del polígono) y la
+    evaluación del objetivo son operaciones vectorizadas, así que cajas con
+    millones de puntos no crean una malla completa en memoria.
+
+    Si la región es no acotada, la búsqueda se limita a la caja de los
+    vértices ampliada hasta la ventana de la gráfica (x_max, y_max).
+
+    Returns:
+        dict: 'status' ('optimal', 'limited' si la región es no acotada,
+              'infeasible' si no hay puntos enteros o 'too_large' si la caja
+              supera max_points), 'point' y 'value' del óptimo entero,
+              'count' (puntos enteros factibles) y 'points' (los puntos
+              factibles para la gráfica, vacío si son más de max_plot_points)
+    """
+    solution = {'status': 'infeasible', 'point': None, 'value': None, 'count': 0, 'points': []}
+    if not vertices:
+        return solution
+
+    _, ineqs = _build_halfplanes(constraints)
+    G = np.array(ineqs + [(-1.0, 0.0, 0.0), (0.0, -1.0, 0.0)], dtype=float)
+    G_r = G[:, 2] + 1e-9 * np.maximum(1.0, np.abs(G[:, 2]))
+
+    V = np.asarray(vertices, dtype=float)
+    x_lo, y_lo = (max(0, math.ceil(v - 1e-9)) for v in V.min(axis=0))
+    x_hi, y_hi = (math.floor(v + 1e-9) for v in V.max(axis=0))
+    if region_status == 'unbounded':
+        x_hi, y_hi = max(x_hi, math.floor(x_max)), max(y_hi, math.floor(y_max))
+    if x_hi < x_lo or y_hi < y_lo:
+        return solution
+    if (x_hi - x_lo + 1) * (y_hi - y_lo + 1) > max_points:
+        solution['status'] = 'too_large'
+        return solution
+
+    # Bloques de a lo sumo chunk_points puntos: filas de y partidas en tramos
+    # de chunk_points y, dentro de cada tramo, columnas de x hasta completar
+    rows_per_chunk = min(y_hi - y_lo + 1, chunk_points)
+    cols_per_chunk = max(1, chunk_points // rows_per_chunk)
+    sign = 1.0 if opt_type == 'max' else -1.0
+    a_obj, b_obj = obj_coeffs
+    best_score = -np.inf
+    found = []
+
+    for x_start in range(x_lo, x_hi + 1, cols_per_chunk):
+        xs = np.arange(x_start, min(x_start + cols_per_chunk, x_hi + 1), dtype=float)
+        for y_start in range(y_lo, y_hi + 1, rows_per_chunk):
+            ys = np.arange(y_start, min(y_start + rows_per_chunk, y_hi + 1), dtype=float)
+            # Un punto está en el polígono si cumple todos sus semiplanos
+            inside = np.ones((len(xs), len(ys)), dtype=bool)
+            for (a, b, _), r in zip(G, G_r):
+                inside &= a * xs[:, None] + b * ys[None, :] <= r
+            count = int(np.count_nonzero(inside))
+            if not count:
+                continue
+
+            score = np.where(inside, sign * (a_obj * xs[:, None] + b_obj * ys[None, :]), -np.inf)
+            i, j = np.unravel_index(np.argmax(score), score.shape)
+            if score[i, j] > best_score:  # con empates se conserva el primero
+                best_score = score[i, j]
+                solution['point'] = (float(xs[i]), float(ys[j]))
+                solution['value'] = float(a_obj * xs[i] + b_obj * ys[j])
+
+            solution['count'] += count
+            if solution['count'] <= max_plot_points:
+                I, J = np.nonzero(inside)
+                found.extend(zip(xs[I].tolist(), ys[J].tolist()))
+
+    if solution['point'] is not None:
+        solution['status'] = 'limited' if region_status == 'unbounded' else 'optimal'
+        solution['points'] = found if solution['count'] <= max_plot_points else []
+    return solution
+
+def _nice_ceil(value):
+    """Redondea hacia arriba a 1, 1.5, 2, 2.5, ... por la potencia de 10 de value."""
+    step = 10.0 ** math.floor(math.log10(value)) / 2
+    return round(math.ceil(value / step - 1e-9) * step, 12)
+
+def plot_bounds(vertices, region_status='bounded', margin=0.2, rays=None, min_extent=20.0):
+    """
+    Calcula los límites de la gráfica (x_max, y_max) a partir de los vértices.
+
+    Se deja un margen de margin (o del doble si la región es no acotada, para
+    que se vea hacia dónde se abre). Si la región es no acotada la ventana
+    mide al menos min_extent por eje (la ventana fija de 20 x 20 de antes) y
+    se alarga siguiendo las direcciones de recesión rays desde cada vértice,
+    así que la gráfica y la búsqueda entera en modo 'limited' llegan más allá
+    de los vértices. Si las dos escalas son parecidas (razón de hasta 3) la
+    ventana es cuadrada y se grafica con la misma escala en ambos ejes.
+
+    Returns:
+        tuple: (x_max, y_max); (20, 20) si no hay vértices
+    """
+    if not vertices:
+        return 20.0, 20.0
+    V = np.asarray(vertices, dtype=float)
+    grow = 1.0 + (2 * margin if region_status == 'unbounded' else margin)
+    x_top, y_top = (max(float(v) * grow, 1.0) for v in V.max(axis=0))
+    if region_status == 'unbounded':
+        reach = max(x_top, y_top, min_extent)
+        if rays is not None and len(rays):
+            # Punta de cada rayo a distancia reach desde cada vértice
+            tips = (V[:, None, :] + reach * np.asarray(rays, dtype=float)[None, :, :]).reshape(-1, 2)
+            x_top, y_top = max(x_top, float(tips[:, 0].max())), max(y_top, float(tips[:, 1].max()))
+        x_top, y_top = max(x_top, min_extent), max(y_top, min_extent)
+    if max(x_top, y_top) <= 3 * min(x_top, y_top):
+        x_top = y_top = max(x_top, y_top)
+    return _nice_ceil(x_top), _nice_ceil(y_top)
+
+def _clip_line(a, b, rhs, x_lo, x_hi, y_lo, y_hi):
+    """
+    Segmento visible de la recta ax + by = rhs dentro de la caja dada.
+
+    Returns:
+        tuple: ((x1, x2), (y1, y2)) o None si la recta no cruza la caja
+    """
+    points = []
+    if abs(b) > 1e-12:
+        for x in (x_lo, x_hi):
+            y = (rhs - a * x) / b
+            if y_lo - 1e-9 <= y <= y_hi + 1e-9:
+                points.append((x, y))
+    if abs(a) > 1e-12:
+        for y in (y_lo, y_hi):
+            x = (rhs - b * y) / a
+            if x_lo - 1e-9 <= x <= x_hi + 1e-9:
+                points.append((x, y))
+    if len(points) < 2:
+        return None
+    (x1, y1), (x2, y2) = min(points), max(points)
+    return (x1, x2), (y1, y2)
 
-def create_plot(constraints, vertices, obj_coeffs, opt_type, x_max=20, y_max=20):
+def create_plot(constraints, vertices, obj_coeffs, opt_type, x_max=None, y_max=None,
+                render_mode='polygon', image_format='svg', integer_solution=None):
     """
     Crea la gráfica del problema de programación lineal con mejor visualización.
     
@@ -236,21 +771,59 @@ def create_plot(constraints, vertices, obj_coeffs, opt_type, x_max=20, y_max=20)
         vertices: vértices de la región factible
         obj_coeffs: coeficientes de la función objetivo
         opt_type: 'max' o 'min'
-        x_max, y_max: límites de la gráfica
+        x_max, y_max: límites de la gráfica (None para calcularlos a partir
+                      de los vértices con plot_bounds)
+        render_mode: 'polygon' (rellena el polígono exacto de la región) o
+                     'mesh' (evalúa las restricciones sobre una malla con un
+                     punto por píxel del área de la gráfica)
+        image_format: 'svg' o 'png'
+        integer_solution: resultado de integer_lattice_optimum para marcar
+                          el óptimo entero y los puntos enteros factibles
         
     Returns:
         tuple: (resultados, punto_óptimo, valor_óptimo, imagen_base64)
     """
-    # Configurar la figura con mejor resolución
-    plt.figure(figsize=(12, 9))
-    plt.style.use('default')  # Estilo limpio
+    results, best_pt, best_val = evaluate_vertices(vertices, obj_coeffs, opt_type)
+    image_data = render_plot(constraints, vertices, obj_coeffs, opt_type, x_max, y_max,
+                             render_mode, image_format, integer_solution=integer_solution)
+    
+    # Codificar imagen en base64
+    graphic = base64.b64encode(image_data)
+    graphic = graphic.decode('utf-8')
+    
+    return results, best_pt, best_val, graphic
+
+def render_plot(constraints, vertices, obj_coeffs, opt_type, x_max=None, y_max=None,
+                render_mode='polygon', image_format='svg', quality='full',
+                integer_solution=None):
+    """
+    Dibuja la gráfica del problema y la devuelve codificada (SVG o PNG).
+    
+    Recibe los mismos argumentos que create_plot, más:
+        quality: 'full' o 'draft' (sin etiquetas de vértices y, en PNG, a
+                 menor resolución; se usa cuando hay muchas gráficas en cola)
+    
+    Returns:
+        bytes: contenido del archivo de imagen
+    """
+    # Configurar la figura con mejor resolución. Se usan objetos Figure/Canvas
+    # propios (sin el estado global de pyplot) para poder graficar desde varios
+    # hilos a la vez.
+    fig = Figure(figsize=(12, 9))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    dpi = 150 if quality == 'full' else 72
+    
+    if x_max is None or y_max is None:
+        x_auto, y_auto = plot_bounds(vertices)
+        x_max = x_auto if x_max is None else x_max
+        y_max = y_auto if y_max is None else y_max
+    # Margen por debajo de cero (antes fijo en 0.5 para una ventana de 20)
+    x_pad, y_pad = 0.025 * x_max, 0.025 * y_max
     
     # Colores para las restricciones
     colors = ['blue', 'red', 'green', 'orange', 'purple', 'brown', 'pink', 'gray', 'olive', 'cyan']
     
-    # Dominio extendido para líneas
-    x_extended = np.linspace(-2, x_max + 2, 1000)
-    
     # Graficar cada restricción
     for i, c in enumerate(constraints):
         a, b, op, rhs = c['a'], c['b'], c['op'], c['rhs']
@@ -292,73 +865,89 @@ def create_plot(constraints, vertices, obj_coeffs, opt_type, x_max=20, y_max=20)
         
         constraint_label = f"{''.join(label_parts)} {op} {rhs}"
         
-        # Graficar línea de restricción
+        # Graficar línea de restricción: una recta solo necesita sus dos
+        # extremos visibles
         if abs(b) < 1e-9:  # Línea vertical
-            if abs(a) > 1e-9:
-                xv = rhs / a
-                if 0 <= xv <= x_max:
-                    plt.axvline(x=xv, color=color, linestyle='--', alpha=0.8, linewidth=2,
-                              label=constraint_label)
+            xv = rhs / a
+            if 0 <= xv <= x_max:
+                ax.axvline(x=xv, color=color, linestyle='--', alpha=0.8, linewidth=2,
+                          label=constraint_label)
         elif abs(a) < 1e-9:  # Línea horizontal
-            if abs(b) > 1e-9:
-                yv = rhs / b
-                if 0 <= yv <= y_max:
-                    plt.axhline(y=yv, color=color, linestyle='--', alpha=0.8, linewidth=2,
-                              label=constraint_label)
+            yv = rhs / b
+            if 0 <= yv <= y_max:
+                ax.axhline(y=yv, color=color, linestyle='--', alpha=0.8, linewidth=2,
+                          label=constraint_label)
         else:  # Línea general: ax + by = rhs
-            y_vals = (rhs - a * x_extended) / b
-            # Solo mostrar la parte visible
-            mask = (y_vals >= -2) & (y_vals <= y_max + 2)
-            plt.plot(x_extended[mask], y_vals[mask], color=color, linestyle='--', 
-                    alpha=0.8, linewidth=2, label=constraint_label)
+            segment = _clip_line(a, b, rhs, -4 * x_pad, x_max + 4 * x_pad,
+                                 -4 * y_pad, y_max + 4 * y_pad)
+            if segment is not None:
+                ax.plot(*segment, color=color, linestyle='--',
+                        alpha=0.8, linewidth=2, label=constraint_label)
     
-    # Crear malla más fina para mejor sombreado
-    xx = np.linspace(0, x_max, 800)
-    yy = np.linspace(0, y_max, 800)
-    X, Y = np.meshgrid(xx, yy)
-    feasible = np.ones_like(X, dtype=bool)
+    if render_mode == 'mesh':
+        # Un punto de la malla por píxel del área de la gráfica
+        left, right, bottom, top = 0.06, 0.70, 0.07, 0.90  # ver subplots_adjust
+        nx = max(50, int(fig.get_figwidth() * dpi * (right - left)))
+        ny = max(50, int(fig.get_figheight() * dpi * (top - bottom)))
+        xx = np.linspace(0, x_max, nx)
+        yy = np.linspace(0, y_max, ny)
+        X, Y = np.meshgrid(xx, yy)
+        feasible = np.ones_like(X, dtype=bool)
     
-    # Aplicar cada restricción a la malla
-    for c in constraints:
-        a, b, op, rhs = c['a'], c['b'], c['op'], c['rhs']
-        constraint_values = a * X + b * Y
+        # Aplicar cada restricción a la malla
+        for c in constraints:
+            a, b, op, rhs = c['a'], c['b'], c['op'], c['rhs']
+            constraint_values = a * X + b * Y
         
-        if op == '<=':
-            feasible &= (constraint_values <= rhs + 1e-9)
-        elif op == '>=':
-            feasible &= (constraint_values >= rhs - 1e-9)
-        else:  # op == '='
-            # Para igualdades, crear una banda estrecha
-            feasible &= (np.abs(constraint_values - rhs) <= 0.1)
+            if op == '<=':
+                feasible &= (constraint_values <= rhs + 1e-9)
+            elif op == '>=':
+                feasible &= (constraint_values >= rhs - 1e-9)
+            else:  # op == '='
+                # Para igualdades, crear una banda de unos dos píxeles
+                band = 2 * np.hypot(a * x_max / nx, b * y_max / ny)
+                feasible &= (np.abs(constraint_values - rhs) <= band)
     
-    # Verificar si el usuario especificó restricciones de no-negatividad explícitamente
-    has_x_nonneg = any(abs(c['a'] - 1) < 1e-9 and abs(c['b']) < 1e-9 and 
-                       abs(c['rhs']) < 1e-9 and c['op'] == '>=' for c in constraints)
-    has_y_nonneg = any(abs(c['b'] - 1) < 1e-9 and abs(c['a']) < 1e-9 and 
-                       abs(c['rhs']) < 1e-9 and c['op'] == '>=' for c in constraints)
+        # Verificar si el usuario especificó restricciones de no-negatividad explícitamente
+        has_x_nonneg = any(abs(c['a'] - 1) < 1e-9 and abs(c['b']) < 1e-9 and 
+                           abs(c['rhs']) < 1e-9 and c['op'] == '>=' for c in constraints)
+        has_y_nonneg = any(abs(c['b'] - 1) < 1e-9 and abs(c['a']) < 1e-9 and 
+                           abs(c['rhs']) < 1e-9 and c['op'] == '>=' for c in constraints)
     
-    # Solo aplicar restricciones de no-negatividad si el usuario no las especificó
-    if not has_x_nonneg:
-        feasible &= (X >= -1e-9)
-    if not has_y_nonneg:
-        feasible &= (Y >= -1e-9)
+        # Solo aplicar restricciones de no-negatividad si el usuario no las especificó
+        if not has_x_nonneg:
+            feasible &= (X >= -1e-9)
+        if not has_y_nonneg:
+            feasible &= (Y >= -1e-9)
     
-    # Sombrear región factible con mejor visualización
-    plt.contourf(X, Y, feasible.astype(int), levels=[0.5, 1.5], 
-                colors=['lightgreen'], alpha=0.4)
-    plt.contour(X, Y, feasible.astype(int), levels=[0.5], 
-               colors=['darkgreen'], linewidths=2, alpha=0.7)
+        # Sombrear región factible con mejor visualización
+        ax.contourf(X, Y, feasible.astype(int), levels=[0.5, 1.5], 
+                    colors=['lightgreen'], alpha=0.4)
+        ax.contour(X, Y, feasible.astype(int), levels=[0.5], 
+                   colors=['darkgreen'], linewidths=2, alpha=0.7)
+    else:
+        # Rellenar el polígono exacto: la región recortada a la ventana visible
+        window = [
+            {'a': 1.0, 'b': 0.0, 'op': '<=', 'rhs': float(x_max)},
+            {'a': 0.0, 'b': 1.0, 'op': '<=', 'rhs': float(y_max)},
+        ]
+        region, _ = compute_feasible_polygon(list(constraints) + window)
+        if region:
+            rx = [p[0] for p in region]
+            ry = [p[1] for p in region]
+            ax.fill(rx, ry, color='lightgreen', alpha=0.4)
+            ax.plot(rx + [rx[0]], ry + [ry[0]], color='darkgreen', linewidth=2, alpha=0.7)
 
     # Marcar vértices con mejor visualización
     if vertices:
         vx = [v[0] for v in vertices]
         vy = [v[1] for v in vertices]
-        plt.scatter(vx, vy, c='darkred', s=120, zorder=10, 
+        ax.scatter(vx, vy, c='darkred', s=120, zorder=10, 
                    label='Vértices', edgecolors='white', linewidth=2)
         
         # Anotar coordenadas de vértices con mejor formato
-        for i, (x_v, y_v) in enumerate(vertices):
-            plt.annotate(f'V{i+1}: ({x_v:.2f}, {y_v:.2f})', 
+        for i, (x_v, y_v) in enumerate(vertices if quality == 'full' else []):
+            ax.annotate(f'V{i+1}: ({x_v:.2f}, {y_v:.2f})', 
                         (x_v, y_v), xytext=(10, 10), 
                         textcoords='offset points', fontsize=10,
                         bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.8),
@@ -366,44 +955,36 @@ def create_plot(constraints, vertices, obj_coeffs, opt_type, x_max=20, y_max=20)
 
     # Calcular función objetivo en cada vértice
     a_obj, b_obj = obj_coeffs
-    best_val = None
-    best_pt = None
-    results = []
-    
-    for (xv, yv) in vertices:
-        val = a_obj * xv + b_obj * yv
-        results.append(((xv, yv), val))
-        
-        if best_val is None:
-            best_val = val
-            best_pt = (xv, yv)
-        else:
-            if opt_type == 'max' and val > best_val:
-                best_val = val
-                best_pt = (xv, yv)
-            elif opt_type == 'min' and val < best_val:
-                best_val = val
-                best_pt = (xv, yv)
+    _, best_pt, best_val = evaluate_vertices(vertices, obj_coeffs, opt_type)
 
     # Resaltar punto óptimo con mejor visualización
     if best_pt is not None:
-        plt.scatter(best_pt[0], best_pt[1], c='gold', s=300, zorder=15,
+        ax.scatter(best_pt[0], best_pt[1], c='gold', s=300, zorder=15,
                    marker='*', edgecolors='darkred', linewidth=3,
                    label=f'★ Óptimo: ({best_pt[0]:.2f}, {best_pt[1]:.2f})')
         
+        # Modo entero: puntos enteros factibles y óptimo entero
+        if integer_solution and integer_solution['point'] is not None:
+            if integer_solution['points']:
+                ix, iy = zip(*integer_solution['points'])
+                ax.scatter(ix, iy, c='steelblue', s=12, zorder=8, alpha=0.6,
+                           label='Puntos enteros factibles')
+            int_pt = integer_solution['point']
+            ax.scatter(int_pt[0], int_pt[1], c='deepskyblue', s=220, zorder=14,
+                       marker='s', edgecolors='navy', linewidth=2,
+                       label=f'■ Óptimo entero: ({int_pt[0]:.0f}, {int_pt[1]:.0f})')
+        
         # Agregar línea de función objetivo en el punto óptimo
-        if abs(b_obj) > 1e-9:  # Evitar división por cero
-            x_obj = np.linspace(0, x_max, 100)
-            y_obj = (best_val - a_obj * x_obj) / b_obj
-            mask = (y_obj >= 0) & (y_obj <= y_max)
-            plt.plot(x_obj[mask], y_obj[mask], 'k-', alpha=0.5, linewidth=2,
+        segment = _clip_line(a_obj, b_obj, best_val, 0, x_max, 0, y_max)
+        if segment is not None:
+            ax.plot(*segment, 'k-', alpha=0.5, linewidth=2,
                     label=f'z = {best_val:.2f}')
     
     # Configurar gráfica con mejor formato
-    plt.xlim(-0.5, x_max)
-    plt.ylim(-0.5, y_max)
-    plt.xlabel('x', fontsize=14, fontweight='bold')
-    plt.ylabel('y', fontsize=14, fontweight='bold')
+    ax.set_xlim(-x_pad, x_max)
+    ax.set_ylim(-y_pad, y_max)
+    ax.set_xlabel('x', fontsize=14, fontweight='bold')
+    ax.set_ylabel('y', fontsize=14, fontweight='bold')
     
     # Título más informativo
     obj_str = f"z = {obj_coeffs[0]:.1f}x"
@@ -412,55 +993,61 @@ def create_plot(constraints, vertices, obj_coeffs, opt_type, x_max=20, y_max=20)
     else:
         obj_str += f" - {abs(obj_coeffs[1]):.1f}y"
         
-    plt.title(f'Método Gráfico - Programación Lineal\n'
+    ax.set_title(f'Método Gráfico - Programación Lineal\n'
               f'{"Maximizar" if opt_type == "max" else "Minimizar"}: {obj_str}', 
               fontsize=16, fontweight='bold', pad=20)
     
     # Mejorar leyenda y grid
-    plt.legend(bbox_to_anchor=(1.02, 1), loc='upper left', fontsize=10)
-    plt.grid(True, alpha=0.4, linestyle='-', linewidth=0.5)
-    plt.gca().set_aspect('equal', adjustable='box')
+    ax.legend(bbox_to_anchor=(1.02, 1), loc='upper left', fontsize=10)
+    ax.grid(True, alpha=0.4, linestyle='-', linewidth=0.5)
+    if x_max == y_max:
+        ax.set_aspect('equal', adjustable='box')
     
-    # Convertir gráfica a imagen base64 para mostrar en web
+    # Convertir gráfica a imagen
+    # Márgenes fijos (con espacio a la derecha para la leyenda) en lugar de
+    # tight_layout/bbox_inches='tight': así la figura se dibuja una sola vez.
+    fig.subplots_adjust(left=0.06, right=0.70, bottom=0.07, top=0.90)
     buffer = BytesIO()
-    plt.tight_layout()
-    plt.savefig(buffer, format='png', dpi=150, bbox_inches='tight')
+    # Sin fecha en los metadatos: el mismo problema produce la misma imagen
+    metadata = {'Date': None} if image_format == 'svg' else None
+    fig.savefig(buffer, format=image_format, dpi=dpi, metadata=metadata)
     buffer.seek(0)
-    image_png = buffer.getvalue()
+    image_data = buffer.getvalue()
     buffer.close()
-    plt.close()  # Cerrar figura para liberar memoria
-    
-    # Codificar imagen en base64
-    graphic = base64.b64encode(image_png)
-    graphic = graphic.decode('utf-8')
     
-    return results, best_pt, best_val, graphic
+    return image_data
 
-def solve_lp_problem(objective_str, constraints_list):
+def solve_lp_problem(objective_str, constraints_list, image_format='svg', graphic_cache=None,
+                     render_pool=None, integer=False, model_cache=None):
     """
     Función principal para resolver un problema de programación lineal.
     
     Args:
         objective_str: string con la función objetivo
         constraints_list: lista de strings con las restricciones
+        image_format: formato de la gráfica, 'svg' o 'png'
+        graphic_cache: GraphicCache opcional. Si se indica, la gráfica se
+                       guarda en la caché y el resultado trae 'graphic_key'
+                       en lugar de la imagen en base64 ('graphic' es None)
+        render_pool: PlotRenderPool opcional. Si se indica, la gráfica se
+                     renderiza en segundo plano y el resultado trae
+                     'graphic_key' y 'graphic_status' sin esperar la imagen
+        integer: si es True, también se resuelve con variables enteras
+                 (ver integer_lattice_optimum) y el resultado trae
+                 'integer_solution'; 'best_point' sigue siendo el óptimo de
+                 la relajación lineal
+        model_cache: ParsedModelCache opcional para no volver a parsear
+                     problemas repetidos
         
     Returns:
         dict: diccionario con los resultados del problema
     """
     try:
-        # Parsear función objetivo
-        opt_type, obj_coeffs = parse_objective(objective_str)
-        
-        # Parsear restricciones
-        constraints = []
-        for constraint_str in constraints_list:
-            constraint_str = constraint_str.strip()
-            if constraint_str:  # ignorar líneas vacías
-                a, b, op, rhs = parse_constraint(constraint_str)
-                constraints.append({'a': a, 'b': b, 'op': op, 'rhs': rhs})
+        # Parsear función objetivo y restricciones
+        opt_type, obj_coeffs, constraints = parse_problem(objective_str, constraints_list, model_cache)
         
-        # Calcular vértices
-        vertices = compute_vertices(constraints)
+        # Calcular vértices (en orden sobre la frontera de la región)
+        vertices, region_status = compute_feasible_polygon(constraints)
         
         if not vertices:
             return {
@@ -468,10 +1055,39 @@ def solve_lp_problem(objective_str, constraints_list):
                 'error': 'No se encontró región factible. Verifica las restricciones.'
             }
         
+        rays = recession_rays(constraints) if region_status == 'unbounded' else None
+        x_max, y_max = plot_bounds(vertices, region_status, rays=rays)
+        integer_solution = integer_lattice_optimum(
+            constraints, vertices, region_status, obj_coeffs, opt_type, x_max, y_max
+        ) if integer else None
+        
         # Crear gráfica y calcular resultados
-        results, best_pt, best_val, graphic = create_plot(
-            constraints, vertices, obj_coeffs, opt_type
-        )
+        graphic_key = None
+        graphic_status = None
+        if render_pool is not None:
+            results, best_pt, best_val = evaluate_vertices(vertices, obj_coeffs, opt_type)
+            graphic = None
+            graphic_key = graphic_cache_key(constraints, obj_coeffs, opt_type, x_max, y_max,
+                                            image_format, integer=integer)
+            graphic_status = render_pool.submit(
+                graphic_key, image_format, render_plot,
+                constraints, vertices, obj_coeffs, opt_type, x_max, y_max,
+                image_format=image_format, integer_solution=integer_solution
+            )
+        elif graphic_cache is None:
+            results, best_pt, best_val, graphic = create_plot(
+                constraints, vertices, obj_coeffs, opt_type, x_max, y_max,
+                image_format=image_format, integer_solution=integer_solution
+            )
+        else:
+            results, best_pt, best_val = evaluate_vertices(vertices, obj_coeffs, opt_type)
+            graphic = None
+            graphic_key = graphic_cache_key(constraints, obj_coeffs, opt_type, x_max, y_max,
+                                            image_format, integer=integer)
+            graphic_cache.get_or_render(graphic_key, image_format, lambda: render_plot(
+                constraints, vertices, obj_coeffs, opt_type, x_max, y_max,
+                image_format=image_format, integer_solution=integer_solution
+            ))
         
         return {
             'success': True,
@@ -482,7 +1098,15 @@ def solve_lp_problem(objective_str, constraints_list):
             'best_point': best_pt,
             'best_value': best_val,
             'graphic': graphic,
-            'constraints': constraints
+            'graphic_key': graphic_key,
+            'graphic_status': graphic_status,
+            'graphic_format': image_format,
+            'constraints': constraints,
+            'region_status': region_status,
+            'active_constraints': active_constraint_counts(vertices, constraints),
+            'ranging': cost_ranging(vertices, obj_coeffs, opt_type, rays),
+            'integer_solution': integer_solution,
+            'region': region_payload(constraints, vertices, region_status, x_max, y_max)
         }
         
     except Exception as e:
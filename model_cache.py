@@ -0,0 +1,149 @@
+# archivo: model_cache.py
+"""
+Caché de modelos ya parseados, direccionada por el texto normalizado.
+
+Muchas solicitudes vuelven a enviar el mismo problema con otros espacios,
+mayúsculas o con las restricciones en otro orden. La clave de la caché es la
+forma canónica del modelo (líneas con los espacios normalizados, en
+minúsculas, con los operadores unificados y las restricciones ordenadas),
+así que esas variantes comparten la misma entrada y no se vuelven a parsear.
+
+Cada entrada guarda el resultado del parser por línea y el último modelo
+armado (coeficientes y matriz). Si la solicitud trae las restricciones en el
+mismo orden, el modelo armado se reutiliza tal cual; si el orden cambia, se
+vuelve a armar con las líneas ya parseadas, sin parsear de nuevo.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+# Los espacios solo se conservan entre dos caracteres de palabra ("x1 2" no es "x12")
+_SPACES = re.compile(r'\s+')
+_LOOSE_SPACE = re.compile(r' (?!\w)|(?<!\w) ')
+
+# Grafías equivalentes de los operadores y signos
+_SPELLINGS = (('≤', '<='), ('≥', '>='), ('=<', '<='), ('=>', '>='), ('−', '-'))
+
+
+def normalize_line(text: str) -> str:
+    """
+    Forma canónica de una línea: en minúsculas, con operadores unificados y
+    sin espacios salvo los que separan dos palabras o números.
+
+    La forma canónica se parsea igual que el texto original.
+    """
+    line = _LOOSE_SPACE.sub('', _SPACES.sub(' ', text.strip())).lower()
+    for spelling, canonical in _SPELLINGS:
+        if spelling in line:
+            line = line.replace(spelling, canonical)
+    return line
+
+
+def model_key(kind: str, objective: str, constraints: Sequence[str]) -> Tuple[Tuple[str, ...], tuple]:
+    """
+    Clave canónica de un modelo.
+
+    Returns:
+        tuple: (orden, clave) donde orden son las restricciones normalizadas
+               en el orden de la solicitud (sin líneas vacías) y clave no
+               depende de ese orden
+    """
+    order = tuple(line for line in map(normalize_line, constraints) if line)
+    return order, (kind, normalize_line(objective), tuple(sorted(order)))
+
+
+class _Entry:
+    __slots__ = ('objective', 'lines', 'order', 'model')
+
+    def __init__(self, objective: Any, lines: Dict[str, Any], order: Tuple[str, ...], model: Any):
+        self.objective = objective
+        self.lines = lines
+        self.order = order
+        self.model = model
+
+
+class ParsedModelCache:
+    """
+    Caché LRU de modelos parseados, con contadores de aciertos y fallos.
+
+    Es segura entre hilos; el parseo se hace fuera del candado. Los modelos
+    guardados se comparten entre solicitudes, así que no deben modificarse.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        """
+        Args:
+            max_entries: número máximo de modelos en memoria
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[tuple, _Entry]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_parse(self, kind: str, objective: str, constraints: Sequence[str],
+                     parse_objective: Callable[[str], Any],
+                     parse_line: Callable[[str], Any],
+                     assemble: Callable[[Any, List[Any]], Any]) -> Any:
+        """
+        Devuelve el modelo armado, parseándolo solo si no está en la caché.
+
+        Args:
+            kind: método que usa el modelo (cada método parsea distinto)
+            objective: texto de la función objetivo
+            constraints: textos de las restricciones (las líneas vacías se ignoran)
+            parse_objective: parser de la función objetivo
+            parse_line: parser de una restricción
+            assemble: arma el modelo con (objetivo, restricciones en orden)
+
+        Returns:
+            el resultado de assemble (compartido: no debe modificarse)
+        """
+        order, key = model_key(kind, objective, constraints)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                if entry.order == order:
+                    return entry.model
+                lines = entry.lines
+                parsed_objective = entry.objective
+            else:
+                self.misses += 1
+
+        if entry is None:
+            # La forma canónica se parsea igual que el texto original
+            parsed_objective = parse_objective(normalize_line(objective))
+            lines = {line: parse_line(line) for line in order}
+
+        model = assemble(parsed_objective, [lines[line] for line in order])
+        with self._lock:
+            self._entries[key] = _Entry(parsed_objective, lines, order, model)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return model
+
+    def stats(self) -> Dict[str, Any]:
+        """Contadores de la caché: aciertos, fallos, tasa de aciertos y tamaño."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,182 @@
+# archivo: pricing.py
+"""
+Reglas de selección de la variable entrante (pricing) para los métodos simplex.
+
+    - 'dantzig': el costo reducido más negativo
+    - 'steepest_edge': el mayor descenso por unidad de longitud de la arista,
+      d_j² / γ_j con γ_j = 1 + ||B⁻¹ a_j||² (actualizado con la fórmula de
+      Goldfarb y Reid)
+    - 'devex': aproximación de steepest edge con pesos de referencia
+      (Forrest y Goldfarb), sin productos adicionales
+    - 'bland': el menor índice con costo reducido negativo
+
+Las reglas distintas de Bland pueden ciclar en problemas degenerados: después
+de DEGENERATE_LIMIT pivoteos degenerados seguidos (paso cero), la regla pasa
+a Bland hasta el siguiente pivoteo que mejore el objetivo.
+
+Los costos reducidos siguen la convención de la fila Z del tableau
+(maximización): una columna puede entrar si su costo reducido es negativo.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Type
+
+import numpy as np
+
+DEGENERATE_LIMIT = 8  # pivoteos degenerados seguidos antes de usar Bland
+
+
+class PricingRule(ABC):
+    """
+    Regla base. Las subclases definen _choose y, si usan pesos, update.
+
+    Attributes:
+        needs_pivot_row: update necesita la fila pivote (α_r) completa
+        needs_cross: update necesita a_j^T B^{-T} B⁻¹ a_q para todas las columnas
+    """
+
+    name = ''
+    needs_pivot_row = False
+    needs_cross = False
+
+    def __init__(self, column_norms2: np.ndarray, degenerate_limit: int = DEGENERATE_LIMIT):
+        """
+        Args:
+            column_norms2: ||B⁻¹ a_j||² de cada columna en la base inicial
+            degenerate_limit: pivoteos degenerados seguidos antes de usar Bland
+        """
+        self.degenerate_limit = degenerate_limit
+        self.degenerate_steps = 0
+        self.bland_active = False
+        self.bland_pivots = 0  # pivoteos elegidos por la regla de respaldo
+
+    def select(self, reduced: np.ndarray, eligible: np.ndarray, eps: float) -> Optional[int]:
+        """
+        Elige la columna entrante.
+
+        Args:
+            reduced: costos reducidos (fila Z) de todas las columnas
+            eligible: máscara de columnas que pueden entrar
+            eps: tolerancia de optimalidad
+
+        Returns:
+            int: índice de la columna, o None si la base es óptima
+        """
+        candidates = eligible & (reduced < -eps)
+        if not candidates.any():
+            return None
+        if self.bland_active:
+            self.bland_pivots += 1
+            return int(np.argmax(candidates))
+        return self._choose(reduced, candidates)
+
+    @abstractmethod
+    def _choose(self, reduced: np.ndarray, candidates: np.ndarray) -> int:
+        """Elige entre las columnas candidatas (hay al menos una)."""
+
+    def record_step(self, degenerate: bool):
+        """Registra si el último pivoteo fue degenerado (paso cero)."""
+        if degenerate:
+            self.degenerate_steps += 1
+            if self.degenerate_steps >= self.degenerate_limit:
+                self.bland_active = True
+        else:
+            self.degenerate_steps = 0
+            self.bland_active = False
+
+    def update(self, pivot_col: int, leaving_var: int, pivot_row: Optional[np.ndarray],
+               pivot_column: np.ndarray, cross: Optional[np.ndarray]):
+        """
+        Actualiza los pesos después de un pivoteo.
+
+        Args:
+            pivot_col: columna entrante
+            leaving_var: columna saliente
+            pivot_row: fila pivote α_r (antes del pivoteo), si needs_pivot_row
+            pivot_column: columna entrante transformada d = B⁻¹ a_q (antes del pivoteo)
+            cross: a_j^T B^{-T} d para todas las columnas, si needs_cross
+        """
+
+
+class BlandPricing(PricingRule):
+    name = 'bland'
+
+    def _choose(self, reduced, candidates):
+        return int(np.argmax(candidates))
+
+    def record_step(self, degenerate):
+        pass  # Bland no cicla
+
+
+class DantzigPricing(PricingRule):
+    name = 'dantzig'
+
+    def _choose(self, reduced, candidates):
+        return int(np.argmin(np.where(candidates, reduced, np.inf)))
+
+
+class _WeightedPricing(PricingRule):
+    """Elige el mayor d_j² / w_j; en empates, el menor índice."""
+
+    def _choose(self, reduced, candidates):
+        score = np.where(candidates, reduced * reduced / self.weights, -1.0)
+        return int(np.argmax(score))
+
+
+class SteepestEdgePricing(_WeightedPricing):
+    name = 'steepest_edge'
+    needs_pivot_row = True
+    needs_cross = True
+
+    def __init__(self, column_norms2, degenerate_limit=DEGENERATE_LIMIT):
+        super().__init__(column_norms2, degenerate_limit)
+        self.weights = 1.0 + np.asarray(column_norms2, dtype=float)
+
+    def update(self, pivot_col, leaving_var, pivot_row, pivot_column, cross):
+        gamma_q = 1.0 + float(pivot_column @ pivot_column)
+        pivot_element = pivot_row[pivot_col]
+        ratio = pivot_row / pivot_element
+        # γ_j ← max(γ_j - 2 r_j a_j^T B^{-T} d + r_j² γ_q, 1 + r_j²)
+        weights = self.weights - 2.0 * ratio * cross + ratio * ratio * gamma_q
+        np.maximum(weights, 1.0 + ratio * ratio, out=self.weights)
+        self.weights[leaving_var] = max(gamma_q / (pivot_element * pivot_element), 1.0)
+        self.weights[pivot_col] = 1.0
+
+
+class DevexPricing(_WeightedPricing):
+    name = 'devex'
+    needs_pivot_row = True
+
+    def __init__(self, column_norms2, degenerate_limit=DEGENERATE_LIMIT):
+        super().__init__(column_norms2, degenerate_limit)
+        self.weights = np.ones(len(column_norms2))
+
+    def update(self, pivot_col, leaving_var, pivot_row, pivot_column, cross):
+        pivot_element = pivot_row[pivot_col]
+        weight_q = self.weights[pivot_col]
+        ratio = pivot_row / pivot_element
+        # w_j ← max(w_j, (α_rj / α_rq)² w_q)
+        np.maximum(self.weights, ratio * ratio * weight_q, out=self.weights)
+        self.weights[leaving_var] = max(weight_q / (pivot_element * pivot_element), 1.0)
+        self.weights[pivot_col] = 1.0
+
+
+PRICING_RULES: Dict[str, Type[PricingRule]] = {
+    'dantzig': DantzigPricing,
+    'steepest_edge': SteepestEdgePricing,
+    'devex': DevexPricing,
+    'bland': BlandPricing,
+}
+
+
+def make_pricing(name: str, column_norms2: np.ndarray) -> PricingRule:
+    """
+    Crea la regla de pricing por nombre.
+
+    Raises:
+        ValueError: si la regla no existe
+    """
+    rule = PRICING_RULES.get(name)
+    if rule is None:
+        raise ValueError(f"Regla de pricing no soportada: {name} (usa {', '.join(PRICING_RULES)})")
+    return rule(column_norms2)
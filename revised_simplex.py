@@ -0,0 +1,546 @@
+# archivo: revised_simplex.py
+"""
+Método Simplex Revisado con la base factorizada (LU).
+
+SimplexTableau actualiza todo el tableau en cada pivoteo. El método revisado
+guarda solo la base y una factorización de ella, y en cada iteración calcula
+únicamente lo que necesita:
+    - precios duales y = c_B B⁻¹ (BTRAN) y con ellos la fila de costos reducidos
+    - la columna entrante d = B⁻¹ a_q (FTRAN) para la prueba del cociente
+
+Las columnas de holgura, exceso y artificiales son unitarias (±e_i), así que
+solo se factoriza con LU el núcleo: las columnas estructurales de la base
+restringidas a las filas que no cubre ninguna columna unitaria. Entre
+refactorizaciones, cada cambio de base se guarda como una matriz eta (forma
+producto de la inversa).
+
+El resultado tiene el mismo formato que SimplexTableau.solve; las iteraciones
+no incluyen el tableau (no se calcula).
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from iteration_history import approx_bytes
+from pricing import make_pricing
+from simplex_kernels import bland_ratio_row
+from solver_budget import BUDGET_STATUSES, ITERATION_LIMIT, SolverBudget
+from solver_trace import check_trace_level
+from sparse_matrix import StandardForm
+
+
+def _lu_factor(K: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Factorización LU con pivoteo parcial: K[perm] = L U.
+
+    Returns:
+        tuple: (lu, perm) con L (diagonal unitaria, no guardada) y U en la misma matriz
+    """
+    lu = np.array(K, dtype=float)
+    n = len(lu)
+    perm = np.arange(n)
+    for i in range(n):
+        p = i + int(np.argmax(np.abs(lu[i:, i])))
+        if abs(lu[p, i]) < 1e-11:
+            raise np.linalg.LinAlgError("La base es singular")
+        if p != i:
+            lu[[i, p]] = lu[[p, i]]
+            perm[[i, p]] = perm[[p, i]]
+        lu[i + 1:, i] /= lu[i, i]
+        lu[i + 1:, i + 1:] -= np.outer(lu[i + 1:, i], lu[i, i + 1:])
+    return lu, perm
+
+
+def _lu_solve(lu: np.ndarray, perm: np.ndarray, rhs: np.ndarray) -> np.ndarray:
+    """Resuelve K x = rhs con la factorización de _lu_factor."""
+    x = rhs[perm]
+    n = len(x)
+    for i in range(n - 1):          # L z = P rhs
+        if x[i] != 0.0:
+            x[i + 1:] -= lu[i + 1:, i] * x[i]
+    for i in range(n - 1, -1, -1):  # U x = z
+        x[i] /= lu[i, i]
+        if x[i] != 0.0:
+            x[:i] -= lu[:i, i] * x[i]
+    return x
+
+
+def _lu_solve_transpose(lu: np.ndarray, perm: np.ndarray, rhs: np.ndarray) -> np.ndarray:
+    """Resuelve K^T y = rhs con la factorización de _lu_factor."""
+    w = np.array(rhs, dtype=float)
+    n = len(w)
+    for i in range(n):              # U^T w = rhs
+        w[i] /= lu[i, i]
+        if w[i] != 0.0:
+            w[i + 1:] -= lu[i, i + 1:] * w[i]
+    for i in range(n - 1, 0, -1):   # L^T v = w
+        if w[i] != 0.0:
+            w[:i] -= lu[i, :i] * w[i]
+    y = np.empty(n)
+    y[perm] = w
+    return y
+
+
+class BasisFactorization:
+    """
+    Factorización de la base B (columnas de [A | auxiliares]) para resolver
+    B x = a (FTRAN) y y^T B = h^T (BTRAN).
+
+    Los vectores x y h se indexan por posición en la base (la fila del
+    tableau equivalente); a e y se indexan por restricción.
+    """
+
+    def __init__(self, form: StandardForm, basis: Sequence[int], refactor_every: int = 64):
+        """
+        Args:
+            form: problema en forma estándar
+            basis: columna básica de cada posición
+            refactor_every: número de actualizaciones eta antes de refactorizar
+        """
+        self.form = form
+        self.refactor_every = refactor_every
+        self.refactor(basis)
+
+    def refactor(self, basis: Sequence[int]):
+        """Factoriza la base desde cero y descarta las actualizaciones eta."""
+        form = self.form
+        m = form.n_rows
+        basis = np.asarray(basis, dtype=np.int64)
+
+        # Columnas unitarias: fila y signo de cada una
+        unit = basis >= form.n_vars
+        self.unit_pos = np.flatnonzero(unit)
+        self.struct_pos = np.flatnonzero(~unit)
+        aux = basis[self.unit_pos] - form.n_vars
+        self.unit_rows = form.aux_rows[aux]
+        self.unit_signs = form.aux_signs[aux]
+        covered = np.zeros(m, dtype=bool)
+        covered[self.unit_rows] = True
+        if np.count_nonzero(covered) != len(self.unit_rows):
+            raise np.linalg.LinAlgError("La base es singular (dos columnas unitarias en la misma fila)")
+        self.kernel_rows = np.flatnonzero(~covered)
+        k = len(self.struct_pos)
+
+        # Coeficientes de las columnas estructurales de la base
+        columns = form.columns
+        starts = columns.indptr[basis[self.struct_pos]]
+        lengths = columns.indptr[basis[self.struct_pos] + 1] - starts
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        entries = offsets + np.arange(int(lengths.sum()))
+        rows = columns.indices[entries]
+        values = columns.data[entries]
+        col_of = np.repeat(np.arange(k), lengths)
+
+        # Núcleo (filas no cubiertas) y borde (filas de las columnas unitarias)
+        kernel_index = np.full(m, -1)
+        kernel_index[self.kernel_rows] = np.arange(k)
+        unit_index = np.full(m, -1)
+        unit_index[self.unit_rows] = np.arange(len(self.unit_rows))
+        in_kernel = kernel_index[rows] >= 0
+        kernel = np.zeros((k, k))
+        kernel[kernel_index[rows[in_kernel]], col_of[in_kernel]] = values[in_kernel]
+        self.border_unit = unit_index[rows[~in_kernel]]
+        self.border_col = col_of[~in_kernel]
+        self.border_values = values[~in_kernel]
+
+        self.lu, self.perm = _lu_factor(kernel)
+        self.etas: List[Tuple[int, float, np.ndarray, np.ndarray]] = []
+
+    @property
+    def needs_refactor(self) -> bool:
+        return len(self.etas) >= self.refactor_every
+
+    def ftran(self, a: np.ndarray) -> np.ndarray:
+        """x = B⁻¹ a"""
+        a = np.asarray(a, dtype=float)
+        x = np.empty(self.form.n_rows)
+        x_struct = _lu_solve(self.lu, self.perm, a[self.kernel_rows])
+        x[self.struct_pos] = x_struct
+        border = np.bincount(self.border_unit, weights=self.border_values * x_struct[self.border_col],
+                             minlength=len(self.unit_rows))
+        x[self.unit_pos] = (a[self.unit_rows] - border) * self.unit_signs
+
+        for r, pivot, index, values in self.etas:
+            t = x[r] / pivot
+            if t != 0.0:
+                x[index] -= t * values
+            x[r] = t
+        return x
+
+    def btran(self, h: np.ndarray) -> np.ndarray:
+        """y = h^T B⁻¹ (y indexado por restricción)"""
+        h = np.array(h, dtype=float)
+        for r, pivot, index, values in reversed(self.etas):
+            h[r] = (h[r] * (1.0 + pivot) - h[index] @ values) / pivot
+
+        y = np.empty(self.form.n_rows)
+        y_unit = h[self.unit_pos] * self.unit_signs
+        y[self.unit_rows] = y_unit
+        border = np.bincount(self.border_col, weights=self.border_values * y_unit[self.border_unit],
+                             minlength=len(self.struct_pos))
+        y[self.kernel_rows] = _lu_solve_transpose(self.lu, self.perm, h[self.struct_pos] - border)
+        return y
+
+    def update(self, r: int, d: np.ndarray):
+        """
+        Registra el cambio de base en la posición r (forma producto).
+
+        Args:
+            r: posición de la variable saliente
+            d: columna entrante ya transformada (B⁻¹ a_q)
+        """
+        index = np.flatnonzero(d)
+        self.etas.append((r, float(d[r]), index, d[index]))
+
+
+class RevisedSimplex:
+    """
+    Simplex revisado (Dos Fases si hay variables artificiales) con las mismas
+    reglas de pivoteo y el mismo formato de resultado que SimplexTableau.
+    """
+
+    EPS = 1e-9  # Tolerancia para comparaciones numéricas
+
+    def __init__(self, c: List[float], A, b: List[float],
+                 constraint_types: List[str], opt_type: str = 'max',
+                 pricing: str = 'dantzig', refactor_every: int = 64, trace: str = 'full',
+                 budget: Optional[SolverBudget] = None):
+        """
+        Args:
+            c: Coeficientes de la función objetivo
+            A: Matriz de coeficientes de restricciones (lista de listas,
+               arreglo de NumPy o CSRMatrix)
+            b: Vector de términos independientes (no negativos)
+            constraint_types: Lista de tipos ['<=', '>=', '=']
+            opt_type: 'max' o 'min'
+            pricing: regla de la variable entrante (ver pricing.PRICING_RULES)
+            refactor_every: pivoteos entre refactorizaciones de la base
+            trace: historial de iteraciones: 'full' y 'summary' guardan el
+                   mismo resumen (este motor no tiene tableau); 'none', nada
+            budget: límites de iteraciones, tiempo y memoria del historial
+                    (ver solver_budget)
+        """
+        self.trace = check_trace_level(trace)
+        self.budget = budget or SolverBudget()
+        self.pivot_count = 0  # pivoteos en todas las fases
+        self.history_bytes = 0  # memoria aproximada de self.iterations
+        self.original_opt_type = opt_type.lower()
+        self.n_original_vars = len(c)
+        self.n_constraints = len(b)
+        self.c_original = np.asarray(c, dtype=float)
+
+        self.form = StandardForm(A, b, constraint_types)
+        if self.form.n_vars != self.n_original_vars:
+            raise ValueError("La matriz de restricciones no tiene una columna por variable")
+        self.n_slack = self.form.n_slack
+        self.n_surplus = self.form.n_surplus
+        self.n_artificial = self.form.n_artificial
+
+        # Trabajamos internamente como maximización
+        self.c_max = np.zeros(self.form.n_total)
+        self.c_max[:self.n_original_vars] = \
+            -self.c_original if self.original_opt_type == 'min' else self.c_original
+
+        self.basic_vars = self.form.initial_basis()
+        self.artificial_vars = self.form.artificial_columns()
+        self.factorization = BasisFactorization(self.form, self.basic_vars, refactor_every)
+        self.x_basic = self.factorization.ftran(self.form.b)
+
+        # La base inicial es la identidad: ||B⁻¹ a_j||² = ||a_j||² (1 en las auxiliares)
+        A = self.form.A
+        norms2 = np.ones(self.form.n_total)
+        norms2[:self.n_original_vars] = np.bincount(A.indices, weights=A.data ** 2,
+                                                    minlength=self.n_original_vars)
+        self.pricing = make_pricing(pricing, norms2)
+
+        self.iterations = []
+        self.current_iteration = 0
+        self.phase = 1 if self.n_artificial > 0 else 2
+        self._set_phase_costs()
+
+        self._save_iteration(None, None, None, None, None,
+                             f"Base Inicial - {'Fase I' if self.phase == 1 else 'Fase II'}")
+
+    def _set_phase_costs(self):
+        """Costos de la fase actual y columnas que no pueden entrar a la base"""
+        if self.phase == 1:
+            # Fase I: Minimizar suma de artificiales (convertido a MAX)
+            self.costs = np.zeros(self.form.n_total)
+            self.costs[self.form.artificial_start:] = -1.0
+        else:
+            self.costs = self.c_max
+        # Las artificiales nunca vuelven a entrar
+        self.blocked = np.zeros(self.form.n_total, dtype=bool)
+        self.blocked[self.form.artificial_start:] = True
+        self.eligible = ~self.blocked
+
+    def _z_value(self) -> float:
+        return float(self.costs[self.basic_vars] @ self.x_basic)
+
+    def _format_var_name(self, var_idx: int) -> str:
+        """Formatea el nombre de una variable según su índice"""
+        if var_idx < self.n_original_vars:
+            return f'x{var_idx + 1}'
+        elif var_idx < self.form.surplus_start:
+            return f'S{var_idx - self.form.slack_start + 1}'
+        elif var_idx < self.form.artificial_start:
+            return f'E{var_idx - self.form.surplus_start + 1}'
+        else:
+            return f'A{var_idx - self.form.artificial_start + 1}'
+
+    def _save_iteration(self, pivot_col: Optional[int], pivot_row: Optional[int],
+                        leaving_var: Optional[int], pivot_element: Optional[float],
+                        is_optimal: Optional[bool], operation: str):
+        """
+        Guarda un resumen de la iteración (sin tableau ni copia de la base,
+        para que el historial no crezca con el tamaño del problema).
+        """
+        if self.trace == 'none':
+            return
+        z_value = self._z_value()
+        if self.phase == 2 and self.original_opt_type == 'min':
+            objective_value = -z_value  # Convertir de MAX a MIN
+        else:
+            objective_value = z_value
+
+        record = {
+            'iteration': self.current_iteration,
+            'description': operation,
+            'tableau': None,
+            'basic_vars': None,
+            'pivot_col': pivot_col,
+            'pivot_row': pivot_row,
+            'entering_var': self._format_var_name(pivot_col) if pivot_col is not None else None,
+            'leaving_var': self._format_var_name(leaving_var) if leaving_var is not None else None,
+            'operation': operation,
+            'objective_value': round(objective_value, 4),
+            'is_optimal': is_optimal,
+            'z_value': round(z_value, 4),
+            'phase': self.phase,
+            'pivot_info': {
+                'row': pivot_row,
+                'col': pivot_col,
+                'element': round(pivot_element, 4)
+            } if pivot_row is not None else None
+        }
+        self.history_bytes += approx_bytes(record)
+        self.iterations.append(record)
+
+    def _reduced_costs(self) -> np.ndarray:
+        """Fila de costos reducidos (la fila Z del tableau): y^T a_j - c_j"""
+        y = self.factorization.btran(self.costs[self.basic_vars])
+        reduced = self.form.price(y) - self.costs
+        reduced[self.basic_vars] = 0.0
+        return reduced
+
+    def _find_pivot_column(self, reduced: np.ndarray) -> Optional[int]:
+        """Columna entrante según la regla de pricing (Bland si hay degeneración)"""
+        return self.pricing.select(reduced, self.eligible, self.EPS)
+
+    def _find_pivot_row(self, d: np.ndarray) -> Optional[int]:
+        """Ratio mínimo; en empates, la variable básica de menor índice (igual que SimplexTableau)"""
+        return bland_ratio_row(d, self.x_basic, self.basic_vars, self.EPS)
+
+    def _pivot(self, pivot_row: int, pivot_col: int, d: np.ndarray) -> int:
+        """Cambia la base: entra pivot_col en la posición pivot_row"""
+        rule = self.pricing
+        row_values = cross = None
+        if rule.needs_pivot_row:
+            unit = np.zeros(self.n_constraints)
+            unit[pivot_row] = 1.0
+            row_values = self.form.price(self.factorization.btran(unit))
+        if rule.needs_cross:
+            cross = self.form.price(self.factorization.btran(d))
+        degenerate = abs(self.x_basic[pivot_row]) <= self.EPS
+
+        theta = self.x_basic[pivot_row] / d[pivot_row]
+        self.x_basic -= theta * d
+        self.x_basic[pivot_row] = theta
+
+        leaving_var = self.basic_vars[pivot_row]
+        self.basic_vars[pivot_row] = pivot_col
+        rule.update(pivot_col, leaving_var, row_values, d, cross)
+        rule.record_step(degenerate)
+
+        self.factorization.update(pivot_row, d)
+        self.pivot_count += 1
+        if self.factorization.needs_refactor:
+            self.factorization.refactor(self.basic_vars)
+            self.x_basic = self.factorization.ftran(self.form.b)
+        return leaving_var
+
+    def _run_phase(self, label: str, max_iterations: Optional[int]) -> str:
+        """
+        Itera hasta el óptimo de la fase actual.
+
+        Args:
+            max_iterations: límite de pivoteos de la fase, además del presupuesto
+
+        Returns:
+            str: 'optimal', 'unbounded' o el límite agotado (ver solver_budget)
+        """
+        phase_pivots = 0
+        while True:
+            pivot_col = self._find_pivot_column(self._reduced_costs())
+            if pivot_col is None:
+                return 'optimal'
+
+            if max_iterations is not None and phase_pivots >= max_iterations:
+                return ITERATION_LIMIT
+            status = self.budget.exhausted(self.pivot_count, self.history_bytes)
+            if status is not None:
+                return status
+
+            d = self.factorization.ftran(self.form.column(pivot_col))
+            pivot_row = self._find_pivot_row(d)
+            if pivot_row is None:
+                return 'unbounded'
+
+            pivot_element = float(d[pivot_row])
+            leaving_var = self._pivot(pivot_row, pivot_col, d)
+            phase_pivots += 1
+            self.current_iteration += 1
+            if self.trace != 'none':
+                self._save_iteration(pivot_col, pivot_row, leaving_var, pivot_element, False,
+                                     f"{label} - entra {self._format_var_name(pivot_col)}, "
+                                     f"sale {self._format_var_name(leaving_var)}")
+
+    def _drive_out_artificials(self):
+        """
+        Saca de la base las artificiales que quedaron en cero al terminar la
+        Fase I. Si su fila no tiene coeficientes fuera de las artificiales,
+        la restricción es redundante y la artificial se queda (siempre en cero).
+        """
+        for r in range(self.n_constraints):
+            if self.basic_vars[r] < self.form.artificial_start:
+                continue
+            unit = np.zeros(self.n_constraints)
+            unit[r] = 1.0
+            row = self.form.price(self.factorization.btran(unit))
+            row[self.basic_vars] = 0.0
+            candidates = np.flatnonzero((np.abs(row) > self.EPS) & ~self.blocked)
+            if len(candidates) == 0:
+                continue
+            pivot_col = int(candidates[0])
+            d = self.factorization.ftran(self.form.column(pivot_col))
+            pivot_element = float(d[r])
+            leaving_var = self._pivot(r, pivot_col, d)
+            self.current_iteration += 1
+            if self.trace != 'none':
+                self._save_iteration(pivot_col, r, leaving_var, pivot_element, False,
+                                     f"Fase I - sale la artificial {self._format_var_name(leaving_var)} (en cero)")
+
+    def solve(self, max_iterations: Optional[int] = None) -> Dict:
+        """
+        Resuelve el problema usando Simplex revisado (con Dos Fases si es necesario)
+
+        Args:
+            max_iterations: límite de pivoteos por fase, además del presupuesto
+        """
+        try:
+            # FASE I: Eliminar variables artificiales
+            if self.phase == 1:
+                status = self._run_phase("Fase I", max_iterations)
+                if status in BUDGET_STATUSES:
+                    return self._build_solution(status)
+                if status == 'unbounded':
+                    return self._build_solution('unbounded', "Problema no acotado en Fase I")
+                if abs(self._z_value()) > self.EPS:
+                    return self._build_solution('infeasible',
+                        "El problema no tiene solución factible (artificiales en base con valor no cero)")
+
+                self._drive_out_artificials()
+
+                # Fase I completada, pasar a Fase II
+                self.phase = 2
+                self._set_phase_costs()
+                self.current_iteration += 1
+                self._save_iteration(None, None, None, None, False,
+                                     "Transición a Fase II - Función objetivo restaurada")
+
+            # FASE II: Optimizar función objetivo original
+            phase_label = "Fase II" if self.n_artificial > 0 else "Simplex"
+            status = self._run_phase(phase_label, max_iterations)
+            if status == 'optimal':
+                if self.iterations:
+                    self.iterations[-1]['is_optimal'] = True
+                return self._build_solution('optimal')
+            if status == 'unbounded':
+                return self._build_solution('unbounded', "Problema no acotado")
+            return self._build_solution(status)
+
+        except Exception as e:
+            return {
+                'success': False,
+                'status': 'error',
+                'error': f'Error durante la ejecución del Simplex revisado: {str(e)}'
+            }
+
+    def primal_values(self) -> np.ndarray:
+        """Valores de las variables de decisión en la base actual"""
+        x = np.zeros(self.form.n_total)
+        x[self.basic_vars] = self.x_basic
+        return x[:self.n_original_vars]
+
+    def _build_solution(self, status: str, error_msg: str = None) -> Dict:
+        """Construye el diccionario de solución (mismo formato que SimplexTableau)"""
+        if status == 'optimal':
+            x = self.primal_values()
+            solution = {f'x{i + 1}': round(float(value), 4) for i, value in enumerate(x)}
+            return {
+                'success': True,
+                'status': 'optimal',
+                'optimal_value': round(float(self.c_original @ x), 4),
+                'solution': solution,
+                'opt_type': self.original_opt_type,
+                'iterations': self.iterations,
+                'method': 'Simplex Revisado (LU)' + (' (Dos Fases)' if self.n_artificial > 0 else ''),
+                'basic_vars': list(self.basic_vars),
+                'estado_final': 'Óptimo'
+            }
+
+        elif status == 'infeasible':
+            return {
+                'success': False,
+                'status': 'infeasible',
+                'error': error_msg or 'El problema no tiene solución factible',
+                'iterations': self.iterations,
+                'estado_final': 'Infeasible'
+            }
+
+        elif status in BUDGET_STATUSES:
+            # Presupuesto agotado: la base actual (factible en Fase II)
+            result = {
+                'success': False,
+                'status': status,
+                'error': error_msg or self.budget.message(status, self.pivot_count),
+                'iterations': self.iterations,
+                'basic_vars': list(self.basic_vars),
+                'feasible': self.phase == 2,
+                'opt_type': self.original_opt_type,
+                'estado_final': 'Límite alcanzado'
+            }
+            if self.phase == 2:
+                x = self.primal_values()
+                result['solution'] = {f'x{i + 1}': round(float(value), 4) for i, value in enumerate(x)}
+                result['objective_value'] = round(float(self.c_original @ x), 4)
+            return result
+
+        elif status == 'unbounded':
+            return {
+                'success': False,
+                'status': 'unbounded',
+                'error': error_msg or 'La solución es no acotada (unbounded)',
+                'iterations': self.iterations,
+                'estado_final': 'No limitado'
+            }
+
+        else:
+            return {
+                'success': False,
+                'status': 'error',
+                'error': error_msg or 'Error desconocido',
+                'iterations': self.iterations,
+                'estado_final': 'Error'
+            }
@@ -0,0 +1,193 @@
+# archivo: simplex_kernels.py
+"""
+Operaciones vectorizadas comunes a los métodos simplex con tableau.
+
+Las funciones de selección reemplazan un recorrido en Python por un número
+fijo de operaciones de NumPy y eligen exactamente la misma fila o columna
+que el recorrido original, incluidos los empates (dual_leaving_row y
+dual_ratio_column son las del simplex dual). pivot_in_place y
+clear_small_values actualizan el tableau en el lugar con buffers reutilizados,
+y refactor_to_basis lo expresa en una base dada (arranque en caliente).
+"""
+
+from typing import Optional, Sequence
+
+import numpy as np
+
+
+def most_negative(z_row: np.ndarray, eps: float) -> Optional[int]:
+    """
+    Columna con el coeficiente más negativo de la fila Z (la primera si hay
+    empate), o None si ninguno es menor que -eps.
+    """
+    if len(z_row) == 0:
+        return None
+    j = int(np.argmin(z_row))
+    return j if z_row[j] < -eps else None
+
+
+def min_ratio_row(column: np.ndarray, rhs: np.ndarray, eps: float) -> Optional[int]:
+    """
+    Prueba del cociente mínimo: entre las filas con coeficiente mayor que eps
+    y cociente rhs/coeficiente no negativo, la de menor cociente (la primera
+    si hay empate). None si ninguna fila limita (no acotado).
+    """
+    positive = column > eps
+    ratios = np.divide(rhs, column, out=np.full(len(column), np.inf), where=positive)
+    ratios[ratios < 0] = np.inf
+    if len(ratios) == 0:
+        return None
+    i = int(np.argmin(ratios))
+    return i if ratios[i] != np.inf else None
+
+
+def bland_ratio_row(column: np.ndarray, rhs: np.ndarray, basic_vars: Sequence[int],
+                    eps: float) -> Optional[int]:
+    """
+    Prueba del cociente mínimo con desempate de Bland (menor índice de
+    variable básica) y tolerancia eps, como la recorre SimplexTableau:
+
+        para cada fila válida en orden:
+            si cociente < referencia - eps: referencia = cociente, elegida = fila
+            si no, si |cociente - referencia| < eps: se queda la de menor
+            variable básica
+
+    La referencia solo cambia en un nuevo mínimo estricto de los cocientes,
+    así que basta recorrer esos mínimos (normalmente pocos; si todos bajan
+    más de eps, no hace falta recorrerlos). La fila elegida es la de menor
+    variable básica entre la última referencia y las filas posteriores que
+    empatan con ella.
+    """
+    rows = np.flatnonzero(column > eps)
+    if len(rows) == 0:
+        return None
+    ratios = rhs[rows] / column[rows]
+    valid = ratios >= -eps
+    rows, ratios = rows[valid], ratios[valid]
+    if len(rows) == 0:
+        return None
+
+    # Posiciones donde los cocientes alcanzan un nuevo mínimo estricto
+    prefix_min = np.minimum.accumulate(ratios)
+    records = np.flatnonzero(np.concatenate(([True], ratios[1:] < prefix_min[:-1])))
+    values = ratios[records]
+    if np.all(values[1:] < values[:-1] - eps):
+        last = int(records[-1])
+    else:
+        reference = np.inf
+        for position, value in zip(records.tolist(), values.tolist()):
+            if value < reference - eps:
+                reference, last = value, position
+
+    reference = ratios[last]
+    ties = last + 1 + np.flatnonzero(np.abs(ratios[last + 1:] - reference) < eps)
+    candidates = rows[np.concatenate(([last], ties))]
+    basic = np.asarray(basic_vars)[candidates]
+    return int(candidates[np.argmin(basic)])
+
+
+def dual_leaving_row(rhs: np.ndarray, weights: np.ndarray, eps: float) -> Optional[int]:
+    """
+    Fila saliente del simplex dual: entre las filas con rhs menor que -eps,
+    la de mayor rhs² / peso (la primera si hay empate). Con pesos 1 es la de
+    RHS más negativo; con pesos ||e_iᵀ B⁻¹||² es dual steepest edge. None si
+    la base es primal factible.
+    """
+    infeasible = rhs < -eps
+    if not infeasible.any():
+        return None
+    scores = np.where(infeasible, rhs * rhs / weights, -1.0)
+    return int(np.argmax(scores))
+
+
+def dual_ratio_column(row: np.ndarray, z_row: np.ndarray, eps: float,
+                      lowest_index: bool = False) -> Optional[int]:
+    """
+    Prueba del cociente del simplex dual (fila Z con zⱼ - cⱼ ≤ 0): entre las
+    columnas con coeficiente menor que -eps en la fila saliente, la de menor
+    cociente (zⱼ - cⱼ) / aᵣⱼ. Entre los cocientes que empatan (a eps), la de
+    mayor |aᵣⱼ| (pivote más estable) o, con lowest_index, la de menor índice.
+    None si ninguna columna sirve (el problema primal es infactible).
+    """
+    columns = np.flatnonzero(row < -eps)
+    if len(columns) == 0:
+        return None
+    ratios = np.maximum(z_row[columns] / row[columns], 0.0)
+    ties = columns[ratios <= ratios.min() + eps]
+    if lowest_index:
+        return int(ties[0])
+    return int(ties[np.argmax(np.abs(row[ties]))])
+
+
+def pivot_in_place(tableau: np.ndarray, pivot_row: int, pivot_col: int, work: np.ndarray,
+                   divide: bool = True, skip_below: Optional[float] = None) -> np.ndarray:
+    """
+    Pivoteo de Gauss-Jordan en el lugar.
+
+    Divide la fila pivote por el elemento pivote y resta a las demás filas
+    su múltiplo de la fila pivote, todo en una sola resta de un producto
+    exterior (calculado en work, sin crear arreglos por fila).
+
+    Args:
+        tableau: tableau a modificar
+        work: buffer de la misma forma que tableau (se sobrescribe)
+        divide: si es False, la fila pivote no se divide (el pivote ya es 1)
+        skip_below: si se indica, las filas cuyo multiplicador no supera
+                    este valor en valor absoluto no se modifican
+
+    Returns:
+        np.ndarray: multiplicador de cada fila (0 en la fila pivote)
+    """
+    row = tableau[pivot_row]
+    if divide:
+        row /= row[pivot_col]
+    multipliers = tableau[:, pivot_col].copy()
+    multipliers[pivot_row] = 0.0
+    if skip_below is None:
+        update = multipliers != 0.0
+    else:
+        update = np.abs(multipliers) > skip_below
+    np.multiply.outer(multipliers, row, out=work)
+    np.subtract(tableau, work, out=tableau, where=update[:, None])
+    return multipliers
+
+
+def clear_small_values(tableau: np.ndarray, tolerance: float, work: np.ndarray):
+    """Pone en 0 (en el lugar) los valores con valor absoluto menor que tolerance."""
+    np.abs(tableau, out=work)
+    np.copyto(tableau, 0.0, where=work < tolerance)
+
+
+def refactor_to_basis(rows: np.ndarray, basis: Sequence[int], n_candidates: int,
+                      eps: float) -> Optional[np.ndarray]:
+    """
+    Expresa las filas de restricciones [A | b] en la base dada: B⁻¹ [A | b],
+    con las columnas básicas exactamente iguales a la identidad y los
+    valores básicos en [-eps, 0) llevados a 0.
+
+    Args:
+        rows: filas de restricciones del tableau (la última columna es b)
+        basis: índice de la columna básica de cada fila
+        n_candidates: solo las columnas 0..n_candidates-1 pueden ser básicas
+        eps: tolerancia de factibilidad; B también se rechaza si su número
+             de condición supera 1/eps
+
+    Returns:
+        np.ndarray: las filas refactorizadas, o None si la base no sirve
+        (tamaño o índices inválidos, B singular o casi, o B⁻¹ b < -eps)
+    """
+    m = rows.shape[0]
+    basis = np.asarray(basis)
+    if (basis.shape != (m,) or not np.issubdtype(basis.dtype, np.integer)
+            or np.any(basis < 0) or np.any(basis >= n_candidates) or len(np.unique(basis)) != m):
+        return None
+    B = rows[:, basis]
+    if m > 0 and np.linalg.cond(B) > 1.0 / eps:
+        return None
+    refactored = np.linalg.solve(B, rows) if m > 0 else rows.copy()
+    refactored[:, basis] = np.eye(m)
+    rhs = refactored[:, -1]
+    if np.any(rhs < -eps):
+        return None
+    np.maximum(rhs, 0.0, out=rhs)
+    return refactored
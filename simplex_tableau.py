@@ -4,25 +4,54 @@ Soporta MAX y MIN, con Método de Dos Fases para variables artificiales
 """
 
 import numpy as np
-from typing import Dict, List, Tuple, Optional
-import re
+from typing import Dict, List, Tuple, Optional, Sequence
+
+import lp_parser
+from iteration_history import IterationHistory
+from pricing import make_pricing
+from simplex_kernels import bland_ratio_row, pivot_in_place, refactor_to_basis
+from solver_budget import BUDGET_STATUSES, ITERATION_LIMIT, SolverBudget
+from solver_trace import check_trace_level
+from sparse_matrix import StandardForm
+from revised_simplex import RevisedSimplex
+
+
+def _clean_tableau(tableau: np.ndarray) -> np.ndarray:
+    """Copia del tableau con los valores muy pequeños en 0 (para mostrarlo)"""
+    return np.where(np.abs(tableau) < 1e-10, 0.0, tableau)
 
 
 class SimplexTableau:
     EPS = 1e-9  # Tolerancia para comparaciones numéricas
     
-    def __init__(self, c: List[float], A: List[List[float]], b: List[float], 
-                 constraint_types: List[str], opt_type: str = 'max'):
+    def __init__(self, c: List[float], A, b: List[float], 
+                 constraint_types: List[str], opt_type: str = 'max',
+                 pricing: str = 'dantzig', trace: str = 'full',
+                 budget: Optional[SolverBudget] = None,
+                 initial_basis: Optional[Sequence[int]] = None):
         """
         Inicializa el problema de programación lineal
         
         Args:
             c: Coeficientes de la función objetivo
-            A: Matriz de coeficientes de restricciones
+            A: Matriz de coeficientes de restricciones (lista de listas,
+               arreglo de NumPy o CSRMatrix)
             b: Vector de términos independientes
             constraint_types: Lista de tipos ['<=', '>=', '=']
             opt_type: 'max' o 'min'
+            pricing: regla de la variable entrante: 'dantzig', 'steepest_edge',
+                     'devex' o 'bland' (ver pricing.PRICING_RULES)
+            trace: historial de iteraciones: 'full', 'summary' o 'none'
+                   (ver solver_trace)
+            budget: límites de iteraciones, tiempo y memoria del historial
+                    (ver solver_budget; por defecto, solo DEFAULT_MAX_ITERATIONS)
+            initial_basis: base inicial (índice de columna por fila, como
+                           'basic_vars' de un resultado anterior); si es
+                           factible, el solve empieza directo en Fase II
         """
+        self.trace = check_trace_level(trace)
+        self.budget = budget or SolverBudget()
+        self.pivot_count = 0  # pivoteos en todas las fases
         self.opt_type = opt_type.lower()
         self.original_opt_type = self.opt_type
         self.n_original_vars = len(c)
@@ -43,104 +72,94 @@ class SimplexTableau:
         self.tableau, self.basic_vars, self.artificial_vars = self._build_initial_tableau(
             c, A, b, constraint_types
         )
-        
-        # Historial de iteraciones
+        self._pivot_work = np.empty_like(self.tableau)  # buffer del pivoteo en el lugar
+        
+        # Arranque en caliente: None si no se dio base, True/False si se usó o no
+        self.warm_start = None
+        if initial_basis is not None:
+            self.warm_start = self._warm_start(c, initial_basis)
+        
+        # Regla de pricing; el tableau ya está expresado en la base inicial
+        # (B⁻¹ A), así que B⁻¹ a_j es la columna j del tableau
+        self.pricing = make_pricing(pricing, np.sum(self.tableau[:-1, :-1] ** 2, axis=0))
+        # Las variables artificiales nunca entran a la base
+        self.entering_mask = np.ones(self.tableau.shape[1] - 1, dtype=bool)
+        self.entering_mask[self.artificial_vars] = False
+        
+        # Historial de iteraciones: tableau inicial + pivoteos (ver iteration_history)
+        self.history = IterationHistory(self.tableau, view=_clean_tableau) if self.trace == 'full' else None
         self.iterations = []
         self.current_iteration = 0
-        self.phase = 1 if self.n_artificial > 0 else 2
+        self.phase = 1 if self.n_artificial > 0 and not self.warm_start else 2
         
         # Guardar estado inicial
         self._save_iteration(None, None, None, None, 
-                           f"Tableau Inicial - {'Fase I' if self.phase == 1 else 'Fase II'}")
+                           f"Tableau Inicial - {'Fase I' if self.phase == 1 else 'Fase II'}"
+                           + (" (base inicial dada)" if self.warm_start else ""))
     
-    def _build_initial_tableau(self, c: List[float], A: List[List[float]], 
-                               b: List[float], constraint_types: List[str]) -> Tuple:
-        """Construye el tableau inicial con todas las variables necesarias"""
-        tableau_rows = []
-        basic_vars = []
-        artificial_vars = []
-        
-        # Determinar cuántas variables de cada tipo necesitamos
-        for ct in constraint_types:
-            if ct == '<=':
-                self.n_slack += 1
-            elif ct == '>=':
-                self.n_surplus += 1
-                self.n_artificial += 1
-            elif ct == '=':
-                self.n_artificial += 1
-        
-        total_vars = self.n_original_vars + self.n_slack + self.n_surplus + self.n_artificial
-        
-        # Construir filas de restricciones
-        slack_idx = 0
-        surplus_idx = 0
-        artificial_idx = 0
+    def _build_initial_tableau(self, c: List[float], A, b: List[float],
+                               constraint_types: List[str]) -> Tuple:
+        """
+        Construye el tableau inicial con todas las variables necesarias.
         
-        for i in range(self.n_constraints):
-            row = A[i].copy()
-            
-            # Agregar variables de holgura (todas como ceros inicialmente)
-            for _ in range(self.n_slack):
-                row.append(0.0)
-            
-            # Agregar variables de exceso (todas como ceros inicialmente)
-            for _ in range(self.n_surplus):
-                row.append(0.0)
-            
-            # Agregar variables artificiales (todas como ceros inicialmente)
-            for _ in range(self.n_artificial):
-                row.append(0.0)
-            
-            # Configurar la variable específica para esta restricción
-            if constraint_types[i] == '<=':
-                # Variable de holgura
-                row[self.n_original_vars + slack_idx] = 1.0
-                basic_vars.append(self.n_original_vars + slack_idx)
-                slack_idx += 1
-            elif constraint_types[i] == '>=':
-                # Variable de exceso (negativa) y artificial (positiva)
-                row[self.n_original_vars + self.n_slack + surplus_idx] = -1.0
-                row[self.n_original_vars + self.n_slack + self.n_surplus + artificial_idx] = 1.0
-                basic_vars.append(self.n_original_vars + self.n_slack + self.n_surplus + artificial_idx)
-                artificial_vars.append(self.n_original_vars + self.n_slack + self.n_surplus + artificial_idx)
-                surplus_idx += 1
-                artificial_idx += 1
-            elif constraint_types[i] == '=':
-                # Solo variable artificial
-                row[self.n_original_vars + self.n_slack + self.n_surplus + artificial_idx] = 1.0
-                basic_vars.append(self.n_original_vars + self.n_slack + self.n_surplus + artificial_idx)
-                artificial_vars.append(self.n_original_vars + self.n_slack + self.n_surplus + artificial_idx)
-                artificial_idx += 1
-            
-            row.append(b[i])  # RHS
-            tableau_rows.append(row)
+        A puede ser densa o dispersa (ver sparse_matrix.as_csr); las columnas
+        de holgura, exceso y artificiales se escriben directamente en el
+        tableau, sin armar filas intermedias.
+        """
+        form = StandardForm(A, b, constraint_types)
+        self.standard_form = form
+        self.n_slack = form.n_slack
+        self.n_surplus = form.n_surplus
+        self.n_artificial = form.n_artificial
+        
+        # Filas de restricciones: [A | holguras | excesos | artificiales | b]
+        tableau = np.zeros((self.n_constraints + 1, form.n_total + 1))
+        form.fill_tableau(tableau)
+        basic_vars = form.initial_basis()
+        artificial_vars = form.artificial_columns()
         
         # Fila Z
         if self.n_artificial > 0:
             # Fase I: Minimizar suma de artificiales (convertido a MAX)
-            z_row = [0.0] * total_vars
-            for ai in artificial_vars:
-                z_row[ai] = -1.0  # Queremos maximizar -A (minimizar A)
+            tableau[-1, form.artificial_start:form.n_total] = -1.0  # Queremos maximizar -A (minimizar A)
         else:
             # Fase II directa: usar función objetivo original
-            z_row = [-ci for ci in c]  # MAX
-            z_row.extend([0.0] * (self.n_slack + self.n_surplus + self.n_artificial))
-        
-        z_row.append(0.0)  # Valor inicial de Z
-        tableau_rows.append(z_row)
-        
-        tableau = np.array(tableau_rows, dtype=float)
+            tableau[-1, :self.n_original_vars] = -np.asarray(c, dtype=float)  # MAX
         
         # Si tenemos artificiales, hacer la fila Z dual factible
-        if self.n_artificial > 0:
-            for i in range(self.n_constraints):
-                if basic_vars[i] in artificial_vars:
-                    # Restar la fila de la variable artificial de la fila Z
-                    tableau[-1] = tableau[-1] - tableau[i]
+        # (restar la fila de cada variable artificial de la fila Z)
+        for i in form.artificial_rows:
+            tableau[-1] = tableau[-1] - tableau[i]
         
         return tableau, basic_vars, artificial_vars
     
+    def _warm_start(self, c: List[float], basis: Sequence[int]) -> bool:
+        """
+        Refactoriza el tableau a la base dada y pone la fila Z de la función
+        objetivo (Fase II). Si la base no es válida (artificiales, índices
+        fuera de rango, singular) o no es factible, el tableau no cambia y
+        se resuelve desde la base de holguras/artificiales.
+        
+        Returns:
+            bool: True si se usó la base dada
+        """
+        m = self.n_constraints
+        artificial_start = self.standard_form.artificial_start
+        rows = refactor_to_basis(self.tableau[:m], basis, artificial_start, self.EPS)
+        if rows is None:
+            return False
+        
+        self.tableau[:m] = rows
+        self.basic_vars = [int(j) for j in basis]
+        
+        # Fila Z (MAX) en forma canónica: cero en las columnas básicas
+        z_row = np.zeros(self.tableau.shape[1])
+        z_row[:self.n_original_vars] = -np.asarray(c, dtype=float)
+        self.tableau[-1] = z_row - z_row[self.basic_vars] @ rows
+        # Las artificiales no entran a la base (igual que tras la Fase I)
+        self.tableau[-1, artificial_start:-1] = 0.0
+        return True
+    
     def _clean_small_values(self, value: float, tolerance: float = 1e-10) -> float:
         """Redondea valores muy pequeños a 0 para evitar notación científica"""
         if abs(value) < tolerance:
@@ -150,7 +169,10 @@ class SimplexTableau:
     def _save_iteration(self, pivot_col: Optional[int], pivot_row: Optional[int],
                        entering_var: Optional[int], leaving_var: Optional[int],
                        operation: str):
-        """Guarda el estado actual del tableau"""
+        """Guarda el estado actual del tableau (según el nivel de traza)"""
+        if self.trace == 'none':
+            return
+        
         # Verificar optimalidad
         z_row = self.tableau[-1, :-1]
         is_optimal = np.all(z_row >= -self.EPS)
@@ -171,17 +193,14 @@ class SimplexTableau:
         entering_var_name = self._format_var_name(entering_var) if entering_var is not None else None
         leaving_var_name = self._format_var_name(leaving_var) if leaving_var is not None else None
         
-        # Limpiar tableau de valores muy pequeños
-        cleaned_tableau = np.zeros_like(self.tableau)
-        for i in range(self.tableau.shape[0]):
-            for j in range(self.tableau.shape[1]):
-                cleaned_tableau[i, j] = self._clean_small_values(float(self.tableau[i, j]))
+        # En 'full' el tableau (limpio) se reconstruye desde el historial al pedirlo;
+        # en 'summary' no se guarda
+        full = self.trace == 'full'
         
         iteration_data = {
             'iteration': self.current_iteration,
             'description': operation,
-            'tableau': cleaned_tableau.copy(),
-            'basic_vars': self.basic_vars.copy(),
+            'basic_vars': self.basic_vars.copy() if full else None,
             'pivot_col': pivot_col,
             'pivot_row': pivot_row,
             'entering_var': entering_var_name,
@@ -195,14 +214,26 @@ class SimplexTableau:
                 'n_rows': self.n_constraints,
                 'n_cols': self.tableau.shape[1] - 1,
                 'basic_vars': [self._format_var_name(bv) for bv in self.basic_vars]
-            },
+            } if full else None,
             'pivot_info': {
                 'row': pivot_row,
                 'col': pivot_col,
                 'element': round(self._clean_small_values(float(self.tableau[pivot_row, pivot_col])), 4)
             } if pivot_row is not None and pivot_col is not None else None
         }
-        self.iterations.append(iteration_data)
+        if full:
+            self.iterations.append(self.history.record(iteration_data))
+        else:
+            iteration_data['tableau'] = None
+            self.iterations.append(iteration_data)
+    
+    def _save_pivot(self, label: str, pivot_col: int, pivot_row: int,
+                    entering_var: int, leaving_var: int, operations: str):
+        """Guarda una iteración de pivoteo; la descripción solo se arma si hay traza"""
+        if self.trace == 'none':
+            return
+        self._save_iteration(pivot_col, pivot_row, entering_var, leaving_var,
+                             f"{label} - {operations}" if operations else label)
     
     def _format_var_name(self, var_idx: int) -> str:
         """Formatea el nombre de una variable según su índice"""
@@ -216,92 +247,104 @@ class SimplexTableau:
             return f'A{var_idx - self.n_original_vars - self.n_slack - self.n_surplus + 1}'
     
     def _find_pivot_column(self) -> Optional[int]:
-        """Encuentra la columna pivote (Bland's Rule: menor índice con valor negativo)"""
+        """Encuentra la columna pivote con la regla de pricing (Bland si hay degeneración)"""
         z_row = self.tableau[-1, :-1]
-        
-        # Buscar valores negativos (queremos maximizar)
-        negative_indices = []
-        for i in range(len(z_row)):
-            if z_row[i] < -self.EPS:
-                # En Fase I, NO permitir que variables artificiales entren a la base
-                if self.phase == 1 and i in self.artificial_vars:
-                    continue
-                negative_indices.append(i)
-        
-        if not negative_indices:
-            return None  # Óptimo alcanzado
-        
-        # Bland's Rule: elegir el índice menor
-        return min(negative_indices)
+        # Las variables artificiales NO pueden entrar a la base
+        return self.pricing.select(z_row, self.entering_mask, self.EPS)
     
     def _find_pivot_row(self, pivot_col: int) -> Optional[int]:
         """Encuentra la fila pivote usando el ratio mínimo (Bland's Rule en empates)"""
-        min_ratio = float('inf')
-        pivot_row = None
-        
-        for i in range(self.n_constraints):
-            denominator = self.tableau[i, pivot_col]
-            if denominator > self.EPS:
-                ratio = self.tableau[i, -1] / denominator
-                if ratio >= -self.EPS:  # Ratio no negativo
-                    if ratio < min_ratio - self.EPS:
-                        min_ratio = ratio
-                        pivot_row = i
-                    elif abs(ratio - min_ratio) < self.EPS:
-                        # Empate: Bland's Rule (menor índice de variable básica)
-                        if pivot_row is None or self.basic_vars[i] < self.basic_vars[pivot_row]:
-                            pivot_row = i
-        
-        return pivot_row
+        m = self.n_constraints
+        return bland_ratio_row(self.tableau[:m, pivot_col], self.tableau[:m, -1],
+                               self.basic_vars, self.EPS)
     
     def _pivot_operation(self, pivot_row: int, pivot_col: int) -> str:
-        """Realiza la operación de pivoteo"""
+        """
+        Realiza la operación de pivoteo. Devuelve las operaciones de fila
+        como texto solo con traza 'full' (si no, una cadena vacía).
+        """
         pivot_element = self.tableau[pivot_row, pivot_col]
-        operations = []
         
         # 1. Dividir fila pivote
-        if abs(pivot_element - 1.0) > self.EPS:
+        divide = abs(pivot_element - 1.0) > self.EPS
+        
+        # 2. Hacer ceros en el resto de la columna (solo filas con multiplicador no nulo)
+        multipliers = pivot_in_place(self.tableau, pivot_row, pivot_col, self._pivot_work,
+                                     divide=divide, skip_below=self.EPS)
+        if self.history is not None:
+            self.history.pivot(pivot_row, pivot_col, divide=divide, skip_below=self.EPS)
+        if self.trace != 'full':
+            return ''
+        
+        operations = []
+        if divide:
             operations.append(f"F{pivot_row + 1} = F{pivot_row + 1} / {pivot_element:.4g}")
-            self.tableau[pivot_row] = self.tableau[pivot_row] / pivot_element
-        
-        # 2. Hacer ceros en el resto de la columna
-        for i in range(len(self.tableau)):
-            if i != pivot_row:
-                multiplier = self.tableau[i, pivot_col]
-                if abs(multiplier) > self.EPS:
-                    row_name = f"F{i + 1}" if i < self.n_constraints else "FZ"
-                    pivot_row_name = f"F{pivot_row + 1}"
-                    
-                    if multiplier > 0:
-                        operations.append(f"{row_name} = {row_name} - {multiplier:.4g} × {pivot_row_name}")
-                    else:
-                        operations.append(f"{row_name} = {row_name} + {abs(multiplier):.4g} × {pivot_row_name}")
-                    
-                    self.tableau[i] = self.tableau[i] - multiplier * self.tableau[pivot_row]
+        pivot_row_name = f"F{pivot_row + 1}"
+        for i in np.flatnonzero(np.abs(multipliers) > self.EPS):
+            multiplier = multipliers[i]
+            row_name = f"F{i + 1}" if i < self.n_constraints else "FZ"
+            if multiplier > 0:
+                operations.append(f"{row_name} = {row_name} - {multiplier:.4g} × {pivot_row_name}")
+            else:
+                operations.append(f"{row_name} = {row_name} + {abs(multiplier):.4g} × {pivot_row_name}")
         
         return " | ".join(operations)
     
-    def solve(self, max_iterations: int = 100) -> Dict:
-        """Resuelve el problema usando Simplex (con Dos Fases si es necesario)"""
+    def _pivot_and_price(self, pivot_row: int, pivot_col: int) -> str:
+        """Pivotea y actualiza la regla de pricing (pesos y detección de degeneración)"""
+        rule = self.pricing
+        m = self.n_constraints
+        row_values = self.tableau[pivot_row, :-1].copy() if rule.needs_pivot_row else None
+        column = self.tableau[:m, pivot_col].copy()
+        cross = self.tableau[:m, :-1].T @ column if rule.needs_cross else None
+        degenerate = abs(self.tableau[pivot_row, -1]) <= self.EPS
+        leaving_var = self.basic_vars[pivot_row]
+        
+        operations = self._pivot_operation(pivot_row, pivot_col)
+        self.pivot_count += 1
+        rule.update(pivot_col, leaving_var, row_values, column, cross)
+        rule.record_step(degenerate)
+        return operations
+    
+    def _budget_status(self, phase_pivots: int, max_iterations: Optional[int]) -> Optional[str]:
+        """Límite agotado antes del siguiente pivoteo (None si se puede seguir)"""
+        if max_iterations is not None and phase_pivots >= max_iterations:
+            return ITERATION_LIMIT
+        history_bytes = self.history.nbytes if self.history is not None else 0
+        return self.budget.exhausted(self.pivot_count, history_bytes)
+    
+    def solve(self, max_iterations: Optional[int] = None) -> Dict:
+        """
+        Resuelve el problema usando Simplex (con Dos Fases si es necesario)
+        
+        Args:
+            max_iterations: límite de pivoteos por fase, además del presupuesto
+        """
         try:
             # FASE I: Eliminar variables artificiales
             if self.phase == 1:
-                for iteration in range(max_iterations):
+                phase_pivots = 0
+                while True:
                     pivot_col = self._find_pivot_column()
                     
                     if pivot_col is None:
-                        # Verificar si todas las artificiales salieron de la base
-                        artificial_in_basis = any(bv in self.artificial_vars for bv in self.basic_vars)
-                        
-                        if artificial_in_basis or abs(self.tableau[-1, -1]) > self.EPS:
+                        # La suma de artificiales debe ser cero
+                        if abs(self.tableau[-1, -1]) > self.EPS:
                             # Problema infactible
                             return self._build_solution('infeasible', 
                                 "El problema no tiene solución factible (artificiales en base con valor no cero)")
                         
+                        # Las artificiales que siguen en la base valen cero
+                        self._drive_out_artificials()
+                        
                         # Fase I completada, pasar a Fase II
                         self._transition_to_phase_ii()
                         break
                     
+                    status = self._budget_status(phase_pivots, max_iterations)
+                    if status is not None:
+                        return self._build_solution(status)
+                    
                     pivot_row = self._find_pivot_row(pivot_col)
                     
                     if pivot_row is None:
@@ -310,23 +353,26 @@ class SimplexTableau:
                     # Realizar pivoteo
                     entering_var = pivot_col
                     leaving_var = self.basic_vars[pivot_row]
-                    operations = self._pivot_operation(pivot_row, pivot_col)
+                    operations = self._pivot_and_price(pivot_row, pivot_col)
                     self.basic_vars[pivot_row] = entering_var
+                    phase_pivots += 1
                     
                     self.current_iteration += 1
-                    self._save_iteration(pivot_col, pivot_row, entering_var, leaving_var, 
-                                       f"Fase I - {operations}")
-                
-                if self.phase == 1:
-                    return self._build_solution('max_iterations', "Máximo de iteraciones en Fase I")
+                    self._save_pivot("Fase I", pivot_col, pivot_row, entering_var, leaving_var,
+                                     operations)
             
             # FASE II: Optimizar función objetivo original
-            for iteration in range(max_iterations):
+            phase_pivots = 0
+            while True:
                 pivot_col = self._find_pivot_column()
                 
                 if pivot_col is None:
                     return self._build_solution('optimal')
                 
+                status = self._budget_status(phase_pivots, max_iterations)
+                if status is not None:
+                    return self._build_solution(status)
+                
                 pivot_row = self._find_pivot_row(pivot_col)
                 
                 if pivot_row is None:
@@ -335,15 +381,14 @@ class SimplexTableau:
                 # Realizar pivoteo
                 entering_var = pivot_col
                 leaving_var = self.basic_vars[pivot_row]
-                operations = self._pivot_operation(pivot_row, pivot_col)
+                operations = self._pivot_and_price(pivot_row, pivot_col)
                 self.basic_vars[pivot_row] = entering_var
+                phase_pivots += 1
                 
                 self.current_iteration += 1
                 phase_label = "Fase II" if self.n_artificial > 0 else "Simplex"
-                self._save_iteration(pivot_col, pivot_row, entering_var, leaving_var,
-                                   f"{phase_label} - {operations}")
-            
-            return self._build_solution('max_iterations', "Máximo de iteraciones alcanzado")
+                self._save_pivot(phase_label, pivot_col, pivot_row, entering_var, leaving_var,
+                                 operations)
         
         except Exception as e:
             return {
@@ -352,12 +397,36 @@ class SimplexTableau:
                 'error': f'Error durante la ejecución del Simplex: {str(e)}'
             }
     
+    def _drive_out_artificials(self):
+        """
+        Saca de la base las artificiales que quedaron en cero al terminar la
+        Fase I. Si su fila no tiene coeficientes fuera de las artificiales,
+        la restricción es redundante y la artificial se queda (siempre en cero).
+        """
+        artificial_start = self.standard_form.artificial_start
+        for i in range(self.n_constraints):
+            leaving_var = self.basic_vars[i]
+            if leaving_var < artificial_start:
+                continue
+            candidates = np.flatnonzero(np.abs(self.tableau[i, :artificial_start]) > self.EPS)
+            if len(candidates) == 0:
+                continue
+            
+            pivot_col = int(candidates[0])
+            operations = self._pivot_and_price(i, pivot_col)
+            self.basic_vars[i] = pivot_col
+            
+            self.current_iteration += 1
+            if self.trace != 'none':
+                self._save_pivot(f"Fase I - sale la artificial {self._format_var_name(leaving_var)} (en cero)",
+                                 pivot_col, i, pivot_col, leaving_var, operations)
+    
     def _transition_to_phase_ii(self):
         """Transición de Fase I a Fase II"""
         self.phase = 2
         
-        # Reemplazar fila Z con la función objetivo original
-        c = self.c_original if self.original_opt_type == 'min' else [-ci for ci in self.c_original]
+        # Reemplazar fila Z con la función objetivo original (como MAX)
+        c = [-ci for ci in self.c_original] if self.original_opt_type == 'min' else self.c_original
         
         # Construir Z-row: solo variables originales tienen costos
         z_row = [-ci for ci in c]  # MAX de variables originales
@@ -378,50 +447,49 @@ class SimplexTableau:
                     multiplier = self.tableau[-1, bv]
                     self.tableau[-1] = self.tableau[-1] - multiplier * self.tableau[i]
         
-        # IMPORTANTE: Forzar a 0 los coeficientes de variables de exceso y artificiales
-        # Estas variables no deben entrar a la base en Fase II
-        start_idx = self.n_original_vars + self.n_slack
-        end_idx = start_idx + self.n_surplus + self.n_artificial
-        for j in range(start_idx, end_idx):
-            self.tableau[-1, j] = 0.0
+        # Las artificiales no vuelven a entrar a la base: su columna en Z se deja en 0
+        # (las de exceso sí pueden entrar en Fase II)
+        self.tableau[-1, self.standard_form.artificial_start:-1] = 0.0
+        if self.history is not None:
+            self.history.keyframe(self.tableau)
         
         self.current_iteration += 1
         self._save_iteration(None, None, None, None, "Transición a Fase II - Función objetivo restaurada")
     
+    def _current_solution(self) -> Dict[str, float]:
+        """Valores de las variables originales en la base actual"""
+        values = np.zeros(self.n_original_vars)
+        basic = np.asarray(self.basic_vars)
+        rows = np.flatnonzero(basic < self.n_original_vars)
+        values[basic[rows]] = self.tableau[rows, -1]
+        return {f'x{i + 1}': round(float(value), 4) for i, value in enumerate(values)}
+    
+    def _current_objective(self) -> float:
+        """Valor de la función objetivo original en la base actual (Fase II)"""
+        z_value = self.tableau[-1, -1]
+        if self.original_opt_type == 'min':
+            # Internamente se maximizó -c: el óptimo es -Z
+            return -z_value
+        # Para MAX, el RHS es directo
+        return z_value
+    
     def _build_solution(self, status: str, error_msg: str = None) -> Dict:
         """Construye el diccionario de solución"""
         if status == 'optimal':
-            solution = {}
-            for i in range(self.n_original_vars):
-                if i in self.basic_vars:
-                    row_idx = self.basic_vars.index(i)
-                    value = self.tableau[row_idx, -1]
-                    solution[f'x{i + 1}'] = round(float(value), 4)
-                else:
-                    solution[f'x{i + 1}'] = 0.0
-            
-            z_value = self.tableau[-1, -1]
-            if self.original_opt_type == 'min':
-                # Para MIN, el RHS de Z-row después de hacer dual-factible
-                # representa directamente el valor óptimo (positivo)
-                optimal_value = z_value
-            else:
-                # Para MAX, el RHS es directo
-                optimal_value = z_value
-            
-            return {
+            result = {
                 'success': True,
                 'status': 'optimal',
-                'optimal_value': round(optimal_value, 4),
-                'solution': solution,
+                'optimal_value': round(self._current_objective(), 4),
+                'solution': self._current_solution(),
                 'opt_type': self.original_opt_type,
                 'iterations': self.iterations,
                 'method': 'Simplex con Tableau' + (' (Dos Fases)' if self.n_artificial > 0 else ''),
+                'basic_vars': list(self.basic_vars),
                 'estado_final': 'Óptimo'
             }
         
         elif status == 'infeasible':
-            return {
+            result = {
                 'success': False,
                 'status': 'infeasible',
                 'error': error_msg or 'El problema no tiene solución factible',
@@ -429,8 +497,25 @@ class SimplexTableau:
                 'estado_final': 'Infeasible'
             }
         
+        elif status in BUDGET_STATUSES:
+            # Presupuesto agotado: se devuelve la base actual (en Fase II es
+            # factible y la mejor encontrada, porque Z no empeora)
+            result = {
+                'success': False,
+                'status': status,
+                'error': error_msg or self.budget.message(status, self.pivot_count),
+                'iterations': self.iterations,
+                'basic_vars': list(self.basic_vars),
+                'feasible': self.phase == 2,
+                'opt_type': self.original_opt_type,
+                'estado_final': 'Límite alcanzado'
+            }
+            if self.phase == 2:
+                result['solution'] = self._current_solution()
+                result['objective_value'] = round(self._current_objective(), 4)
+        
         elif status == 'unbounded':
-            return {
+            result = {
                 'success': False,
                 'status': 'unbounded',
                 'error': error_msg or 'La solución es no acotada (unbounded)',
@@ -439,81 +524,40 @@ class SimplexTableau:
             }
         
         else:
-            return {
+            result = {
                 'success': False,
                 'status': 'error',
                 'error': error_msg or 'Error desconocido',
                 'iterations': self.iterations,
                 'estado_final': 'Error'
             }
+        
+        if self.warm_start is not None:
+            result['warm_start'] = self.warm_start
+        return result
+
+
+# Motores de solve_simplex_tableau (mismo formato de resultado)
+ENGINES = {
+    'tableau': SimplexTableau,
+    'revised': RevisedSimplex,
+}
 
 
 def parse_objective(s: str) -> Tuple[str, List[float]]:
     """Parse la función objetivo"""
-    s_lower = s.lower().strip()
-    opt_type = 'max' if 'max' in s_lower else 'min'
-    
-    if '=' not in s:
-        raise ValueError("La función objetivo debe contener '='")
-    
-    expr = s.split('=')[1].strip().replace(' ', '').lower()
-    variables = re.findall(r'x\d+', expr)
-    
-    if not variables:
+    opt_type, terms = lp_parser.parse_objective(s)
+    if not terms:
         raise ValueError("No se encontraron variables")
     
-    n_vars = max(int(v[1:]) for v in variables)
-    
-    if expr[0] not in ['+', '-']:
-        expr = '+' + expr
-    
-    coef_dict = {}
-    pattern = r'([+-]?\d*\.?\d*)x(\d+)'
-    for coef_str, var_num in re.findall(pattern, expr):
-        var_num = int(var_num)
-        if coef_str in ['', '+']:
-            coef = 1.0
-        elif coef_str == '-':
-            coef = -1.0
-        else:
-            coef = float(coef_str)
-        coef_dict[var_num] = coef_dict.get(var_num, 0.0) + coef
-    
-    coefficients = [coef_dict.get(i, 0.0) for i in range(1, n_vars + 1)]
-    return opt_type, coefficients
+    n_vars = lp_parser.max_variable_index(terms)
+    return opt_type or 'min', lp_parser.dense_coefficients(terms, n_vars)
 
 
-def parse_constraint(s: str, n_vars: int) -> Tuple[List[float], str, float]:
-    """Parse una restricción"""
-    if '<=' in s:
-        op, parts = '<=', s.split('<=')
-    elif '>=' in s:
-        op, parts = '>=', s.split('>=')
-    elif '=' in s:
-        op, parts = '=', s.split('=')
-    else:
-        raise ValueError(f"No se encontró operador en: {s}")
-    
-    lhs, rhs = parts[0].strip(), parts[1].strip()
-    rhs_value = float(rhs)
-    
-    lhs_clean = lhs.replace(' ', '').lower()
-    if lhs_clean[0] not in ['+', '-']:
-        lhs_clean = '+' + lhs_clean
-    
-    coef_dict = {}
-    pattern = r'([+-]?\d*\.?\d*)x(\d+)'
-    for coef_str, var_num in re.findall(pattern, lhs_clean):
-        var_num = int(var_num)
-        if coef_str in ['', '+']:
-            coef = 1.0
-        elif coef_str == '-':
-            coef = -1.0
-        else:
-            coef = float(coef_str)
-        coef_dict[var_num] = coef_dict.get(var_num, 0.0) + coef
-    
-    coefficients = [coef_dict.get(i, 0.0) for i in range(1, n_vars + 1)]
+def _constraint_row(terms: Dict[str, float], op: str, rhs_value: float,
+                    n_vars: int) -> Tuple[List[float], str, float]:
+    """Convierte una restricción parseada en una fila densa con RHS no negativo"""
+    coefficients = lp_parser.dense_coefficients(terms, n_vars)
     
     # Normalizar: RHS debe ser no negativo
     if rhs_value < 0:
@@ -528,32 +572,96 @@ def parse_constraint(s: str, n_vars: int) -> Tuple[List[float], str, float]:
     return coefficients, op, rhs_value
 
 
-def solve_simplex_tableau(objective_str: str, constraints_list: List[str]) -> Dict:
+def parse_constraint(s: str, n_vars: int) -> Tuple[List[float], str, float]:
+    """Parse una restricción"""
+    terms, op, rhs_value = lp_parser.parse_constraint(s)
+    return _constraint_row(terms, op, rhs_value, n_vars)
+
+
+def _parse_constraint_line(s: str) -> Optional[Tuple[Dict[str, float], str, float]]:
+    """
+    Parsea una restricción para solve_simplex_tableau.
+    
+    Returns:
+        tuple: (términos, operador, rhs), o None si la restricción se ignora
+               (no negatividad o restricción mal formada)
+    """
+    try:
+        terms, op, rhs = lp_parser.parse_constraint(s)
+        lp_parser.max_variable_index(terms)  # valida los nombres x1..xn
+    except Exception:
+        return None
+    if lp_parser.is_nonnegativity(terms, op, rhs):
+        return None
+    return terms, op, rhs
+
+
+def _assemble_model(objective: Tuple[str, List[float]], constraints: List) -> Tuple:
+    """Arma (tipo, c, A, b, tipos) con las restricciones no ignoradas"""
+    opt_type, obj_coeffs = objective
+    n_vars = len(obj_coeffs)
+    
+    A = []
+    b = []
+    constraint_types = []
+    for parsed in constraints:
+        if parsed is not None:
+            coeffs, op, rhs = _constraint_row(*parsed, n_vars)
+            A.append(coeffs)
+            b.append(rhs)
+            constraint_types.append(op)
+    return opt_type, obj_coeffs, A, b, constraint_types
+
+
+def parse_model(objective_str: str, constraints_list: List[str], model_cache=None) -> Tuple:
+    """
+    Parsea un problema para SimplexTableau.
+    
+    Las restricciones vacías, de no negatividad o mal formadas se ignoran.
+    Con model_cache (ParsedModelCache), los problemas repetidos no se vuelven
+    a parsear y el resultado es compartido (no debe modificarse).
+    
+    Returns:
+        tuple: (tipo, c, A, b, tipos)
+    """
+    if model_cache is not None:
+        return model_cache.get_or_parse('simplex', objective_str, constraints_list,
+                                        parse_objective, _parse_constraint_line, _assemble_model)
+    constraints = [_parse_constraint_line(s) for s in constraints_list if s.strip()]
+    return _assemble_model(parse_objective(objective_str), constraints)
+
+
+def solve_simplex_tableau(objective_str: str, constraints_list: List[str], model_cache=None,
+                          engine: str = 'tableau', pricing: str = 'dantzig',
+                          trace: str = 'full', budget: Optional[SolverBudget] = None,
+                          initial_basis: Optional[Sequence[int]] = None) -> Dict:
     """
     Resuelve un problema de programación lineal usando Simplex con Dos Fases
+    
+    Args:
+        model_cache: ParsedModelCache opcional para no volver a parsear
+                     problemas repetidos
+        engine: 'tableau' (tableau completo, paso a paso) o 'revised'
+                (Simplex revisado con la base factorizada, para modelos grandes)
+        pricing: regla de la variable entrante (ver pricing.PRICING_RULES)
+        trace: historial de iteraciones: 'full', 'summary' o 'none' (ver solver_trace)
+        budget: límites de iteraciones, tiempo y memoria (ver solver_budget)
+        initial_basis: base inicial ('basic_vars' de un resultado anterior);
+                       solo con el motor 'tableau'
     """
     try:
-        # Parse objetivo
-        opt_type, obj_coeffs = parse_objective(objective_str)
-        n_vars = len(obj_coeffs)
-        
-        # Parse restricciones
-        A = []
-        b = []
-        constraint_types = []
-        
-        for constraint_str in constraints_list:
-            constraint_str = constraint_str.strip()
-            if not constraint_str or re.match(r'x\d+\s*>=\s*0', constraint_str.lower()):
-                continue
-            
-            try:
-                coeffs, op, rhs = parse_constraint(constraint_str, n_vars)
-                A.append(coeffs)
-                b.append(rhs)
-                constraint_types.append(op)
-            except Exception:
-                continue
+        solver_class = ENGINES.get(engine)
+        if solver_class is None:
+            raise ValueError(f"Motor no soportado: {engine} (usa {', '.join(ENGINES)})")
+        options = {}
+        if initial_basis is not None:
+            if solver_class is not SimplexTableau:
+                raise ValueError(f"El motor {engine} no acepta una base inicial (usa 'tableau')")
+            options['initial_basis'] = initial_basis
+        
+        opt_type, obj_coeffs, A, b, constraint_types = parse_model(
+            objective_str, constraints_list, model_cache
+        )
         
         if not A:
             return {
@@ -562,9 +670,10 @@ def solve_simplex_tableau(objective_str: str, constraints_list: List[str]) -> Di
                 'error': 'No se encontraron restricciones válidas.'
             }
         
-        # Crear y resolver tableau
-        tableau = SimplexTableau(obj_coeffs, A, b, constraint_types, opt_type)
-        result = tableau.solve()
+        # Crear y resolver
+        solver = solver_class(obj_coeffs, A, b, constraint_types, opt_type, pricing=pricing,
+                              trace=trace, budget=budget, **options)
+        result = solver.solve()
         
         return result
     
@@ -0,0 +1,83 @@
+# archivo: solver_budget.py
+"""
+Presupuesto de un solve: iteraciones, tiempo y memoria del historial.
+
+Todos los métodos simplex aceptan budget=SolverBudget(...). Cuando se agota,
+el solver no devuelve un error: termina con la base actual (la mejor que
+tiene, porque el objetivo no empeora entre pivoteos) y uno de estos estados:
+
+    - 'iteration_limit': se hicieron max_iterations pivoteos
+    - 'time_limit': pasó el tiempo límite (deadline)
+    - 'memory_limit': el historial de iteraciones superó max_history_bytes
+
+El resultado incluye 'basic_vars' (índices de las columnas básicas) y, si la
+base es factible, la solución y el valor objetivo actuales.
+"""
+
+import time
+from typing import Optional
+
+DEFAULT_MAX_ITERATIONS = 10000  # pivoteos por solve si no se indica otro límite
+
+ITERATION_LIMIT = 'iteration_limit'
+TIME_LIMIT = 'time_limit'
+MEMORY_LIMIT = 'memory_limit'
+BUDGET_STATUSES = (ITERATION_LIMIT, TIME_LIMIT, MEMORY_LIMIT)
+
+
+class SolverBudget:
+    """
+    Límites de un solve. None en cualquiera de ellos significa sin límite.
+
+    El tiempo se mide con time.monotonic(): time_limit cuenta desde que se
+    crea el presupuesto (por ejemplo, al empezar una petición web), y
+    deadline es un instante absoluto del mismo reloj.
+    """
+
+    def __init__(self, max_iterations: Optional[int] = DEFAULT_MAX_ITERATIONS,
+                 time_limit: Optional[float] = None, max_history_bytes: Optional[int] = None,
+                 deadline: Optional[float] = None):
+        """
+        Args:
+            max_iterations: pivoteos permitidos (en todas las fases)
+            time_limit: segundos disponibles desde ahora
+            max_history_bytes: memoria máxima del historial de iteraciones
+            deadline: instante límite de time.monotonic() (tiene prioridad
+                      sobre time_limit)
+        """
+        self.max_iterations = max_iterations
+        self.time_limit = time_limit
+        self.max_history_bytes = max_history_bytes
+        if deadline is None and time_limit is not None:
+            deadline = time.monotonic() + time_limit
+        self.deadline = deadline
+
+    def exhausted(self, iterations: int, history_bytes: int = 0) -> Optional[str]:
+        """
+        Revisa el presupuesto antes de un pivoteo.
+
+        Args:
+            iterations: pivoteos hechos hasta ahora
+            history_bytes: memoria actual del historial
+
+        Returns:
+            str: el estado del límite agotado, o None si queda presupuesto
+        """
+        if self.max_iterations is not None and iterations >= self.max_iterations:
+            return ITERATION_LIMIT
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            return TIME_LIMIT
+        if self.max_history_bytes is not None and history_bytes > self.max_history_bytes:
+            return MEMORY_LIMIT
+        return None
+
+    def message(self, status: str, iterations: int) -> str:
+        """Descripción del límite agotado, para mostrar al usuario."""
+        if status == TIME_LIMIT:
+            limit = f"el tiempo límite ({self.time_limit:g} s)" if self.time_limit is not None \
+                else "el tiempo límite"
+        elif status == MEMORY_LIMIT:
+            limit = f"la memoria del historial ({self.max_history_bytes / 2**20:.3g} MB)"
+        else:
+            limit = "el máximo de iteraciones"
+        return f"Se alcanzó {limit} después de {iterations} iteraciones; la base actual no es óptima"
@@ -0,0 +1,27 @@
+# archivo: solver_trace.py
+"""
+Niveles de traza de los métodos simplex.
+
+    - 'full': historial completo paso a paso (tableau de cada iteración,
+      operaciones de fila y, en Dos Fases, mensajes en consola)
+    - 'summary': un resumen por iteración (variables que entran y salen,
+      valor objetivo, pivote), sin tableau, operaciones ni mensajes
+    - 'none': solo el resultado final; no se crea nada por iteración
+
+Con 'none' el historial de iteraciones del resultado queda vacío.
+"""
+
+TRACE_LEVELS = ('none', 'summary', 'full')
+
+
+def check_trace_level(trace: str) -> str:
+    """
+    Valida el nivel de traza.
+
+    Raises:
+        ValueError: si el nivel no existe
+    """
+    level = str(trace).lower()
+    if level not in TRACE_LEVELS:
+        raise ValueError(f"Nivel de traza no soportado: {trace} (usa {', '.join(TRACE_LEVELS)})")
+    return level
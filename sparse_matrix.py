@@ -0,0 +1,207 @@
+# archivo: sparse_matrix.py
+"""
+Matrices de restricciones dispersas para los métodos simplex.
+
+CSRMatrix guarda solo los coeficientes distintos de cero (formato CSR, por
+filas). StandardForm describe el problema en forma estándar sin materializar
+las columnas de holgura, exceso y artificiales: cada una es un vector unitario
+(±e_i) que se representa con la fila donde vale ±1.
+
+El orden de las columnas es el mismo que usan los tableaus:
+    [variables de decisión | holguras | excesos | artificiales]
+"""
+
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+
+class CSRMatrix:
+    """Matriz dispersa por filas (Compressed Sparse Row)."""
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray, data: np.ndarray,
+                 shape: Tuple[int, int]):
+        """
+        Args:
+            indptr: inicio de cada fila en indices/data (longitud filas + 1)
+            indices: columna de cada coeficiente
+            data: valor de cada coeficiente
+            shape: (filas, columnas)
+        """
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.data = np.asarray(data, dtype=float)
+        self.shape = (int(shape[0]), int(shape[1]))
+
+    @classmethod
+    def from_coo(cls, rows: Sequence[int], cols: Sequence[int], values: Sequence[float],
+                 shape: Tuple[int, int]) -> 'CSRMatrix':
+        """Construye la matriz a partir de tripletas (los coeficientes repetidos se suman)."""
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        values = np.asarray(values, dtype=float)
+        n_rows, n_cols = shape
+
+        # Ordenar por (fila, columna) y sumar repetidos
+        order = np.lexsort((cols, rows))
+        rows, cols, values = rows[order], cols[order], values[order]
+        if len(rows):
+            start = np.ones(len(rows), dtype=bool)
+            start[1:] = (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])
+            groups = np.flatnonzero(start)
+            values = np.add.reduceat(values, groups)
+            rows, cols = rows[groups], cols[groups]
+            keep = values != 0.0
+            rows, cols, values = rows[keep], cols[keep], values[keep]
+
+        indptr = np.zeros(n_rows + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n_rows), out=indptr[1:])
+        return cls(indptr, cols, values, (n_rows, n_cols))
+
+    @classmethod
+    def from_dense(cls, A) -> 'CSRMatrix':
+        A = np.asarray(A, dtype=float)
+        if A.ndim != 2:
+            A = A.reshape(len(A), -1)
+        rows, cols = np.nonzero(A)
+        return cls.from_coo(rows, cols, A[rows, cols], A.shape)
+
+    @property
+    def nnz(self) -> int:
+        return len(self.data)
+
+    def row_indices(self) -> np.ndarray:
+        """Fila de cada coeficiente (la forma COO de indptr)."""
+        return np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+
+    def row(self, i: int) -> Tuple[np.ndarray, np.ndarray]:
+        """(columnas, valores) de la fila i."""
+        start, end = self.indptr[i], self.indptr[i + 1]
+        return self.indices[start:end], self.data[start:end]
+
+    def matvec(self, x: np.ndarray) -> np.ndarray:
+        """A @ x"""
+        return np.bincount(self.row_indices(), weights=self.data * np.asarray(x)[self.indices],
+                           minlength=self.shape[0])
+
+    def rmatvec(self, y: np.ndarray) -> np.ndarray:
+        """A^T @ y"""
+        return np.bincount(self.indices, weights=self.data * np.asarray(y)[self.row_indices()],
+                           minlength=self.shape[1])
+
+    def transpose(self) -> 'CSRMatrix':
+        """A^T en CSR (equivale a A en formato por columnas, CSC)."""
+        return CSRMatrix.from_coo(self.indices, self.row_indices(), self.data,
+                                  (self.shape[1], self.shape[0]))
+
+    def scale_rows(self, factors: np.ndarray) -> 'CSRMatrix':
+        """Nueva matriz con cada fila i multiplicada por factors[i]."""
+        data = self.data * np.asarray(factors, dtype=float)[self.row_indices()]
+        return CSRMatrix(self.indptr, self.indices, data, self.shape)
+
+    def to_dense(self) -> np.ndarray:
+        A = np.zeros(self.shape)
+        A[self.row_indices(), self.indices] = self.data
+        return A
+
+    def __repr__(self):
+        return f'CSRMatrix(shape={self.shape}, nnz={self.nnz})'
+
+
+def as_csr(A, n_cols: Optional[int] = None) -> CSRMatrix:
+    """
+    Convierte la matriz de restricciones a CSRMatrix.
+
+    Acepta una CSRMatrix, una matriz densa (lista de listas o arreglo de
+    NumPy) o tripletas COO (filas, columnas, valores, forma).
+    """
+    if isinstance(A, CSRMatrix):
+        return A
+    if isinstance(A, tuple) and len(A) == 4:
+        return CSRMatrix.from_coo(*A)
+    if len(A) == 0:
+        return CSRMatrix(np.zeros(1, dtype=np.int64), [], [], (0, n_cols or 0))
+    return CSRMatrix.from_dense(A)
+
+
+class StandardForm:
+    """
+    Restricciones en forma estándar con columnas auxiliares implícitas.
+
+    Cada restricción '<=' agrega una holgura (+e_i), cada '>=' un exceso
+    (-e_i) y una artificial (+e_i), y cada '=' una artificial (+e_i). Esas
+    columnas no se guardan: basta la fila de cada una.
+    """
+
+    def __init__(self, A: Union[CSRMatrix, Sequence], b: Sequence[float],
+                 constraint_types: List[str]):
+        self.A = as_csr(A)
+        self.b = np.asarray(b, dtype=float)
+        self.constraint_types = list(constraint_types)
+        self.n_rows, self.n_vars = self.A.shape[0], self.A.shape[1]
+        if len(self.b) != self.n_rows or len(self.constraint_types) != self.n_rows:
+            raise ValueError("A, b y los tipos de restricción deben tener el mismo número de filas")
+
+        types = np.array(self.constraint_types, dtype=object)
+        unknown = set(self.constraint_types) - {'<=', '>=', '='}
+        if unknown:
+            raise ValueError(f"Tipo de restricción no válido: {unknown.pop()}")
+        self.slack_rows = np.flatnonzero(types == '<=')
+        self.surplus_rows = np.flatnonzero(types == '>=')
+        self.artificial_rows = np.flatnonzero(types != '<=')
+
+        self.n_slack = len(self.slack_rows)
+        self.n_surplus = len(self.surplus_rows)
+        self.n_artificial = len(self.artificial_rows)
+        self.slack_start = self.n_vars
+        self.surplus_start = self.slack_start + self.n_slack
+        self.artificial_start = self.surplus_start + self.n_surplus
+        self.n_total = self.artificial_start + self.n_artificial
+
+        # Fila y signo de cada columna auxiliar, en orden de columna
+        self.aux_rows = np.concatenate((self.slack_rows, self.surplus_rows, self.artificial_rows))
+        self.aux_signs = np.concatenate((np.ones(self.n_slack), -np.ones(self.n_surplus),
+                                         np.ones(self.n_artificial)))
+        self._columns: Optional[CSRMatrix] = None
+
+    def initial_basis(self) -> List[int]:
+        """Base inicial: la holgura de cada fila '<=' y la artificial de las demás."""
+        basis = np.empty(self.n_rows, dtype=np.int64)
+        basis[self.slack_rows] = self.slack_start + np.arange(self.n_slack)
+        basis[self.artificial_rows] = self.artificial_start + np.arange(self.n_artificial)
+        return basis.tolist()
+
+    def artificial_columns(self) -> List[int]:
+        return list(range(self.artificial_start, self.n_total))
+
+    @property
+    def columns(self) -> CSRMatrix:
+        """A por columnas (A^T en CSR), calculada la primera vez que se usa."""
+        if self._columns is None:
+            self._columns = self.A.transpose()
+        return self._columns
+
+    def column(self, j: int) -> np.ndarray:
+        """Columna j de [A | auxiliares] como vector denso."""
+        col = np.zeros(self.n_rows)
+        if j < self.n_vars:
+            rows, values = self.columns.row(j)
+            col[rows] = values
+        else:
+            k = j - self.n_vars
+            col[self.aux_rows[k]] = self.aux_signs[k]
+        return col
+
+    def price(self, y: np.ndarray) -> np.ndarray:
+        """y^T [A | auxiliares] para todas las columnas."""
+        y = np.asarray(y, dtype=float)
+        return np.concatenate((self.A.rmatvec(y), self.aux_signs * y[self.aux_rows]))
+
+    def fill_tableau(self, tableau: np.ndarray):
+        """
+        Escribe las filas de restricciones ([A | auxiliares | b]) en las
+        primeras n_rows filas de un tableau de ceros.
+        """
+        tableau[self.A.row_indices(), self.A.indices] = self.A.data
+        tableau[self.aux_rows, self.n_vars + np.arange(len(self.aux_rows))] = self.aux_signs
+        tableau[:self.n_rows, -1] = self.b
@@ -0,0 +1,187 @@
+// Explorador de la función objetivo del método gráfico.
+// La región factible llega una sola vez desde el servidor (JSON en la página);
+// cambiar los coeficientes re-evalúa los vértices y redibuja en el navegador,
+// sin volver a enviar el formulario.
+
+document.addEventListener('DOMContentLoaded', function() {
+    const dataElement = document.getElementById('region-data');
+    if (dataElement) {
+        initializeObjectiveExplorer(JSON.parse(dataElement.textContent));
+    }
+});
+
+const SVG_NS = 'http://www.w3.org/2000/svg';
+const SVG_SIZE = 400;
+const SVG_MARGIN = 30;
+
+/**
+ * Conecta los controles del explorador y dibuja el estado inicial
+ */
+function initializeObjectiveExplorer(region) {
+    const controls = {
+        c1: document.getElementById('explorer-c1'),
+        c1Range: document.getElementById('explorer-c1-range'),
+        c2: document.getElementById('explorer-c2'),
+        c2Range: document.getElementById('explorer-c2-range'),
+        optType: document.getElementById('explorer-opt-type')
+    };
+
+    // Cada campo numérico se mantiene sincronizado con su deslizador
+    [['c1', 'c1Range'], ['c2', 'c2Range']].forEach(function(pair) {
+        const field = controls[pair[0]];
+        const range = controls[pair[1]];
+        field.addEventListener('input', function() {
+            range.value = field.value;
+            updateExplorer(region, controls);
+        });
+        range.addEventListener('input', function() {
+            field.value = range.value;
+            updateExplorer(region, controls);
+        });
+    });
+    controls.optType.addEventListener('change', function() {
+        updateExplorer(region, controls);
+    });
+
+    drawRegion(region);
+    updateExplorer(region, controls);
+}
+
+/**
+ * Evalúa la función objetivo en cada vértice y elige el óptimo
+ * (el primero en caso de empate, igual que el servidor)
+ */
+function evaluateObjective(region, c1, c2, optType) {
+    const sign = optType === 'max' ? 1 : -1;
+    const values = region.vertices.map(function(v) { return c1 * v[0] + c2 * v[1]; });
+    let best = -1;
+    values.forEach(function(value, i) {
+        if (best < 0 || sign * value > sign * values[best]) {
+            best = i;
+        }
+    });
+
+    // En regiones no acotadas el objetivo puede mejorar sin límite
+    const unbounded = region.rays.some(function(r) {
+        return sign * (c1 * r[0] + c2 * r[1]) > 1e-9;
+    });
+    return { values: values, best: best, unbounded: unbounded };
+}
+
+/**
+ * Convierte coordenadas del problema a coordenadas del SVG
+ */
+function toSvg(region, x, y) {
+    const scale = (SVG_SIZE - 2 * SVG_MARGIN) / Math.max(region.window[0], region.window[1]);
+    return [SVG_MARGIN + x * scale, SVG_SIZE - SVG_MARGIN - y * scale];
+}
+
+function svgElement(name, attributes) {
+    const element = document.createElementNS(SVG_NS, name);
+    Object.keys(attributes).forEach(function(key) {
+        element.setAttribute(key, attributes[key]);
+    });
+    return element;
+}
+
+/**
+ * Dibuja los ejes, la región y los vértices (no dependen del objetivo)
+ */
+function drawRegion(region) {
+    const svg = document.getElementById('explorer-svg');
+    svg.setAttribute('viewBox', `0 0 ${SVG_SIZE} ${SVG_SIZE}`);
+
+    const origin = toSvg(region, 0, 0);
+    const corner = toSvg(region, region.window[0], region.window[1]);
+    svg.appendChild(svgElement('line', { x1: origin[0], y1: origin[1], x2: corner[0], y2: origin[1],
+                                         stroke: '#333', 'stroke-width': 1 }));
+    svg.appendChild(svgElement('line', { x1: origin[0], y1: origin[1], x2: origin[0], y2: corner[1],
+                                         stroke: '#333', 'stroke-width': 1 }));
+
+    if (region.clip.length) {
+        const points = region.clip.map(function(p) { return toSvg(region, p[0], p[1]).join(','); });
+        svg.appendChild(svgElement('polygon', { points: points.join(' '), fill: 'lightgreen',
+                                                'fill-opacity': 0.5, stroke: 'darkgreen',
+                                                'stroke-width': 2 }));
+    }
+
+    svg.appendChild(svgElement('line', { id: 'explorer-iso-line', stroke: 'black',
+                                         'stroke-width': 2, 'stroke-dasharray': '6 4' }));
+
+    region.vertices.forEach(function(v, i) {
+        const p = toSvg(region, v[0], v[1]);
+        svg.appendChild(svgElement('circle', { id: `explorer-vertex-${i}`, cx: p[0], cy: p[1],
+                                               r: 5, fill: 'darkred' }));
+    });
+}
+
+/**
+ * Extremos visibles de la recta c1·x + c2·y = z dentro de la ventana
+ */
+function isoLineSegment(region, c1, c2, z) {
+    const xMax = region.window[0];
+    const yMax = region.window[1];
+    const points = [];
+    if (Math.abs(c2) > 1e-12) {
+        [0, xMax].forEach(function(x) {
+            const y = (z - c1 * x) / c2;
+            if (y >= -1e-9 && y <= yMax + 1e-9) points.push([x, y]);
+        });
+    }
+    if (Math.abs(c1) > 1e-12) {
+        [0, yMax].forEach(function(y) {
+            const x = (z - c2 * y) / c1;
+            if (x >= -1e-9 && x <= xMax + 1e-9) points.push([x, y]);
+        });
+    }
+    return points.length >= 2 ? [points[0], points[points.length - 1]] : null;
+}
+
+/**
+ * Re-evalúa el objetivo con los valores actuales de los controles
+ */
+function updateExplorer(region, controls) {
+    const c1 = parseFloat(controls.c1.value) || 0;
+    const c2 = parseFloat(controls.c2.value) || 0;
+    const optType = controls.optType.value;
+    const evaluation = evaluateObjective(region, c1, c2, optType);
+
+    // Tabla de vértices
+    const rows = document.querySelectorAll('#explorer-table tbody tr');
+    rows.forEach(function(row, i) {
+        row.querySelector('.explorer-value').textContent = evaluation.values[i].toFixed(4);
+        row.classList.toggle('table-success', i === evaluation.best && !evaluation.unbounded);
+    });
+
+    // Vértice óptimo y recta de isobeneficio
+    region.vertices.forEach(function(v, i) {
+        const circle = document.getElementById(`explorer-vertex-${i}`);
+        const isBest = i === evaluation.best && !evaluation.unbounded;
+        circle.setAttribute('fill', isBest ? 'gold' : 'darkred');
+        circle.setAttribute('r', isBest ? 9 : 5);
+    });
+
+    const line = document.getElementById('explorer-iso-line');
+    const best = region.vertices[evaluation.best];
+    const segment = best ? isoLineSegment(region, c1, c2, evaluation.values[evaluation.best]) : null;
+    if (segment && !evaluation.unbounded) {
+        const p1 = toSvg(region, segment[0][0], segment[0][1]);
+        const p2 = toSvg(region, segment[1][0], segment[1][1]);
+        line.setAttribute('x1', p1[0]);
+        line.setAttribute('y1', p1[1]);
+        line.setAttribute('x2', p2[0]);
+        line.setAttribute('y2', p2[1]);
+        line.setAttribute('visibility', 'visible');
+    } else {
+        line.setAttribute('visibility', 'hidden');
+    }
+
+    // Resumen
+    const summary = document.getElementById('explorer-summary');
+    if (evaluation.unbounded) {
+        summary.textContent = 'La función objetivo no está acotada en la región factible.';
+    } else {
+        summary.textContent = `Óptimo en (${best[0].toFixed(2)}, ${best[1].toFixed(2)}) ` +
+                              `con z = ${evaluation.values[evaluation.best].toFixed(4)}`;
+    }
+}
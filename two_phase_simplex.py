@@ -10,8 +10,15 @@ Fecha: Octubre 2025
 """
 
 import numpy as np
-import re
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, List, Tuple, Any, Optional, Sequence
+
+import lp_parser
+from iteration_history import IterationHistory
+from simplex_kernels import (clear_small_values, min_ratio_row, most_negative, pivot_in_place,
+                             refactor_to_basis)
+from solver_budget import BUDGET_STATUSES, SolverBudget
+from solver_trace import check_trace_level
+from sparse_matrix import StandardForm, as_csr
 
 
 class TwoPhaseSimplexSolver:
@@ -24,7 +31,9 @@ class TwoPhaseSimplexSolver:
     - Detección de infactibilidad, no acotamiento, degeneración
     """
     
-    def __init__(self, objective: str, constraints: List[str], opt_type: str = 'max'):
+    def __init__(self, objective: str, constraints: List[str], opt_type: str = 'max',
+                 trace: str = 'full', budget: Optional[SolverBudget] = None,
+                 initial_basis: Optional[Sequence[int]] = None):
         """
         Inicializa el solver con el problema de PL.
         
@@ -32,7 +41,17 @@ class TwoPhaseSimplexSolver:
             objective: Función objetivo (ej: "3x1 + 5x2")
             constraints: Lista de restricciones (ej: ["4x1 + x2 >= 4", "x2 <= 3"])
             opt_type: 'max' o 'min'
+            trace: 'full' (historial completo y mensajes en consola),
+                   'summary' (resumen por iteración) o 'none' (ver solver_trace)
+            budget: límites de iteraciones (en las dos fases), tiempo y memoria
+                    del historial (ver solver_budget)
+            initial_basis: base inicial (índices de columna sin artificiales,
+                           como 'basic_vars' de un resultado anterior); si
+                           es factible, se omite la Fase I
         """
+        self.trace = check_trace_level(trace)
+        self.budget = budget or SolverBudget()
+        self.verbose = self.trace == 'full'  # mensajes en consola
         self.objective_str = objective.strip()
         self.constraints_str = [c.strip() for c in constraints]
         self.opt_type = opt_type.lower()
@@ -57,15 +76,48 @@ class TwoPhaseSimplexSolver:
         
         # Tableau
         self.tableau = None          # Tableau actual
+        self._pivot_work = None      # Buffer del pivoteo en el lugar (misma forma que el tableau)
         
-        # Historial
+        # Historial (tableau inicial + pivoteos; ver iteration_history)
+        self.history = None
         self.iterations_phase1 = []  # Iteraciones de Fase I
         self.iterations_phase2 = []  # Iteraciones de Fase II
-        self.iteration_count = 0     # Contador de iteraciones
+        self.iteration_count = 0     # Contador de pivoteos (las dos fases)
+        
+        # Arranque en caliente: None si no se dio base, True/False si se usó o no
+        self.initial_basis = initial_basis
+        self.warm_start = None
         
         # Tolerancia numérica
         self.EPS = 1e-10
         
+        # Problema ya parseado (c, A, b, tipos); ver from_arrays
+        self._arrays = None
+    
+    @classmethod
+    def from_arrays(cls, c: List[float], A: List[List[float]], b: List[float],
+                    constraint_types: List[str], opt_type: str = 'max',
+                    trace: str = 'full', budget: Optional[SolverBudget] = None,
+                    initial_basis: Optional[Sequence[int]] = None) -> 'TwoPhaseSimplexSolver':
+        """
+        Crea el solver a partir de un problema ya parseado (por ejemplo, leído
+        con lp_reader), sin pasar por el texto.
+        
+        Args:
+            c: Coeficientes de la función objetivo
+            A: Matriz de coeficientes de restricciones (densa o CSRMatrix)
+            b: Vector de términos independientes
+            constraint_types: Lista de tipos ['<=', '>=', '=']
+            opt_type: 'max' o 'min'
+            trace: 'full', 'summary' o 'none' (ver solver_trace)
+            budget: límites del solve (ver solver_budget)
+            initial_basis: base inicial (ver __init__)
+        """
+        solver = cls('', [], opt_type, trace, budget, initial_basis)
+        solver._arrays = ([float(v) for v in c], as_csr(A, len(c)),
+                          [float(v) for v in b], list(constraint_types))
+        return solver
+        
     def _clean_small_values(self, value: float, tolerance: float = 1e-10) -> float:
         """Redondea valores muy pequeños a 0 para evitar notación científica."""
         if abs(value) < tolerance:
@@ -79,37 +131,7 @@ class TwoPhaseSimplexSolver:
         Returns:
             Tupla (coeficientes, número_de_variables)
         """
-        # Remover "max" o "min" y "z ="
-        obj_clean = re.sub(r'(max|min|maximize|minimizar)\s*', '', self.objective_str, flags=re.IGNORECASE)
-        obj_clean = re.sub(r'z\s*=\s*', '', obj_clean, flags=re.IGNORECASE)
-        obj_clean = obj_clean.strip()
-        
-        # Encontrar todos los términos (ej: "3x1", "-5x2", "x3")
-        pattern = r'([+-]?\s*\d*\.?\d*)\s*x(\d+)'
-        matches = re.findall(pattern, obj_clean)
-        
-        if not matches:
-            raise ValueError("No se pudo parsear la función objetivo. Formato esperado: '3x1 + 5x2'")
-        
-        # Determinar número de variables
-        max_var_index = max(int(m[1]) for m in matches)
-        n_vars = max_var_index
-        
-        # Inicializar coeficientes en 0
-        coeffs = [0.0] * n_vars
-        
-        # Llenar coeficientes
-        for coef_str, var_idx in matches:
-            coef_str = coef_str.replace(' ', '')
-            
-            if coef_str == '' or coef_str == '+':
-                coef = 1.0
-            elif coef_str == '-':
-                coef = -1.0
-            else:
-                coef = float(coef_str)
-            
-            coeffs[int(var_idx) - 1] = coef
+        coeffs, n_vars = _parse_objective_coefficients(self.objective_str)
         
         # Si es MIN, convertir a MAX multiplicando por -1
         if self.opt_type == 'min':
@@ -124,62 +146,8 @@ class TwoPhaseSimplexSolver:
         Returns:
             Tupla (matriz_coeficientes, rhs, tipos)
         """
-        matrix = []
-        rhs = []
-        types = []
-        
-        for constraint in self.constraints_str:
-            # Ignorar restricciones de no negatividad
-            if 'x' in constraint.lower() and '>=' in constraint and '0' in constraint:
-                if constraint.count('x') == 1:  # Solo "xi >= 0"
-                    continue
-            
-            # Detectar tipo de restricción
-            if '<=' in constraint:
-                constraint_type = '<='
-                parts = constraint.split('<=')
-            elif '>=' in constraint:
-                constraint_type = '>='
-                parts = constraint.split('>=')
-            elif '=' in constraint and '!' not in constraint:
-                constraint_type = '='
-                parts = constraint.split('=')
-            else:
-                continue
-            
-            if len(parts) != 2:
-                raise ValueError(f"Restricción mal formada: {constraint}")
-            
-            lhs = parts[0].strip()
-            rhs_value = float(parts[1].strip())
-            
-            # Parsear lado izquierdo
-            pattern = r'([+-]?\s*\d*\.?\d*)\s*x(\d+)'
-            matches = re.findall(pattern, lhs)
-            
-            if not matches:
-                raise ValueError(f"No se pudo parsear restricción: {constraint}")
-            
-            # Inicializar fila de coeficientes
-            row = [0.0] * self.n_vars
-            
-            for coef_str, var_idx in matches:
-                coef_str = coef_str.replace(' ', '')
-                
-                if coef_str == '' or coef_str == '+':
-                    coef = 1.0
-                elif coef_str == '-':
-                    coef = -1.0
-                else:
-                    coef = float(coef_str)
-                
-                row[int(var_idx) - 1] = coef
-            
-            matrix.append(row)
-            rhs.append(rhs_value)
-            types.append(constraint_type)
-        
-        return matrix, rhs, types
+        lines = [_parse_constraint_line(c) for c in self.constraints_str if c]
+        return _constraint_arrays(lines, self.n_vars)
     
     def normalize_problem(self):
         """
@@ -188,12 +156,18 @@ class TwoPhaseSimplexSolver:
         - >= : agrega variable de exceso y artificial
         - = : agrega variable artificial
         """
-        # Parsear función objetivo
-        self.obj_coeffs, self.n_vars = self.parse_objective()
-        
-        # Parsear restricciones
-        self.constraint_matrix, self.rhs, self.constraint_types = self.parse_constraints()
-        self.n_constraints = len(self.constraint_matrix)
+        if self._arrays is not None:
+            c, self.constraint_matrix, self.rhs, self.constraint_types = self._arrays
+            self.n_vars = len(c)
+            # Si es MIN, convertir a MAX multiplicando por -1 (igual que parse_objective)
+            self.obj_coeffs = [-v for v in c] if self.opt_type == 'min' else list(c)
+        else:
+            # Parsear función objetivo
+            self.obj_coeffs, self.n_vars = self.parse_objective()
+            
+            # Parsear restricciones
+            self.constraint_matrix, self.rhs, self.constraint_types = self.parse_constraints()
+        self.n_constraints = len(self.rhs)
         
         if self.n_constraints == 0:
             raise ValueError("No se encontraron restricciones válidas")
@@ -231,13 +205,14 @@ class TwoPhaseSimplexSolver:
                 artificial_count += 1
                 self.var_names.append(f'A{artificial_count}')
         
-        print(f"\n📊 Problema Normalizado:")
-        print(f"  Variables de decisión: {self.n_vars}")
-        print(f"  Restricciones: {self.n_constraints}")
-        print(f"  Variables de holgura: {self.n_slack}")
-        print(f"  Variables de exceso: {self.n_excess}")
-        print(f"  Variables artificiales: {self.n_artificial}")
-        print(f"  Tipos de restricciones: {self.constraint_types}")
+        if self.verbose:
+            print(f"\n📊 Problema Normalizado:")
+            print(f"  Variables de decisión: {self.n_vars}")
+            print(f"  Restricciones: {self.n_constraints}")
+            print(f"  Variables de holgura: {self.n_slack}")
+            print(f"  Variables de exceso: {self.n_excess}")
+            print(f"  Variables artificiales: {self.n_artificial}")
+            print(f"  Tipos de restricciones: {self.constraint_types}")
     
     def build_initial_tableau_phase1(self):
         """
@@ -252,59 +227,18 @@ class TwoPhaseSimplexSolver:
         # Inicializar tableau
         self.tableau = np.zeros((n_rows, n_cols))
         
-        # Llenar restricciones
-        slack_idx = self.n_vars
-        excess_idx = self.n_vars + self.n_slack
-        artificial_idx = self.n_vars + self.n_slack + self.n_excess
-        
-        current_slack = 0
-        current_excess = 0
-        current_artificial = 0
-        
-        for i, ctype in enumerate(self.constraint_types):
-            # Coeficientes de variables de decisión
-            for j in range(self.n_vars):
-                self.tableau[i, j] = self.constraint_matrix[i][j]
-            
-            # Agregar variable según tipo
-            if ctype == '<=':
-                # Agregar holgura
-                self.tableau[i, slack_idx + current_slack] = 1.0
-                current_slack += 1
-            
-            elif ctype == '>=':
-                # Agregar exceso (negativa) y artificial
-                self.tableau[i, excess_idx + current_excess] = -1.0
-                self.tableau[i, artificial_idx + current_artificial] = 1.0
-                current_excess += 1
-                current_artificial += 1
-            
-            elif ctype == '=':
-                # Solo agregar artificial
-                self.tableau[i, artificial_idx + current_artificial] = 1.0
-                current_artificial += 1
-            
-            # RHS
-            self.tableau[i, -1] = self.rhs[i]
+        # Llenar restricciones: [A | holguras | excesos | artificiales | RHS]
+        # (la matriz puede ser dispersa; las columnas auxiliares se escriben directamente)
+        form = StandardForm(self.constraint_matrix, self.rhs, self.constraint_types)
+        form.fill_tableau(self.tableau)
+        artificial_idx = form.artificial_start
         
         # Fila Z de Fase I: coeficientes 1 para variables artificiales
         for i in range(self.n_artificial):
             self.tableau[-1, artificial_idx + i] = 1.0
         
-        # Variables básicas iniciales
-        self.basic_vars = []
-        current_slack = 0
-        current_artificial = 0
-        
-        for i, ctype in enumerate(self.constraint_types):
-            if ctype == '<=':
-                # Holgura es básica
-                self.basic_vars.append(slack_idx + current_slack)
-                current_slack += 1
-            else:
-                # Artificial es básica
-                self.basic_vars.append(artificial_idx + current_artificial)
-                current_artificial += 1
+        # Variables básicas iniciales: holgura en filas <=, artificial en las demás
+        self.basic_vars = form.initial_basis()
         
         # Hacer operaciones de fila para forma canónica (Fase I)
         # Las artificiales básicas deben tener coeficiente 0 en fila Z
@@ -315,10 +249,15 @@ class TwoPhaseSimplexSolver:
                 if abs(coef) > self.EPS:
                     self.tableau[-1, :] -= coef * self.tableau[i, :]
         
-        print(f"\n✅ Tableau Inicial Fase I construido:")
-        print(f"  Dimensiones: {n_rows} x {n_cols}")
-        print(f"  Variables básicas: {[self.var_names[i] for i in self.basic_vars]}")
-        print(f"  W inicial: {self._clean_small_values(self.tableau[-1, -1])}")
+        if self.trace == 'full':
+            # Las iteraciones muestran el tableau como lista de listas (para Jinja2)
+            self.history = IterationHistory(self.tableau, view=np.ndarray.tolist)
+        
+        if self.verbose:
+            print(f"\n✅ Tableau Inicial Fase I construido:")
+            print(f"  Dimensiones: {n_rows} x {n_cols}")
+            print(f"  Variables básicas: {[self.var_names[i] for i in self.basic_vars]}")
+            print(f"  W inicial: {self._clean_small_values(self.tableau[-1, -1])}")
 
     def solve(self) -> Dict[str, Any]:
         """
@@ -329,15 +268,17 @@ class TwoPhaseSimplexSolver:
         """
         try:
             # FASE 2: Normalización
-            print("\n" + "="*70)
-            print("🚀 INICIANDO MÉTODO SIMPLEX DOS FASES")
-            print("="*70)
+            if self.verbose:
+                print("\n" + "="*70)
+                print("🚀 INICIANDO MÉTODO SIMPLEX DOS FASES")
+                print("="*70)
             
             self.normalize_problem()
             
             # Si no hay artificiales, es un problema estándar (solo <=)
             if self.n_artificial == 0:
-                print("\n⚠️ No hay variables artificiales. Usar método Simplex estándar.")
+                if self.verbose:
+                    print("\n⚠️ No hay variables artificiales. Usar método Simplex estándar.")
                 return {
                     'success': False,
                     'error': 'Este problema no requiere Dos Fases. Use el método Simplex estándar.',
@@ -346,30 +287,47 @@ class TwoPhaseSimplexSolver:
             
             self.build_initial_tableau_phase1()
             
-            # FASE 3: Ejecutar Fase I
-            print("\n" + "="*70)
-            print("📍 FASE I: Minimizar suma de variables artificiales")
-            print("="*70)
-            
-            phase1_result = self.phase_one()
-            
-            if not phase1_result['feasible']:
-                return {
-                    'success': False,
-                    'status': 'infeasible',
-                    'error': 'Problema INFACTIBLE: No se pudo eliminar todas las variables artificiales',
-                    'opt_type': 'max' if self.opt_type == 'max' else 'min',
-                    'iterations_phase1': self.iterations_phase1,
-                    'iterations_phase2': [],
-                    'total_iterations': len(self.iterations_phase1)
-                }
+            if self.initial_basis is not None:
+                self.warm_start = self.warm_start_phase2()
+                if self.verbose:
+                    print("\n✅ Base inicial factible: se omite la Fase I" if self.warm_start else
+                          "\n⚠️ La base inicial no es válida o no es factible: se resuelve desde la Fase I")
             
-            print(f"\n✅ FASE I COMPLETADA: Problema FACTIBLE (W = 0)")
+            if not self.warm_start:
+                # FASE 3: Ejecutar Fase I
+                if self.verbose:
+                    print("\n" + "="*70)
+                    print("📍 FASE I: Minimizar suma de variables artificiales")
+                    print("="*70)
+                
+                phase1_result = self.phase_one()
+                
+                if phase1_result.get('reason') in BUDGET_STATUSES:
+                    return self.build_budget_result(phase1_result['reason'], phase=1)
+                
+                if not phase1_result['feasible']:
+                    return {
+                        'success': False,
+                        'status': 'infeasible',
+                        'error': 'Problema INFACTIBLE: No se pudo eliminar todas las variables artificiales',
+                        'opt_type': 'max' if self.opt_type == 'max' else 'min',
+                        'iterations_phase1': self.iterations_phase1,
+                        'iterations_phase2': [],
+                        'total_iterations': len(self.iterations_phase1)
+                    }
+                
+                if self.verbose:
+                    print(f"\n✅ FASE I COMPLETADA: Problema FACTIBLE (W = 0)")
             
             # FASE 4: Ejecutar Fase II
-            print("\n" + "="*70)
-            print("📍 FASE II: Optimizar función objetivo original")
-            print("="*70)
+            if self.verbose:
+                print("\n" + "="*70)
+                print("📍 FASE II: Optimizar función objetivo original")
+                print("="*70)
+            
+            # Con base inicial el tableau ya está listo para la Fase II
+            if not self.warm_start:
+                self.transition_to_phase2()
             
             phase2_result = self.phase_two()
             
@@ -393,20 +351,8 @@ class TwoPhaseSimplexSolver:
         """
         z_row = self.tableau[-1, :-1]  # Fila Z sin RHS
         
-        # Buscar el coeficiente más negativo
-        min_coef = -self.EPS
-        pivot_col = None
-        
-        for j in range(len(z_row)):
-            if z_row[j] < min_coef:
-                min_coef = z_row[j]
-                pivot_col = j
-        
-        # Si no hay coeficientes negativos, ya es óptimo
-        if min_coef >= -self.EPS:
-            return None
-        
-        return pivot_col
+        # El coeficiente más negativo; None si no hay negativos (ya es óptimo)
+        return most_negative(z_row, self.EPS)
     
     def select_pivot_row(self, pivot_col: int) -> Optional[int]:
         """
@@ -418,22 +364,9 @@ class TwoPhaseSimplexSolver:
         Returns:
             Índice de fila pivote o None si no acotado
         """
-        min_ratio = float('inf')
-        pivot_row = None
-        
-        for i in range(self.n_constraints):
-            pivot_element = self.tableau[i, pivot_col]
-            
-            # Solo considerar elementos positivos
-            if pivot_element > self.EPS:
-                rhs = self.tableau[i, -1]
-                ratio = rhs / pivot_element
-                
-                if ratio >= 0 and ratio < min_ratio:
-                    min_ratio = ratio
-                    pivot_row = i
-        
-        return pivot_row
+        # Solo se consideran elementos positivos y razones no negativas
+        m = self.n_constraints
+        return min_ratio_row(self.tableau[:m, pivot_col], self.tableau[:m, -1], self.EPS)
     
     def perform_pivot(self, pivot_row: int, pivot_col: int):
         """
@@ -443,22 +376,25 @@ class TwoPhaseSimplexSolver:
             pivot_row: Índice de fila pivote
             pivot_col: Índice de columna pivote
         """
-        pivot_element = self.tableau[pivot_row, pivot_col]
+        work = self._work_buffer()
         
-        # Dividir fila pivote por elemento pivote
-        self.tableau[pivot_row, :] /= pivot_element
-        
-        # Hacer ceros en columna pivote (excepto en fila pivote)
-        for i in range(len(self.tableau)):
-            if i != pivot_row:
-                multiplier = self.tableau[i, pivot_col]
-                self.tableau[i, :] -= multiplier * self.tableau[pivot_row, :]
+        # Dividir fila pivote y hacer ceros en la columna pivote (en el lugar)
+        pivot_in_place(self.tableau, pivot_row, pivot_col, work)
         
         # Actualizar variable básica
         self.basic_vars[pivot_row] = pivot_col
+        self.iteration_count += 1
         
         # Limpiar valores muy pequeños
-        self.tableau = np.vectorize(self._clean_small_values)(self.tableau)
+        clear_small_values(self.tableau, 1e-10, work)
+        if self.history is not None:
+            self.history.pivot(pivot_row, pivot_col, clean=1e-10)
+    
+    def _work_buffer(self) -> np.ndarray:
+        """Buffer reutilizable para el pivoteo; se recrea si cambia la forma del tableau."""
+        if self._pivot_work is None or self._pivot_work.shape != self.tableau.shape:
+            self._pivot_work = np.empty_like(self.tableau)
+        return self._pivot_work
     
     def save_iteration_phase1(self, iteration: int, pivot_row: Optional[int], 
                              pivot_col: Optional[int], status: str):
@@ -471,12 +407,17 @@ class TwoPhaseSimplexSolver:
             pivot_col: Columna pivote (None si es última iteración)
             status: Estado ('iterating', 'optimal', 'infeasible', 'unbounded')
         """
+        if self.trace == 'none':
+            return
+        
+        # En 'full' el tableau se reconstruye desde el historial al pedirlo;
+        # en 'summary' no se guardan el tableau, la base ni la solución
+        full = self.trace == 'full'
         iter_data = {
             'iteration': iteration,
             'phase': 1,
-            'tableau': self.tableau.copy().tolist(),  # Convertir a lista para Jinja2
-            'basic_vars': self.basic_vars.copy(),
-            'basic_var_names': [self.var_names[i] for i in self.basic_vars],
+            'basic_vars': self.basic_vars.copy() if full else None,
+            'basic_var_names': [self.var_names[i] for i in self.basic_vars] if full else None,
             'w_value': self._clean_small_values(self.tableau[-1, -1]),
             'status': status
         }
@@ -491,12 +432,18 @@ class TwoPhaseSimplexSolver:
             )
         
         # Valores actuales de variables básicas
-        iter_data['solution'] = {}
-        for i, var_idx in enumerate(self.basic_vars):
-            var_name = self.var_names[var_idx]
-            var_value = self._clean_small_values(self.tableau[i, -1])
-            iter_data['solution'][var_name] = var_value
-        
+        iter_data['solution'] = None
+        if full:
+            iter_data['solution'] = {}
+            for i, var_idx in enumerate(self.basic_vars):
+                var_name = self.var_names[var_idx]
+                var_value = self._clean_small_values(self.tableau[i, -1])
+                iter_data['solution'][var_name] = var_value
+        
+        if full:
+            iter_data = self.history.record(iter_data)
+        else:
+            iter_data['tableau'] = None
         self.iterations_phase1.append(iter_data)
     
     def check_feasibility_phase1(self) -> bool:
@@ -520,11 +467,10 @@ class TwoPhaseSimplexSolver:
         
         # Guardar iteración inicial
         self.save_iteration_phase1(iteration, None, None, 'initial')
-        print(f"\n  Iteración {iteration}: W = {self._clean_small_values(self.tableau[-1, -1])}")
+        if self.verbose:
+            print(f"\n  Iteración {iteration}: W = {self._clean_small_values(self.tableau[-1, -1])}")
         
-        max_iterations = 100  # Límite de seguridad
-        
-        while iteration < max_iterations:
+        while True:
             iteration += 1
             
             # Paso 1: Seleccionar columna pivote
@@ -533,45 +479,54 @@ class TwoPhaseSimplexSolver:
             if pivot_col is None:
                 # Ya es óptimo
                 self.save_iteration_phase1(iteration, None, None, 'optimal')
-                print(f"  Iteración {iteration}: ÓPTIMO alcanzado")
+                if self.verbose:
+                    print(f"  Iteración {iteration}: ÓPTIMO alcanzado")
                 break
             
+            # Límite de iteraciones, tiempo o memoria
+            status = self.budget_status()
+            if status is not None:
+                return {'feasible': False, 'reason': status}
+            
             # Paso 2: Seleccionar fila pivote
             pivot_row = self.select_pivot_row(pivot_col)
             
             if pivot_row is None:
                 # Problema no acotado (raro en Fase I)
                 self.save_iteration_phase1(iteration, None, None, 'unbounded')
-                print(f"  ⚠️ Problema no acotado en Fase I")
+                if self.verbose:
+                    print(f"  ⚠️ Problema no acotado en Fase I")
                 return {'feasible': False, 'reason': 'unbounded'}
             
             # Paso 3: Realizar pivoteo
-            entering_var = self.var_names[pivot_col]
-            leaving_var = self.var_names[self.basic_vars[pivot_row]]
-            
-            print(f"  Iteración {iteration}: {entering_var} entra, {leaving_var} sale")
+            if self.verbose:
+                entering_var = self.var_names[pivot_col]
+                leaving_var = self.var_names[self.basic_vars[pivot_row]]
+                print(f"  Iteración {iteration}: {entering_var} entra, {leaving_var} sale")
             
             self.perform_pivot(pivot_row, pivot_col)
             
             # Guardar iteración
-            w_value = self._clean_small_values(self.tableau[-1, -1])
             self.save_iteration_phase1(iteration, pivot_row, pivot_col, 'iterating')
             
-            print(f"    → W = {w_value}")
+            if self.verbose:
+                print(f"    → W = {self._clean_small_values(self.tableau[-1, -1])}")
         
         # Verificar factibilidad
         is_feasible = self.check_feasibility_phase1()
         
         if not is_feasible:
             w_final = self._clean_small_values(self.tableau[-1, -1])
-            print(f"\n  ❌ INFACTIBLE: W = {w_final} ≠ 0")
+            if self.verbose:
+                print(f"\n  ❌ INFACTIBLE: W = {w_final} ≠ 0")
             return {
                 'feasible': False, 
                 'reason': 'infeasible',
                 'w_value': w_final
             }
         
-        print(f"\n  ✅ FACTIBLE: W = 0")
+        if self.verbose:
+            print(f"\n  ✅ FACTIBLE: W = 0")
         return {
             'feasible': True,
             'iterations': iteration
@@ -584,7 +539,8 @@ class TwoPhaseSimplexSolver:
         - Reemplaza fila Z con objetivo original
         - Hace operaciones de fila para forma canónica
         """
-        print(f"\n🔄 Transición a Fase II...")
+        if self.verbose:
+            print(f"\n🔄 Transición a Fase II...")
         
         # Identificar columnas artificiales
         artificial_start = self.n_vars + self.n_slack + self.n_excess
@@ -594,17 +550,19 @@ class TwoPhaseSimplexSolver:
         cols_to_keep = list(range(artificial_start)) + [self.tableau.shape[1] - 1]  # Sin artificiales + RHS
         self.tableau = self.tableau[:, cols_to_keep]
         
-        # Actualizar nombres de variables
-        self.var_names = self.var_names[:artificial_start]
-        
         # Actualizar índices de variables básicas
         new_basic_vars = []
         for var_idx in self.basic_vars:
             if var_idx < artificial_start:
                 new_basic_vars.append(var_idx)
             else:
-                # Variable artificial era básica (no debería pasar si W=0)
-                print(f"  ⚠️ Variable artificial {self.var_names[var_idx]} aún básica")
+                # Variable artificial era básica (no debería pasar si W=0); sin
+                # ella la base queda incompleta, así que no se puede seguir
+                raise ValueError(f"La variable artificial {self.var_names[var_idx]} "
+                                 f"sigue en la base al terminar la Fase I")
+        
+        # Actualizar nombres de variables
+        self.var_names = self.var_names[:artificial_start]
         
         self.basic_vars = new_basic_vars
         
@@ -632,12 +590,50 @@ class TwoPhaseSimplexSolver:
                 self.tableau[-1, :] -= coef * self.tableau[i, :]
         
         # Limpiar valores pequeños
-        self.tableau = np.vectorize(self._clean_small_values)(self.tableau)
+        clear_small_values(self.tableau, 1e-10, self._work_buffer())
+        if self.history is not None:
+            self.history.keyframe(self.tableau)
+        
+        if self.verbose:
+            print(f"  ✅ Columnas artificiales eliminadas")
+            print(f"  ✅ Función objetivo original restaurada")
+            print(f"  ✅ Variables básicas: {[self.var_names[i] for i in self.basic_vars]}")
+            print(f"  ✅ Z inicial: {self._clean_small_values(self.tableau[-1, -1])}")
+    
+    def warm_start_phase2(self) -> bool:
+        """
+        Arranque en caliente: expresa el tableau en la base inicial dada, sin
+        las columnas artificiales y con la función objetivo original, listo
+        para la Fase II. Si la base no es válida (índices fuera de rango o
+        artificiales, base singular) o no es factible, no cambia nada.
+        
+        Returns:
+            True si se usó la base inicial, False en caso contrario
+        """
+        artificial_start = self.n_vars + self.n_slack + self.n_excess
+        cols_to_keep = list(range(artificial_start)) + [self.tableau.shape[1] - 1]  # Sin artificiales + RHS
+        rows = refactor_to_basis(self.tableau[:self.n_constraints, cols_to_keep],
+                                 self.initial_basis, artificial_start, self.EPS)
+        if rows is None:
+            return False
+        
+        self.basic_vars = [int(j) for j in self.initial_basis]
+        self.var_names = self.var_names[:artificial_start]
         
-        print(f"  ✅ Columnas artificiales eliminadas")
-        print(f"  ✅ Función objetivo original restaurada")
-        print(f"  ✅ Variables básicas: {[self.var_names[i] for i in self.basic_vars]}")
-        print(f"  ✅ Z inicial: {self._clean_small_values(self.tableau[-1, -1])}")
+        # Fila Z con el objetivo original, en forma canónica respecto a la base
+        z_row = np.zeros(rows.shape[1])
+        z_row[:self.n_vars] = [-v for v in self.obj_coeffs]
+        z_row -= z_row[self.basic_vars] @ rows
+        self.tableau = np.vstack([rows, z_row])
+        
+        clear_small_values(self.tableau, 1e-10, self._work_buffer())
+        if self.trace == 'full':
+            self.history = IterationHistory(self.tableau, view=np.ndarray.tolist)
+        
+        if self.verbose:
+            print(f"  ✅ Variables básicas: {[self.var_names[i] for i in self.basic_vars]}")
+            print(f"  ✅ Z inicial: {self._clean_small_values(self.tableau[-1, -1])}")
+        return True
     
     def select_pivot_column_phase2(self) -> Optional[int]:
         """
@@ -649,20 +645,8 @@ class TwoPhaseSimplexSolver:
         """
         z_row = self.tableau[-1, :-1]  # Fila Z sin RHS
         
-        # Buscar el coeficiente más negativo
-        min_coef = self.EPS
-        pivot_col = None
-        
-        for j in range(len(z_row)):
-            if z_row[j] < min_coef:
-                min_coef = z_row[j]
-                pivot_col = j
-        
-        # Si no hay coeficientes negativos, ya es óptimo
-        if min_coef >= -self.EPS:
-            return None
-        
-        return pivot_col
+        # El coeficiente más negativo; None si no hay negativos (ya es óptimo)
+        return most_negative(z_row, self.EPS)
     
     def save_iteration_phase2(self, iteration: int, pivot_row: Optional[int], 
                              pivot_col: Optional[int], status: str):
@@ -675,12 +659,17 @@ class TwoPhaseSimplexSolver:
             pivot_col: Columna pivote (None si es última iteración)
             status: Estado ('iterating', 'optimal', 'unbounded')
         """
+        if self.trace == 'none':
+            return
+        
+        # En 'full' el tableau se reconstruye desde el historial al pedirlo;
+        # en 'summary' no se guardan el tableau, la base ni la solución
+        full = self.trace == 'full'
         iter_data = {
             'iteration': iteration,
             'phase': 2,
-            'tableau': self.tableau.copy().tolist(),  # Convertir a lista para Jinja2
-            'basic_vars': self.basic_vars.copy(),
-            'basic_var_names': [self.var_names[i] for i in self.basic_vars],
+            'basic_vars': self.basic_vars.copy() if full else None,
+            'basic_var_names': [self.var_names[i] for i in self.basic_vars] if full else None,
             'z_value': self._clean_small_values(self.tableau[-1, -1]),
             'status': status
         }
@@ -695,17 +684,23 @@ class TwoPhaseSimplexSolver:
             )
         
         # Valores actuales de variables de DECISIÓN
-        iter_data['solution'] = {}
-        for i in range(self.n_vars):
-            var_name = self.var_names[i]
-            # Buscar si es básica
-            if i in self.basic_vars:
-                row_idx = self.basic_vars.index(i)
-                var_value = self._clean_small_values(self.tableau[row_idx, -1])
-            else:
-                var_value = 0.0
-            iter_data['solution'][var_name] = var_value
+        iter_data['solution'] = None
+        if full:
+            iter_data['solution'] = {}
+            for i in range(self.n_vars):
+                var_name = self.var_names[i]
+                # Buscar si es básica
+                if i in self.basic_vars:
+                    row_idx = self.basic_vars.index(i)
+                    var_value = self._clean_small_values(self.tableau[row_idx, -1])
+                else:
+                    var_value = 0.0
+                iter_data['solution'][var_name] = var_value
         
+        if full:
+            iter_data = self.history.record(iter_data)
+        else:
+            iter_data['tableau'] = None
         self.iterations_phase2.append(iter_data)
     
     def check_unbounded_phase2(self, pivot_col: int) -> bool:
@@ -719,10 +714,7 @@ class TwoPhaseSimplexSolver:
         Returns:
             True si no acotado, False en caso contrario
         """
-        for i in range(self.n_constraints):
-            if self.tableau[i, pivot_col] > self.EPS:
-                return False
-        return True
+        return not np.any(self.tableau[:self.n_constraints, pivot_col] > self.EPS)
     
     def phase_two(self) -> Dict[str, Any]:
         """
@@ -731,18 +723,14 @@ class TwoPhaseSimplexSolver:
         Returns:
             Diccionario con resultado de Fase II
         """
-        # Transición desde Fase I
-        self.transition_to_phase2()
-        
         iteration = 0
         
         # Guardar iteración inicial
         self.save_iteration_phase2(iteration, None, None, 'initial')
-        print(f"\n  Iteración {iteration}: Z = {self._clean_small_values(self.tableau[-1, -1])}")
-        
-        max_iterations = 100  # Límite de seguridad
+        if self.verbose:
+            print(f"\n  Iteración {iteration}: Z = {self._clean_small_values(self.tableau[-1, -1])}")
         
-        while iteration < max_iterations:
+        while True:
             iteration += 1
             
             # Paso 1: Seleccionar columna pivote
@@ -751,13 +739,20 @@ class TwoPhaseSimplexSolver:
             if pivot_col is None:
                 # Ya es óptimo
                 self.save_iteration_phase2(iteration, None, None, 'optimal')
-                print(f"  Iteración {iteration}: ÓPTIMO alcanzado")
+                if self.verbose:
+                    print(f"  Iteración {iteration}: ÓPTIMO alcanzado")
                 break
             
+            # Límite de iteraciones, tiempo o memoria
+            status = self.budget_status()
+            if status is not None:
+                return {'optimal': False, 'status': status}
+            
             # Paso 2: Verificar si no acotado
             if self.check_unbounded_phase2(pivot_col):
                 self.save_iteration_phase2(iteration, None, None, 'unbounded')
-                print(f"  ⚠️ Problema NO ACOTADO")
+                if self.verbose:
+                    print(f"  ⚠️ Problema NO ACOTADO")
                 return {
                     'optimal': False,
                     'status': 'unbounded',
@@ -773,26 +768,83 @@ class TwoPhaseSimplexSolver:
                 return {'optimal': False, 'status': 'unbounded'}
             
             # Paso 4: Realizar pivoteo
-            entering_var = self.var_names[pivot_col]
-            leaving_var = self.var_names[self.basic_vars[pivot_row]]
-            
-            print(f"  Iteración {iteration}: {entering_var} entra, {leaving_var} sale")
+            if self.verbose:
+                entering_var = self.var_names[pivot_col]
+                leaving_var = self.var_names[self.basic_vars[pivot_row]]
+                print(f"  Iteración {iteration}: {entering_var} entra, {leaving_var} sale")
             
             self.perform_pivot(pivot_row, pivot_col)
             
             # Guardar iteración
-            z_value = self._clean_small_values(self.tableau[-1, -1])
             self.save_iteration_phase2(iteration, pivot_row, pivot_col, 'iterating')
             
-            print(f"    → Z = {z_value}")
+            if self.verbose:
+                print(f"    → Z = {self._clean_small_values(self.tableau[-1, -1])}")
         
-        print(f"\n  ✅ ÓPTIMO: Z = {self._clean_small_values(self.tableau[-1, -1])}")
+        if self.verbose:
+            print(f"\n  ✅ ÓPTIMO: Z = {self._clean_small_values(self.tableau[-1, -1])}")
         return {
             'optimal': True,
             'status': 'optimal',
             'iterations': iteration
         }
     
+    def budget_status(self) -> Optional[str]:
+        """Límite del presupuesto agotado antes del siguiente pivoteo (None si se puede seguir)."""
+        history_bytes = self.history.nbytes if self.history is not None else 0
+        return self.budget.exhausted(self.iteration_count, history_bytes)
+    
+    def current_solution(self) -> Dict[str, float]:
+        """Valores de las variables de decisión en la base actual."""
+        solution = {}
+        for i in range(self.n_vars):
+            var_name = self.var_names[i]
+            if i in self.basic_vars:
+                row_idx = self.basic_vars.index(i)
+                var_value = self._clean_small_values(self.tableau[row_idx, -1])
+            else:
+                var_value = 0.0
+            solution[var_name] = var_value
+        return solution
+    
+    def current_objective(self) -> float:
+        """Valor de Z en la base actual (en el sentido original, MAX o MIN)."""
+        z_value = self._clean_small_values(self.tableau[-1, -1])
+        
+        # Si era MIN, convertir Z de vuelta
+        if self.opt_type == 'min':
+            z_value = -z_value
+        return z_value
+    
+    def build_budget_result(self, status: str, phase: int) -> Dict[str, Any]:
+        """
+        Resultado cuando se agota el presupuesto: la base actual y, si ya se
+        está en Fase II (base factible), su solución y valor de Z.
+        
+        Args:
+            status: límite agotado (ver solver_budget)
+            phase: fase en la que se agotó
+        """
+        feasible = phase == 2
+        result = {
+            'success': False,
+            'status': status,
+            'error': self.budget.message(status, self.iteration_count),
+            'opt_type': self.opt_type,
+            'basic_vars': list(self.basic_vars),
+            'basic_variables': [self.var_names[i] for i in self.basic_vars],
+            'feasible': feasible,
+            'iterations_phase1': self.iterations_phase1,
+            'iterations_phase2': self.iterations_phase2,
+            'total_iterations': len(self.iterations_phase1) + len(self.iterations_phase2)
+        }
+        if feasible:
+            result['solution'] = self.current_solution()
+            result['objective_value'] = self.current_objective()
+        if self.warm_start is not None:
+            result['warm_start'] = self.warm_start
+        return result
+    
     def build_result(self, phase2_result: Dict[str, Any]) -> Dict[str, Any]:
         """
         Construye el diccionario de resultado final.
@@ -803,6 +855,9 @@ class TwoPhaseSimplexSolver:
         Returns:
             Diccionario completo con resultados
         """
+        if phase2_result.get('status') in BUDGET_STATUSES:
+            return self.build_budget_result(phase2_result['status'], phase=2)
+        
         if not phase2_result.get('optimal', False):
             return {
                 'success': False,
@@ -815,22 +870,10 @@ class TwoPhaseSimplexSolver:
             }
         
         # Obtener solución óptima
-        solution = {}
-        for i in range(self.n_vars):
-            var_name = self.var_names[i]
-            if i in self.basic_vars:
-                row_idx = self.basic_vars.index(i)
-                var_value = self._clean_small_values(self.tableau[row_idx, -1])
-            else:
-                var_value = 0.0
-            solution[var_name] = var_value
+        solution = self.current_solution()
         
         # Valor óptimo de Z
-        z_value = self._clean_small_values(self.tableau[-1, -1])
-        
-        # Si era MIN, convertir Z de vuelta
-        if self.opt_type == 'min':
-            z_value = -z_value
+        z_value = self.current_objective()
         
         # Detectar degeneración (alguna variable básica = 0)
         is_degenerate = False
@@ -856,6 +899,7 @@ class TwoPhaseSimplexSolver:
             'optimal_value': z_value,
             'solution': solution,
             'basic_variables': [self.var_names[i] for i in self.basic_vars],
+            'basic_vars': list(self.basic_vars),
             'iterations_phase1': self.iterations_phase1,
             'iterations_phase2': self.iterations_phase2,
             'total_iterations': len(self.iterations_phase1) + len(self.iterations_phase2),
@@ -863,17 +907,73 @@ class TwoPhaseSimplexSolver:
             'has_multiple_solutions': has_multiple_solutions,
             'final_tableau': self.tableau.copy()
         }
+        if self.warm_start is not None:
+            result['warm_start'] = self.warm_start
         
         return result
 
 
-def solve_two_phase_simplex(objective: str, constraints: List[str]) -> Dict[str, Any]:
+def _parse_objective_coefficients(objective: str) -> Tuple[List[float], int]:
+    """Coeficientes de la función objetivo (sin cambiar el signo) y número de variables."""
+    # "max"/"min" y "z =" son opcionales; el sentido lo fija opt_type
+    _, terms = lp_parser.parse_objective(objective)
+    
+    if not terms:
+        raise ValueError("No se pudo parsear la función objetivo. Formato esperado: '3x1 + 5x2'")
+    
+    n_vars = lp_parser.max_variable_index(terms)
+    return lp_parser.dense_coefficients(terms, n_vars), n_vars
+
+
+def _parse_constraint_line(constraint: str) -> Optional[Tuple[Dict[str, float], str, float]]:
+    """
+    Parsea una restricción; devuelve None si es de no negatividad ("xi >= 0").
+    """
+    terms, constraint_type, rhs_value = lp_parser.parse_constraint(constraint)
+    if lp_parser.is_nonnegativity(terms, constraint_type, rhs_value):
+        return None
+    if not terms:
+        raise ValueError(f"No se pudo parsear restricción: {constraint}")
+    return terms, constraint_type, rhs_value
+
+
+def _constraint_arrays(lines: List, n_vars: int) -> Tuple[List[List[float]], List[float], List[str]]:
+    """Matriz, RHS y tipos de las restricciones parseadas (las None se ignoran)."""
+    matrix = []
+    rhs = []
+    types = []
+    for parsed in lines:
+        if parsed is None:
+            continue
+        terms, constraint_type, rhs_value = parsed
+        if lp_parser.max_variable_index(terms) > n_vars:
+            raise ValueError(f"Una restricción usa variables que no están en la función objetivo "
+                             f"({', '.join(terms)})")
+        matrix.append(lp_parser.dense_coefficients(terms, n_vars))
+        rhs.append(rhs_value)
+        types.append(constraint_type)
+    return matrix, rhs, types
+
+
+def _assemble_arrays(objective: Tuple[List[float], int], lines: List) -> Tuple:
+    coeffs, n_vars = objective
+    return (coeffs, *_constraint_arrays(lines, n_vars))
+
+
+def solve_two_phase_simplex(objective: str, constraints: List[str], model_cache=None,
+                            trace: str = 'full', budget: Optional[SolverBudget] = None,
+                            initial_basis: Optional[Sequence[int]] = None) -> Dict[str, Any]:
     """
     Función wrapper para resolver un problema con Dos Fases.
     
     Args:
         objective: Función objetivo como string (ej: "max z = 3x1 + 5x2")
         constraints: Lista de restricciones como strings
+        model_cache: ParsedModelCache opcional para no volver a parsear
+                     problemas repetidos
+        trace: 'full', 'summary' o 'none' (ver solver_trace)
+        budget: límites de iteraciones, tiempo y memoria (ver solver_budget)
+        initial_basis: base inicial ('basic_vars' de un resultado anterior)
         
     Returns:
         Diccionario con resultados completos
@@ -883,7 +983,18 @@ def solve_two_phase_simplex(objective: str, constraints: List[str]) -> Dict[str,
     if 'min' in objective.lower():
         opt_type = 'min'
     
-    solver = TwoPhaseSimplexSolver(objective, constraints, opt_type)
+    if model_cache is not None:
+        try:
+            arrays = model_cache.get_or_parse('two_phase', objective, constraints,
+                                              _parse_objective_coefficients,
+                                              _parse_constraint_line, _assemble_arrays)
+        except Exception:
+            arrays = None  # el solver vuelve a parsear y reporta el error
+        if arrays is not None:
+            return TwoPhaseSimplexSolver.from_arrays(*arrays, opt_type, trace, budget,
+                                                     initial_basis).solve()
+    
+    solver = TwoPhaseSimplexSolver(objective, constraints, opt_type, trace, budget, initial_basis)
     return solver.solve()
 
 